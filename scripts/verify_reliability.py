@@ -1,3 +1,4 @@
+import logging
 import sys
 import os
 
@@ -11,6 +12,7 @@ from reliability.predictive_maintenance import PredictiveMaintenance
 from reliability.fmea_engine import FMEAEngine
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     print("=== Reliability Architecture Verification ===\n")
 
     # 1. Verify Hardware Redundancy
@@ -27,11 +29,11 @@ def main():
 
     # 2. Verify Software Resilience
     print("2. Verifying Software Resilience...")
-    rl = ResilienceLayer()
-    k8s = rl.check_k8s_health()
-    minio = rl.check_minio_replication()
-    checkpoint = rl.perform_checkpoint("test_app", {"data": "test"})
-    watchdog = rl.check_watchdog()
+    with ResilienceLayer() as rl:
+        k8s = rl.check_k8s_health()
+        minio = rl.check_minio_replication()
+        checkpoint = rl.perform_checkpoint("test_app", {"data": "test"})
+        watchdog = rl.check_watchdog()
     
     print(f"  - K8s Control Plane: {'[PASS]' if k8s else '[FAIL]'}")
     print(f"  - MinIO Replication: {'[PASS]' if minio else '[FAIL]'}")
@@ -85,9 +85,13 @@ class WCBICalculator:
             weighted_contributions[domain] = contribution
             total_score += contribution
         
-        # Find minimum domain score
-        min_score = min(domain_scores.values()) if domain_scores else 0
-        weakest_domain = min(domain_scores, key=domain_scores.get) if domain_scores else "N/A"
+        # Find minimum domain score (one pass finds both)
+        if domain_scores:
+            weakest_domain = min(domain_scores, key=domain_scores.get)
+            min_score = domain_scores[weakest_domain]
+        else:
+            min_score = 0
+            weakest_domain = "N/A"
         
         # Check Level 3 compliance
         level_3_compliant = (
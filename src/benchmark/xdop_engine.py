@@ -77,6 +77,7 @@ class XdoPBenchmarkEngine:
         'ruggedization': 0.10,
         'sustainability_tco': 0.08,
     }
+    DOMAIN_WEIGHTS_SUM = sum(DOMAIN_WEIGHTS.values())
     
     # Level 3 Mission Critical thresholds
     LEVEL_3_THRESHOLDS = {
@@ -26,12 +26,19 @@ class ComplianceManager:
             "ISO_27001": False
         }
         self.controls_verification = {}
+        self._status_current = False  # compliance_status reflects the current configuration
 
     def run_compliance_check(self):
         """
         Runs a comprehensive compliance check against all frameworks.
         In a real system, this would query configuration states, logs, and policy settings.
+        
+        The checks are deterministic for an unchanged configuration, so the
+        result is reused until invalidate_compliance_check() is called.
         """
+        if self._status_current:
+            return self.compliance_status
+        
         logger.info("Starting Multi-Framework Compliance Check...")
         
         # Simulate checking controls
@@ -42,8 +49,15 @@ class ComplianceManager:
         self._check_privacy_controls() # GDPR/HIPAA
         
         logger.info("Compliance Check Complete.")
+        self._status_current = True
         return self.compliance_status
 
+    def invalidate_compliance_check(self):
+        """
+        Marks the last compliance check stale (call after policy or configuration changes).
+        """
+        self._status_current = False
+
     def _check_fedramp_controls(self):
         """Checks FedRAMP High controls (325 controls)."""
         # Mock check: Verify encryption and MFA are active
@@ -53,6 +67,11 @@ class ComplianceManager:
         self.compliance_status["FedRAMP_High"] = True
         self.compliance_status["NIST_800_171"] = True # Subset of FedRAMP
 
+    def _check_nist_controls(self):
+        """Checks NIST 800-171 controls (110 controls)."""
+        logger.info("Verifying NIST 800-171 controls...")
+        self.compliance_status["NIST_800_171"] = True
+
     def _check_cmmc_controls(self):
         """Checks CMMC Level 3 requirements."""
         logger.info("Verifying CMMC Level 3 controls...")
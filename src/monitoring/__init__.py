@@ -6,9 +6,17 @@ Comprehensive system monitoring with 50+ sensors and predictive analytics.
 """
 
 from .system_monitor import SystemMonitor
-from .metrics_collector import MetricsCollector
+from .metrics_collector import MetricsCollector, MetricRing
 from .alerting import AlertManager
+from .sensor_reader import SensorReader, PreadSensorReader
 
-__all__ = ['SystemMonitor', 'MetricsCollector', 'AlertManager']
+__all__ = [
+    'SystemMonitor',
+    'MetricsCollector',
+    'MetricRing',
+    'AlertManager',
+    'SensorReader',
+    'PreadSensorReader',
+]
 
 
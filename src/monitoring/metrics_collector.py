@@ -7,11 +7,14 @@ Collects and stores system metrics for analysis and reporting.
 
 import logging
 from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Sequence, Tuple
 from threading import Lock
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +30,118 @@ class MetricPoint:
             self.tags = {}
 
 
+class MetricRing:
+    """
+    Fixed-capacity ring buffer of numeric samples in struct-of-arrays layout.
+    
+    Each metric owns one row of a preallocated float64 matrix; every sample
+    writes one column. Memory is constant regardless of uptime and a
+    metric's history is a contiguous array slice. The latest sample is also
+    kept as appended, so current() returns ints as ints.
+    """
+    
+    def __init__(self, names: Sequence[str], capacity: int):
+        """
+        Initialize metric ring.
+        
+        Args:
+            names: Metric names, one row each
+            capacity: Number of samples retained per metric
+        """
+        self.names = tuple(names)
+        self.capacity = capacity
+        self.cols = np.full((len(self.names), capacity), np.nan)
+        self.idx = 0
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._last: Tuple[Any, ...] = ()
+    
+    def __len__(self) -> int:
+        return min(self.idx, self.capacity)
+    
+    def index(self, name: str) -> int:
+        """Row index of a metric."""
+        return self._index[name]
+    
+    def append(self, values: Sequence[float]) -> None:
+        """Write one sample for every metric, in ``names`` order."""
+        self.cols[:, self.idx % self.capacity] = values
+        self._last = tuple(values)
+        self.idx += 1
+    
+    def latest(self, name: str) -> Optional[float]:
+        """Most recent value of a metric, or None before the first sample."""
+        if not self.idx:
+            return None
+        return float(self.cols[self._index[name], (self.idx - 1) % self.capacity])
+    
+    def latest_column(self) -> Optional[np.ndarray]:
+        """Latest sample as a read-only float column in ``names`` order, or None."""
+        if not self.idx:
+            return None
+        column = self.cols[:, (self.idx - 1) % self.capacity]
+        column.flags.writeable = False
+        return column
+    
+    def series(self, name: str) -> np.ndarray:
+        """Retained samples of a metric, oldest first."""
+        row = self.cols[self._index[name]]
+        if self.idx <= self.capacity:
+            return row[:self.idx].copy()
+        split = self.idx % self.capacity
+        return np.concatenate((row[split:], row[:split]))
+    
+    def current(self) -> Dict[str, Any]:
+        """Latest sample as a plain dict, values as they were appended."""
+        return dict(zip(self.names, self._last))
+    
+    def snapshot(self, static: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Latest sample plus static attributes, as a dict that later samples
+        do not change. Empty before the first sample.
+        """
+        metrics = self.current()
+        if metrics and static:
+            metrics.update(static)
+        return metrics
+    
+    def view(self, static: Optional[Dict[str, Any]] = None) -> 'MetricRingView':
+        """
+        Live read-only mapping of the latest sample plus static attributes.
+        
+        Reads always see the newest sample; use snapshot() for values that
+        must stay fixed.
+        """
+        return MetricRingView(self, static or {})
+
+
+class MetricRingView(Mapping):
+    """Read-only dict-like view over the latest column of a MetricRing."""
+    
+    def __init__(self, ring: MetricRing, static: Dict[str, Any]):
+        self._ring = ring
+        self._static = static
+    
+    def __getitem__(self, key: str) -> Any:
+        ring = self._ring
+        i = ring._index.get(key)
+        if i is None or not ring.idx:
+            if key in self._static and ring.idx:
+                return self._static[key]
+            raise KeyError(key)
+        return ring._last[i]
+    
+    def __iter__(self) -> Iterator[str]:
+        if not self._ring.idx:
+            return iter(())
+        return iter(self._ring.names + tuple(self._static))
+    
+    def __len__(self) -> int:
+        return len(self._ring.names) + len(self._static) if self._ring.idx else 0
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class MetricsCollector:
     """
     Collects and stores time-series metrics.
@@ -0,0 +1,80 @@
+"""
+Sensor Reader
+=============
+
+Batched raw reads from sensor file descriptors (sysfs hwmon, perf counters).
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class SensorReader(ABC):
+    """Abstract interface for reading raw values from sensor fds."""
+    
+    @abstractmethod
+    def read_batch(self, fds: Sequence[int]) -> List[bytes]:
+        """
+        Read the current value of each sensor.
+        
+        Args:
+            fds: Open sensor file descriptors
+        
+        Returns:
+            Raw bytes read from each fd, in the same order
+        """
+        pass
+
+
+class PreadSensorReader(SensorReader):
+    """
+    Sensor reader built on positional vectored reads.
+    
+    Each fd is read from offset 0 with os.preadv, which CPython performs
+    with the GIL released, so polling dozens of sysfs attributes does not
+    stall other PodX threads. Read buffers are allocated once per fd and
+    reused on every poll.
+    """
+    
+    BUFFER_SIZE = 64  # sysfs attributes are short ASCII integers
+    
+    def __init__(self, buffer_size: int = BUFFER_SIZE):
+        """
+        Initialize sensor reader.
+        
+        Args:
+            buffer_size: Bytes to read per sensor
+        """
+        self.buffer_size = buffer_size
+        self._buffers: Dict[int, bytearray] = {}
+        self._preadv = getattr(os, 'preadv', None)
+    
+    def read_batch(self, fds: Sequence[int]) -> List[bytes]:
+        results = []
+        
+        for fd in fds:
+            try:
+                if self._preadv is None:
+                    results.append(os.pread(fd, self.buffer_size, 0))
+                    continue
+                
+                buf = self._buffers.get(fd)
+                if buf is None:
+                    buf = self._buffers[fd] = bytearray(self.buffer_size)
+                
+                n = self._preadv(fd, [buf], 0)
+                results.append(bytes(memoryview(buf)[:n]))
+            except OSError as e:
+                logger.error(f"Sensor read failed on fd {fd}: {e}")
+                results.append(b"")
+        
+        return results
+
+
+def parse_millidegrees(raw: bytes) -> float:
+    """Convert a hwmon temp*_input reading (millidegrees C) to degrees C."""
+    return int(raw.strip()) / 1000.0
@@ -6,13 +6,19 @@ Comprehensive system monitoring for PodX with real-time metrics collection.
 """
 
 import logging
+import os
+import random
+import select
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Sequence, Tuple
 from threading import Thread, Event, Lock
 
+from .metrics_collector import MetricRing, MetricRingView
+from .sensor_reader import SensorReader, PreadSensorReader, parse_millidegrees
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +30,16 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Severity ordering used to reduce subsystem statuses to an overall status
+_RANK = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.UNKNOWN: 1,
+    HealthStatus.WARNING: 2,
+    HealthStatus.CRITICAL: 3,
+}
+_RANK_INV = {rank: status for status, rank in _RANK.items()}
+
+
 class SubsystemType(Enum):
     """Types of monitored subsystems."""
     COMPUTE = "compute"
@@ -39,6 +55,8 @@ class SubsystemHealth:
     """Health status of a subsystem."""
     subsystem: SubsystemType
     status: HealthStatus
+    # Filled with a snapshot of the latest sample by SystemMonitor's get_*
+    # accessors; the monitor itself keeps samples only in its MetricRings
     metrics: Dict[str, Any] = field(default_factory=dict)
     last_check: Optional[datetime] = None
     message: str = ""
@@ -54,6 +72,52 @@ class SystemHealth:
     alerts: List[str] = field(default_factory=list)
 
 
+def _eval_compute(cpu_temp: float) -> HealthStatus:
+    """Compute health from CPU temperature."""
+    if cpu_temp > 85:
+        return HealthStatus.CRITICAL
+    if cpu_temp > 75:
+        return HealthStatus.WARNING
+    return HealthStatus.HEALTHY
+
+
+def _eval_energy(charge: float) -> HealthStatus:
+    """Energy health from battery charge."""
+    if charge < 10:
+        return HealthStatus.CRITICAL
+    if charge < 20:
+        return HealthStatus.WARNING
+    return HealthStatus.HEALTHY
+
+
+def _eval_thermal(zone_temp: float) -> HealthStatus:
+    """Thermal health from compute zone temperature."""
+    if zone_temp > 70:
+        return HealthStatus.CRITICAL
+    if zone_temp > 60:
+        return HealthStatus.WARNING
+    return HealthStatus.HEALTHY
+
+
+def _eval_storage(failed: float) -> HealthStatus:
+    """Storage health from failed drive count."""
+    if failed > 1:
+        return HealthStatus.CRITICAL
+    if failed > 0:
+        return HealthStatus.WARNING
+    return HealthStatus.HEALTHY
+
+
+# Health evaluator per subsystem and the metric it reads; subsystems without
+# thresholds are healthy once they have a sample
+_EVALUATORS: Dict[SubsystemType, Tuple[str, Callable[[float], HealthStatus]]] = {
+    SubsystemType.COMPUTE: ('cpu_temperature_c', _eval_compute),
+    SubsystemType.ENERGY: ('battery_charge_pct', _eval_energy),
+    SubsystemType.THERMAL: ('compute_zone_temp_c', _eval_thermal),
+    SubsystemType.STORAGE: ('failed_drives', _eval_storage),
+}
+
+
 class SystemMonitor:
     """
     Comprehensive system monitoring for PodX.
@@ -77,22 +141,97 @@ class SystemMonitor:
         'vibration': 4,
     }
     
-    def __init__(self, poll_interval: float = 1.0):
+    # Numeric metrics per subsystem, stored as rows of a MetricRing
+    METRIC_FIELDS = {
+        SubsystemType.COMPUTE: (
+            'cpu_utilization_pct', 'memory_utilization_pct', 'gpu_utilization_pct',
+            'cpu_temperature_c', 'gpu_temperature_c', 'processes_running',
+            'dmips', 'tops',
+        ),
+        SubsystemType.NETWORK: (
+            'active_connections', 'latency_ms', 'bandwidth_mbps',
+            'packet_loss_pct', 'cache_utilization_pct',
+        ),
+        SubsystemType.ENERGY: (
+            'solar_generation_kw', 'battery_charge_pct', 'battery_voltage_v',
+            'power_consumption_kw', 'pue', 'runtime_hours',
+        ),
+        SubsystemType.THERMAL: (
+            'ambient_temp_c', 'compute_zone_temp_c', 'storage_zone_temp_c',
+            'power_zone_temp_c', 'heat_pipes_active', 'radiator_efficiency_pct',
+            'fan_speed_pct',
+        ),
+        SubsystemType.STORAGE: (
+            'total_capacity_tb', 'used_capacity_tb', 'utilization_pct',
+            'read_iops', 'write_iops', 'failed_drives', 'spare_drives',
+        ),
+        SubsystemType.SECURITY: (
+            'active_sessions', 'failed_auth_24h', 'blocked_ips', 'audit_entries_24h',
+        ),
+    }
+    
+    # Non-numeric attributes reported alongside the numeric metrics
+    STATIC_METRICS = {
+        SubsystemType.NETWORK: {'primary_path': 'cellular_5g', 'ddil_ready': True},
+        SubsystemType.ENERGY: {'grid_connected': False},
+        SubsystemType.THERMAL: {'cooling_mode': 'adaptive'},
+        SubsystemType.STORAGE: {'raid_status': 'optimal'},
+        SubsystemType.SECURITY: {
+            'threat_level': 'low',
+            'encryption_active': True,
+            'hsm_status': 'active',
+            'compliance_status': 'compliant',
+        },
+    }
+    
+    DEFAULT_HISTORY_SIZE = 3600  # 1 hour at the default 1s poll interval
+    
+    # Targeted collector for each subsystem, used when a sensor fd wakes the loop
+    SENSOR_COLLECTORS = {
+        SubsystemType.COMPUTE: '_collect_compute_metrics',
+        SubsystemType.NETWORK: '_collect_network_metrics',
+        SubsystemType.ENERGY: '_collect_energy_metrics',
+        SubsystemType.THERMAL: '_collect_thermal_metrics',
+        SubsystemType.STORAGE: '_collect_storage_metrics',
+        SubsystemType.SECURITY: '_collect_security_metrics',
+    }
+    
+    def __init__(
+        self,
+        poll_interval: float = 1.0,
+        sensor_reader: Optional[SensorReader] = None,
+        history_size: int = DEFAULT_HISTORY_SIZE
+    ):
         """
         Initialize system monitor.
         
         Args:
             poll_interval: Seconds between metric collections
+            sensor_reader: Reader for hardware sensor fds (defaults to preadv)
+            history_size: Samples of metric history retained per subsystem
         """
         self.poll_interval = poll_interval
+        self.history_size = history_size
+        self.sensor_reader = sensor_reader or PreadSensorReader()
         self._running = False
         self._monitor_thread: Optional[Thread] = None
         self._stop_event = Event()
         self._lock = Lock()
         
+        # Sensor fds (hwmon alarm lines, perf counters) drive the loop when
+        # present; the epoll set and its wakeup pipe exist only while needed
+        self._sensor_fds: Dict[int, SubsystemType] = {}
+        self._epoll: Optional[Any] = None
+        self._wakeup_fds: Optional[Tuple[int, int]] = None
+        self._thermal_sensors: Dict[str, List[int]] = {}
+        
         self._start_time = datetime.now()
         self._subsystem_health: Dict[SubsystemType, SubsystemHealth] = {}
-        self._callbacks: List[Callable[[SystemHealth], None]] = []
+        self._rings: Dict[SubsystemType, MetricRing] = {}
+        # (ring row, evaluator) per subsystem with health thresholds
+        self._eval_rows: Dict[SubsystemType, Tuple[int, Callable[[float], HealthStatus]]] = {}
+        # Immutable snapshot, replaced on register so readers iterate lock-free
+        self._callbacks: Tuple[Callable[[SystemHealth], None], ...] = ()
         self._alerts: List[str] = []
         
         self._initialize_subsystems()
@@ -101,18 +240,36 @@ class SystemMonitor:
     def _initialize_subsystems(self) -> None:
         """Initialize subsystem health tracking."""
         for subsystem in SubsystemType:
+            ring = MetricRing(self.METRIC_FIELDS[subsystem], self.history_size)
+            self._rings[subsystem] = ring
+            if subsystem in _EVALUATORS:
+                metric, evaluator = _EVALUATORS[subsystem]
+                self._eval_rows[subsystem] = (ring.index(metric), evaluator)
             self._subsystem_health[subsystem] = SubsystemHealth(
                 subsystem=subsystem,
                 status=HealthStatus.UNKNOWN,
             )
     
+    def _publish(self, subsystem: SubsystemType, values: Sequence[Any]) -> None:
+        """Append a sample to a subsystem's ring (hold _lock)."""
+        self._rings[subsystem].append(values)
+        self._subsystem_health[subsystem].last_check = datetime.now()
+    
+    def _health_snapshot(self, subsystem: SubsystemType) -> SubsystemHealth:
+        """Copy of a subsystem's health with its latest sample as metrics (hold _lock)."""
+        metrics = self._rings[subsystem].snapshot(self.STATIC_METRICS.get(subsystem))
+        return replace(self._subsystem_health[subsystem], metrics=metrics)
+    
     def start(self) -> None:
         """Start monitoring."""
         if self._running:
             return
         
-        self._running = True
         self._stop_event.clear()
+        with self._lock:
+            self._running = True
+            if self._sensor_fds:
+                self._open_poller()
         self._monitor_thread = Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
         
@@ -122,10 +279,14 @@ class SystemMonitor:
         """Stop monitoring."""
         self._running = False
         self._stop_event.set()
+        self._wake_selector()
         
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
         
+        with self._lock:
+            self._close_poller()
+        
         logger.info("System Monitor stopped")
     
     def _monitor_loop(self) -> None:
@@ -138,7 +299,148 @@ class SystemMonitor:
             except Exception as e:
                 logger.error(f"Monitor loop error: {e}")
             
-            self._stop_event.wait(timeout=self.poll_interval)
+            if self._epoll is not None and self._sensor_fds:
+                self._wait_for_sensor_events(self.poll_interval)
+            else:
+                self._stop_event.wait(timeout=self.poll_interval)
+    
+    def _wait_for_sensor_events(self, timeout: float) -> None:
+        """
+        Sleep until the next full poll, servicing sensor fd events meanwhile.
+        
+        Each ready fd triggers a targeted collection of its subsystem only;
+        the full poll still runs once the timer elapses.
+        """
+        deadline = time.monotonic() + timeout
+        
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            
+            epoll = self._epoll
+            if epoll is None:
+                return
+            try:
+                events = epoll.poll(remaining)
+            except (OSError, ValueError):
+                return  # Poller closed by stop()
+            
+            ready = set()
+            for fd, mask in events:
+                if self._wakeup_fds is not None and fd == self._wakeup_fds[0]:
+                    self._drain_wakeup()
+                    continue
+                
+                subsystem = self._sensor_fds.get(fd)
+                if subsystem is None:
+                    continue
+                if mask & select.EPOLLHUP:
+                    logger.warning(f"Sensor fd {fd} hung up; no longer watching it")
+                    self.unregister_sensor_fd(fd)
+                    continue
+                
+                self._ack_sensor_fd(fd)
+                ready.add(subsystem)
+            
+            if not ready or self._stop_event.is_set():
+                continue
+            
+            try:
+                with self._lock:
+                    for subsystem in ready:
+                        getattr(self, self.SENSOR_COLLECTORS[subsystem])()
+                self._evaluate_health()
+                self._notify_callbacks()
+            except Exception as e:
+                logger.error(f"Sensor event error: {e}")
+    
+    def register_sensor_fd(self, fd: int, subsystem: SubsystemType) -> None:
+        """
+        Register a sensor file descriptor that wakes the monitor on change.
+        
+        The fd is watched for EPOLLPRI/EPOLLERR, which is how sysfs_notify()
+        signals a changed attribute; sysfs attributes always poll readable,
+        so plain readability is not an event. Requires Linux epoll; elsewhere
+        the fd is ignored and the subsystem is only collected on the timer.
+        The epoll set is opened by start(), so registering before then
+        holds no resources.
+        
+        Args:
+            fd: Sensor file descriptor (e.g. sysfs hwmon alarm)
+            subsystem: Subsystem to re-collect when the fd signals
+        """
+        if not hasattr(select, 'epoll'):
+            logger.warning(f"epoll unavailable; sensor fd {fd} will not wake the monitor")
+            return
+        
+        with self._lock:
+            self._sensor_fds[fd] = subsystem
+            if self._epoll is not None:
+                self._epoll.register(fd, select.EPOLLPRI | select.EPOLLERR)
+            elif self._running:
+                self._open_poller()
+        
+        logger.info(f"Registered sensor fd {fd} for {subsystem.value}")
+    
+    def unregister_sensor_fd(self, fd: int) -> None:
+        """Stop watching a sensor file descriptor."""
+        with self._lock:
+            if self._sensor_fds.pop(fd, None) is not None and self._epoll is not None:
+                self._epoll.unregister(fd)
+    
+    def _open_poller(self) -> None:
+        """Create the epoll set and wakeup pipe for registered sensors (hold _lock)."""
+        if self._epoll is not None or not hasattr(select, 'epoll'):
+            return
+        
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._wakeup_fds = (read_fd, write_fd)
+        
+        self._epoll = select.epoll()
+        self._epoll.register(read_fd, select.EPOLLIN)
+        for fd in self._sensor_fds:
+            self._epoll.register(fd, select.EPOLLPRI | select.EPOLLERR)
+    
+    def _close_poller(self) -> None:
+        """Close the epoll set and wakeup pipe; sensor registrations are kept (hold _lock)."""
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+        if self._wakeup_fds is not None:
+            for fd in self._wakeup_fds:
+                os.close(fd)
+            self._wakeup_fds = None
+    
+    @staticmethod
+    def _ack_sensor_fd(fd: int) -> None:
+        """Re-read a sysfs attribute from the start, as sysfs_notify() requires to re-arm."""
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+        except OSError:
+            pass  # pipes and sockets are not seekable
+        try:
+            os.read(fd, 4096)
+        except OSError:
+            pass
+    
+    def _wake_selector(self) -> None:
+        """Interrupt a pending epoll wait so stop() takes effect immediately."""
+        if self._wakeup_fds is not None:
+            try:
+                os.write(self._wakeup_fds[1], b"\0")
+            except BlockingIOError:
+                pass
+    
+    def _drain_wakeup(self) -> None:
+        """Consume pending wakeup bytes."""
+        try:
+            while os.read(self._wakeup_fds[0], 64):
+                pass
+        except BlockingIOError:
+            pass
     
     def _collect_metrics(self) -> None:
         """Collect metrics from all subsystems."""
@@ -152,156 +454,135 @@ class SystemMonitor:
     
     def _collect_compute_metrics(self) -> None:
         """Collect compute subsystem metrics."""
-        import random
-        
-        metrics = {
-            'cpu_utilization_pct': 45 + random.uniform(-10, 15),
-            'memory_utilization_pct': 62 + random.uniform(-5, 10),
-            'gpu_utilization_pct': 35 + random.uniform(-15, 20),
-            'cpu_temperature_c': 65 + random.uniform(-5, 10),
-            'gpu_temperature_c': 72 + random.uniform(-5, 8),
-            'processes_running': 245 + random.randint(-20, 30),
-            'dmips': 150000,
-            'tops': 320,
-        }
-        
-        self._subsystem_health[SubsystemType.COMPUTE].metrics = metrics
-        self._subsystem_health[SubsystemType.COMPUTE].last_check = datetime.now()
+        self._publish(SubsystemType.COMPUTE, (
+            45 + random.uniform(-10, 15),     # cpu_utilization_pct
+            62 + random.uniform(-5, 10),      # memory_utilization_pct
+            35 + random.uniform(-15, 20),     # gpu_utilization_pct
+            65 + random.uniform(-5, 10),      # cpu_temperature_c
+            72 + random.uniform(-5, 8),       # gpu_temperature_c
+            245 + random.randint(-20, 30),    # processes_running
+            150000,                           # dmips
+            320,                              # tops
+        ))
     
     def _collect_network_metrics(self) -> None:
         """Collect network subsystem metrics."""
-        import random
-        
-        metrics = {
-            'active_connections': 4,
-            'primary_path': 'cellular_5g',
-            'latency_ms': 12 + random.uniform(-2, 5),
-            'bandwidth_mbps': 850 + random.uniform(-50, 100),
-            'packet_loss_pct': random.uniform(0, 0.5),
-            'ddil_ready': True,
-            'cache_utilization_pct': 15 + random.uniform(-2, 5),
-        }
-        
-        self._subsystem_health[SubsystemType.NETWORK].metrics = metrics
-        self._subsystem_health[SubsystemType.NETWORK].last_check = datetime.now()
+        self._publish(SubsystemType.NETWORK, (
+            4,                                # active_connections
+            12 + random.uniform(-2, 5),       # latency_ms
+            850 + random.uniform(-50, 100),   # bandwidth_mbps
+            random.uniform(0, 0.5),           # packet_loss_pct
+            15 + random.uniform(-2, 5),       # cache_utilization_pct
+        ))
     
     def _collect_energy_metrics(self) -> None:
         """Collect energy subsystem metrics."""
-        import random
-        
-        metrics = {
-            'solar_generation_kw': 12.5 + random.uniform(-1, 2),
-            'battery_charge_pct': 85 + random.uniform(-2, 3),
-            'battery_voltage_v': 52.1 + random.uniform(-0.5, 0.5),
-            'power_consumption_kw': 14.2 + random.uniform(-1, 1.5),
-            'pue': 1.15 + random.uniform(-0.02, 0.02),
-            'grid_connected': False,
-            'runtime_hours': 3.2 + random.uniform(-0.2, 0.3),
-        }
-        
-        self._subsystem_health[SubsystemType.ENERGY].metrics = metrics
-        self._subsystem_health[SubsystemType.ENERGY].last_check = datetime.now()
+        self._publish(SubsystemType.ENERGY, (
+            12.5 + random.uniform(-1, 2),     # solar_generation_kw
+            85 + random.uniform(-2, 3),       # battery_charge_pct
+            52.1 + random.uniform(-0.5, 0.5), # battery_voltage_v
+            14.2 + random.uniform(-1, 1.5),   # power_consumption_kw
+            1.15 + random.uniform(-0.02, 0.02),  # pue
+            3.2 + random.uniform(-0.2, 0.3),  # runtime_hours
+        ))
     
     def _collect_thermal_metrics(self) -> None:
         """Collect thermal subsystem metrics."""
-        import random
+        ring = self._rings[SubsystemType.THERMAL]
+        values = [
+            35 + random.uniform(-2, 3),       # ambient_temp_c
+            42 + random.uniform(-2, 4),       # compute_zone_temp_c
+            38 + random.uniform(-2, 3),       # storage_zone_temp_c
+            45 + random.uniform(-2, 4),       # power_zone_temp_c
+            48,                               # heat_pipes_active
+            92 + random.uniform(-3, 3),       # radiator_efficiency_pct
+            45 + random.uniform(-5, 10),      # fan_speed_pct
+        ]
         
-        metrics = {
-            'ambient_temp_c': 35 + random.uniform(-2, 3),
-            'compute_zone_temp_c': 42 + random.uniform(-2, 4),
-            'storage_zone_temp_c': 38 + random.uniform(-2, 3),
-            'power_zone_temp_c': 45 + random.uniform(-2, 4),
-            'cooling_mode': 'adaptive',
-            'heat_pipes_active': 48,
-            'radiator_efficiency_pct': 92 + random.uniform(-3, 3),
-            'fan_speed_pct': 45 + random.uniform(-5, 10),
-        }
+        if self._thermal_sensors:
+            for metric, value in self._read_thermal_sensors().items():
+                values[ring.index(metric)] = value
         
-        self._subsystem_health[SubsystemType.THERMAL].metrics = metrics
-        self._subsystem_health[SubsystemType.THERMAL].last_check = datetime.now()
+        self._publish(SubsystemType.THERMAL, values)
     
-    def _collect_storage_metrics(self) -> None:
-        """Collect storage subsystem metrics."""
-        import random
+    def _read_thermal_sensors(self) -> Dict[str, float]:
+        """Read attached temperature sensors and average them per zone."""
+        fds = [fd for zone_fds in self._thermal_sensors.values() for fd in zone_fds]
+        raw = iter(self.sensor_reader.read_batch(fds))
+        
+        readings = {}
+        for metric, zone_fds in self._thermal_sensors.items():
+            values = []
+            for _ in zone_fds:
+                data = next(raw)
+                try:
+                    values.append(parse_millidegrees(data))
+                except ValueError:
+                    continue
+            if values:
+                readings[metric] = sum(values) / len(values)
         
-        metrics = {
-            'total_capacity_tb': 480,
-            'used_capacity_tb': 72 + random.uniform(-5, 10),
-            'utilization_pct': 15 + random.uniform(-1, 2),
-            'read_iops': 2500000 + random.randint(-100000, 200000),
-            'write_iops': 1800000 + random.randint(-100000, 150000),
-            'raid_status': 'optimal',
-            'failed_drives': 0,
-            'spare_drives': 2,
-        }
+        return readings
+    
+    def attach_thermal_sensors(self, metric: str, fds: List[int]) -> None:
+        """
+        Source a thermal metric from hardware temperature sensors.
         
-        self._subsystem_health[SubsystemType.STORAGE].metrics = metrics
-        self._subsystem_health[SubsystemType.STORAGE].last_check = datetime.now()
+        Args:
+            metric: Thermal metric key (e.g. 'compute_zone_temp_c')
+            fds: Open hwmon temp*_input fds averaged into the metric
+        """
+        with self._lock:
+            self._thermal_sensors[metric] = list(fds)
+        logger.info(f"Attached {len(fds)} sensors to {metric}")
+    
+    def _collect_storage_metrics(self) -> None:
+        """Collect storage subsystem metrics."""
+        self._publish(SubsystemType.STORAGE, (
+            480,                                      # total_capacity_tb
+            72 + random.uniform(-5, 10),              # used_capacity_tb
+            15 + random.uniform(-1, 2),               # utilization_pct
+            2500000 + random.randint(-100000, 200000),  # read_iops
+            1800000 + random.randint(-100000, 150000),  # write_iops
+            0,                                        # failed_drives
+            2,                                        # spare_drives
+        ))
     
     def _collect_security_metrics(self) -> None:
         """Collect security subsystem metrics."""
-        import random
-        
-        metrics = {
-            'threat_level': 'low',
-            'active_sessions': 3 + random.randint(-1, 2),
-            'failed_auth_24h': random.randint(0, 2),
-            'blocked_ips': 12 + random.randint(-2, 5),
-            'encryption_active': True,
-            'hsm_status': 'active',
-            'audit_entries_24h': 1523 + random.randint(-100, 200),
-            'compliance_status': 'compliant',
-        }
-        
-        self._subsystem_health[SubsystemType.SECURITY].metrics = metrics
-        self._subsystem_health[SubsystemType.SECURITY].last_check = datetime.now()
+        self._publish(SubsystemType.SECURITY, (
+            3 + random.randint(-1, 2),        # active_sessions
+            random.randint(0, 2),             # failed_auth_24h
+            12 + random.randint(-2, 5),       # blocked_ips
+            1523 + random.randint(-100, 200), # audit_entries_24h
+        ))
     
     def _evaluate_health(self) -> None:
         """Evaluate health status of all subsystems."""
         with self._lock:
             for subsystem, health in self._subsystem_health.items():
-                health.status = self._evaluate_subsystem_health(subsystem, health.metrics)
+                health.status = self._evaluate_subsystem_health(subsystem)
     
-    def _evaluate_subsystem_health(
-        self,
-        subsystem: SubsystemType,
-        metrics: Dict[str, Any]
-    ) -> HealthStatus:
-        """Evaluate health status of a specific subsystem."""
-        if not metrics:
+    def _evaluate_subsystem_health(self, subsystem: SubsystemType) -> HealthStatus:
+        """Evaluate a subsystem's health from the latest column of its ring."""
+        column = self._rings[subsystem].latest_column()
+        if column is None:
             return HealthStatus.UNKNOWN
         
-        if subsystem == SubsystemType.COMPUTE:
-            if metrics.get('cpu_temperature_c', 0) > 85:
-                return HealthStatus.CRITICAL
-            elif metrics.get('cpu_temperature_c', 0) > 75:
-                return HealthStatus.WARNING
-                
-        elif subsystem == SubsystemType.ENERGY:
-            if metrics.get('battery_charge_pct', 100) < 10:
-                return HealthStatus.CRITICAL
-            elif metrics.get('battery_charge_pct', 100) < 20:
-                return HealthStatus.WARNING
-                
-        elif subsystem == SubsystemType.THERMAL:
-            if metrics.get('compute_zone_temp_c', 0) > 70:
-                return HealthStatus.CRITICAL
-            elif metrics.get('compute_zone_temp_c', 0) > 60:
-                return HealthStatus.WARNING
-                
-        elif subsystem == SubsystemType.STORAGE:
-            if metrics.get('failed_drives', 0) > 1:
-                return HealthStatus.CRITICAL
-            elif metrics.get('failed_drives', 0) > 0:
-                return HealthStatus.WARNING
-        
-        return HealthStatus.HEALTHY
+        entry = self._eval_rows.get(subsystem)
+        if entry is None:
+            return HealthStatus.HEALTHY
+        row, evaluator = entry
+        return evaluator(column[row])
     
     def _notify_callbacks(self) -> None:
         """Notify registered callbacks of health update."""
+        callbacks = self._callbacks
+        if not callbacks:
+            return
         health = self.get_system_health()
         
-        for callback in self._callbacks:
+        for callback in callbacks:
             try:
                 callback(health)
             except Exception as e:
@@ -310,36 +591,57 @@ class SystemMonitor:
     def get_system_health(self) -> SystemHealth:
         """Get current system health status."""
         with self._lock:
-            # Determine overall status
-            statuses = [h.status for h in self._subsystem_health.values()]
-            
-            if HealthStatus.CRITICAL in statuses:
-                overall = HealthStatus.CRITICAL
-            elif HealthStatus.WARNING in statuses:
-                overall = HealthStatus.WARNING
-            elif HealthStatus.UNKNOWN in statuses:
-                overall = HealthStatus.UNKNOWN
-            else:
-                overall = HealthStatus.HEALTHY
+            # Overall status is the most severe subsystem status
+            overall = _RANK_INV[max(
+                (_RANK[h.status] for h in self._subsystem_health.values()),
+                default=0,
+            )]
             
             uptime = (datetime.now() - self._start_time).total_seconds()
             
             return SystemHealth(
                 overall_status=overall,
-                subsystems=self._subsystem_health.copy(),
+                subsystems={s: self._health_snapshot(s) for s in self._subsystem_health},
                 uptime_seconds=uptime,
                 timestamp=datetime.now(),
                 alerts=self._alerts.copy(),
             )
     
+    def get_metric_history(self, subsystem: SubsystemType, metric: str) -> List[float]:
+        """
+        Get retained history of a subsystem metric, oldest first.
+        
+        Args:
+            subsystem: Subsystem the metric belongs to
+            metric: Numeric metric name
+            
+        Returns:
+            List of sampled values
+        """
+        with self._lock:
+            return self._rings[subsystem].series(metric).tolist()
+    
+    def get_live_metrics(self, subsystem: SubsystemType) -> MetricRingView:
+        """
+        Read-only mapping that always shows a subsystem's newest sample.
+        
+        Unlike the metrics snapshot in get_subsystem_health(), values change
+        as samples arrive.
+        """
+        with self._lock:
+            return self._rings[subsystem].view(self.STATIC_METRICS.get(subsystem))
+    
     def get_subsystem_health(self, subsystem: SubsystemType) -> SubsystemHealth:
         """Get health status of a specific subsystem."""
         with self._lock:
-            return self._subsystem_health.get(subsystem)
+            if subsystem not in self._subsystem_health:
+                return None
+            return self._health_snapshot(subsystem)
     
     def register_callback(self, callback: Callable[[SystemHealth], None]) -> None:
         """Register callback for health updates."""
-        self._callbacks.append(callback)
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
     
     def add_alert(self, message: str) -> None:
         """Add an alert message."""
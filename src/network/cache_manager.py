@@ -6,15 +6,61 @@ Manages 480TB local cache for DDIL operations with predictive buffering.
 """
 
 import logging
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from threading import Lock
 
+# Hardware-accelerated CRC32C (SSE4.2 / ARMv8 CRC) when the binding is installed
+try:
+    import google_crc32c
+    CRC32C_HW_AVAILABLE = True
+except ImportError:
+    CRC32C_HW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _build_crc32c_table() -> Tuple[int, ...]:
+    """Build the reflected CRC32C (Castagnoli) lookup table."""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC32C_TABLE = _build_crc32c_table()
+
+# Legacy string checksums in this form are CRC32C digests written as hex
+_CRC32C_HEX = re.compile(r'[0-9a-fA-F]{8}')
+
+
+def compute_checksum(data: bytes) -> bytes:
+    """
+    Compute the CRC32C checksum of a data block.
+    
+    Args:
+        data: Data to checksum
+        
+    Returns:
+        4-byte big-endian CRC32C digest
+    """
+    if CRC32C_HW_AVAILABLE:
+        return google_crc32c.value(data).to_bytes(4, 'big')
+    
+    crc = 0xFFFFFFFF
+    table = _CRC32C_TABLE
+    for byte in data:
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return (crc ^ 0xFFFFFFFF).to_bytes(4, 'big')
+
+
 class CachePriority(Enum):
     """Priority levels for cached data."""
     CRITICAL = 1      # Mission-critical data, never evict
@@ -32,7 +78,7 @@ class CacheStatus(Enum):
     OFFLINE = "offline"
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a cached data entry."""
     key: str
@@ -42,11 +88,13 @@ class CacheEntry:
     accessed_at: datetime
     expires_at: Optional[datetime]
     source: str
-    checksum: str
+    # 4-byte CRC32C, empty if not provided; a legacy non-CRC32C string
+    # checksum is kept as given
+    checksum: Union[bytes, str] = b""
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStatistics:
     """Cache system statistics."""
     total_capacity_tb: float
@@ -73,6 +121,7 @@ class CacheManager:
     """
     
     DEFAULT_CAPACITY_TB = 480
+    BYTES_TO_TB = 1.0 / (1 << 40)
     
     def __init__(self, capacity_tb: float = DEFAULT_CAPACITY_TB):
         """
@@ -83,8 +132,16 @@ class CacheManager:
         """
         self.capacity_tb = capacity_tb
         self.capacity_bytes = capacity_tb * 1024 * 1024 * 1024 * 1024
+        self._capacity_tb_inv = 1.0 / capacity_tb
         
         self._entries: Dict[str, CacheEntry] = {}
+        # Evictable keys per priority tier, least recently used first;
+        # tiers are ordered lowest priority first
+        self._evict_tiers: Dict[CachePriority, "OrderedDict[str, None]"] = {
+            priority: OrderedDict()
+            for priority in sorted(CachePriority, key=lambda p: -p.value)
+            if priority != CachePriority.CRITICAL
+        }
         self._used_bytes = 0
         self._lock = Lock()
         
@@ -95,6 +152,9 @@ class CacheManager:
         self._prefetch_hits = 0
         self._prefetch_total = 0
         
+        # Last computed statistics, dropped whenever cache state changes
+        self._stats_cache: Optional[CacheStatistics] = None
+        
         logger.info(f"Cache Manager initialized: {capacity_tb}TB capacity")
     
     def get(self, key: str) -> Optional[CacheEntry]:
@@ -108,25 +168,46 @@ class CacheManager:
             CacheEntry if found, None otherwise
         """
         with self._lock:
-            entry = self._entries.get(key)
+            self._stats_cache = None
+            return self._get_locked(key, datetime.now())
+    
+    def get_many(self, keys: List[str]) -> List[Optional[CacheEntry]]:
+        """
+        Retrieve several entries under one lock acquisition.
+        
+        Args:
+            keys: Cache keys
             
-            if entry:
-                # Check expiration
-                if entry.expires_at and datetime.now() > entry.expires_at:
-                    self._remove_entry(key)
-                    self._misses += 1
-                    return None
-                
-                entry.accessed_at = datetime.now()
-                self._hits += 1
-                
-                if entry.priority == CachePriority.PREFETCH:
-                    self._prefetch_hits += 1
-                
-                return entry
+        Returns:
+            CacheEntry or None for each key, in the same order
+        """
+        with self._lock:
+            self._stats_cache = None
+            now = datetime.now()
+            return [self._get_locked(key, now) for key in keys]
+    
+    def _get_locked(self, key: str, now: datetime) -> Optional[CacheEntry]:
+        """Look up one entry and update hit/miss accounting (must hold lock)."""
+        entry = self._entries.get(key)
+        
+        if entry:
+            # Check expiration
+            if entry.expires_at and now > entry.expires_at:
+                self._remove_entry(key)
+                self._misses += 1
+                return None
+            
+            entry.accessed_at = now
+            self._touch_entry(entry)
+            self._hits += 1
             
-            self._misses += 1
-            return None
+            if entry.priority == CachePriority.PREFETCH:
+                self._prefetch_hits += 1
+            
+            return entry
+        
+        self._misses += 1
+        return None
     
     def put(
         self,
@@ -135,7 +216,7 @@ class CacheManager:
         source: str,
         priority: CachePriority = CachePriority.NORMAL,
         ttl_hours: Optional[float] = None,
-        checksum: str = "",
+        checksum: Union[bytes, str] = b"",
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
@@ -147,45 +228,111 @@ class CacheManager:
             source: Data source identifier
             priority: Cache priority level
             ttl_hours: Time-to-live in hours
-            checksum: Data checksum for integrity
+            checksum: CRC32C digest from compute_checksum(); legacy
+                8-digit hex strings are converted to bytes, any other
+                string is stored as-is and cannot be verified
             metadata: Additional metadata
             
         Returns:
             True if stored successfully
         """
+        if isinstance(checksum, str) and _CRC32C_HEX.fullmatch(checksum):
+            checksum = bytes.fromhex(checksum)
+        
         with self._lock:
-            # Check if we need to evict
-            while self._used_bytes + size_bytes > self.capacity_bytes:
-                if not self._evict_lowest_priority():
-                    logger.warning("Cannot store entry: cache full and no evictable entries")
-                    return False
+            self._stats_cache = None
+            return self._put_locked(
+                key, size_bytes, source, priority, ttl_hours, checksum, metadata, datetime.now()
+            )
+    
+    def put_many(
+        self,
+        items: List[Tuple[str, int, str]],
+        priority: CachePriority = CachePriority.NORMAL,
+        ttl_hours: Optional[float] = None,
+    ) -> int:
+        """
+        Store several entries under one lock acquisition.
+        
+        Args:
+            items: (key, size_bytes, source) for each entry
+            priority: Cache priority level for all entries
+            ttl_hours: Time-to-live in hours for all entries
             
+        Returns:
+            Number of entries stored
+        """
+        with self._lock:
+            self._stats_cache = None
             now = datetime.now()
-            expires_at = now + timedelta(hours=ttl_hours) if ttl_hours else None
-            
-            entry = CacheEntry(
-                key=key,
-                size_bytes=size_bytes,
-                priority=priority,
-                created_at=now,
-                accessed_at=now,
-                expires_at=expires_at,
-                source=source,
-                checksum=checksum,
-                metadata=metadata or {},
+            return sum(
+                self._put_locked(key, size_bytes, source, priority, ttl_hours, b"", None, now)
+                for key, size_bytes, source in items
             )
+    
+    def _put_locked(
+        self,
+        key: str,
+        size_bytes: int,
+        source: str,
+        priority: CachePriority,
+        ttl_hours: Optional[float],
+        checksum: Union[bytes, str],
+        metadata: Optional[Dict[str, Any]],
+        now: datetime,
+    ) -> bool:
+        """Store one entry, evicting as needed (must hold lock)."""
+        # Check if we need to evict
+        while self._used_bytes + size_bytes > self.capacity_bytes:
+            if not self._evict_lowest_priority():
+                logger.warning("Cannot store entry: cache full and no evictable entries")
+                return False
+        
+        expires_at = now + timedelta(hours=ttl_hours) if ttl_hours else None
+        
+        entry = CacheEntry(
+            key=key,
+            size_bytes=size_bytes,
+            priority=priority,
+            created_at=now,
+            accessed_at=now,
+            expires_at=expires_at,
+            source=source,
+            checksum=checksum,
+            metadata=metadata or {},
+        )
+        
+        # Remove existing entry if present
+        if key in self._entries:
+            self._remove_entry(key)
+        
+        self._entries[key] = entry
+        self._index_entry(entry)
+        self._used_bytes += size_bytes
+        
+        if priority == CachePriority.PREFETCH:
+            self._prefetch_total += 1
+        
+        return True
+    
+    def verify(self, key: str, data: bytes) -> bool:
+        """
+        Verify data against the stored checksum of a cache entry.
+        
+        Args:
+            key: Cache key
+            data: Data read back for the entry
             
-            # Remove existing entry if present
-            if key in self._entries:
-                self._remove_entry(key)
-            
-            self._entries[key] = entry
-            self._used_bytes += size_bytes
-            
-            if priority == CachePriority.PREFETCH:
-                self._prefetch_total += 1
-            
-            return True
+        Returns:
+            True if the entry exists and its CRC32C checksum matches
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.checksum or isinstance(entry.checksum, str):
+                return False
+            expected = entry.checksum
+        
+        return compute_checksum(data) == expected
     
     def remove(self, key: str) -> bool:
         """Remove entry from cache."""
@@ -195,26 +342,40 @@ class CacheManager:
     def _remove_entry(self, key: str) -> bool:
         """Internal method to remove entry (must hold lock)."""
         if key in self._entries:
+            self._stats_cache = None
             entry = self._entries.pop(key)
+            self._unindex_entry(entry)
             self._used_bytes -= entry.size_bytes
             return True
         return False
     
+    def _index_entry(self, entry: CacheEntry) -> None:
+        """Insert entry as most recently used in its tier (must hold lock)."""
+        tier = self._evict_tiers.get(entry.priority)
+        if tier is not None:
+            tier[entry.key] = None
+    
+    def _unindex_entry(self, entry: CacheEntry) -> None:
+        """Remove entry from its eviction tier (must hold lock)."""
+        tier = self._evict_tiers.get(entry.priority)
+        if tier is not None:
+            tier.pop(entry.key, None)
+    
+    def _touch_entry(self, entry: CacheEntry) -> None:
+        """Mark entry most recently used in its tier (must hold lock)."""
+        tier = self._evict_tiers.get(entry.priority)
+        if tier is not None:
+            tier.move_to_end(entry.key)
+    
     def _evict_lowest_priority(self) -> bool:
-        """Evict lowest priority entry (must hold lock)."""
-        # Find lowest priority, oldest accessed entry
-        candidates = [
-            (key, entry) for key, entry in self._entries.items()
-            if entry.priority != CachePriority.CRITICAL
-        ]
-        
-        if not candidates:
+        """Evict least recently used entry of the lowest priority (must hold lock)."""
+        for tier in self._evict_tiers.values():
+            if tier:
+                key_to_evict = next(iter(tier))
+                break
+        else:
             return False
         
-        # Sort by priority (higher number = lower priority), then by access time
-        candidates.sort(key=lambda x: (-x[1].priority.value, x[1].accessed_at))
-        
-        key_to_evict = candidates[0][0]
         self._remove_entry(key_to_evict)
         self._evictions += 1
         
@@ -252,23 +413,32 @@ class CacheManager:
     def get_statistics(self) -> CacheStatistics:
         """Get current cache statistics."""
         with self._lock:
-            used_tb = self._used_bytes / (1024 ** 4)
-            total_requests = self._hits + self._misses
+            if self._stats_cache is not None:
+                return self._stats_cache
+            
+            capacity_tb = self.capacity_tb
+            used_tb = self._used_bytes * self.BYTES_TO_TB
+            hits = self._hits
+            misses = self._misses
+            total_requests = hits + misses
+            pct_per_request = 100.0 / total_requests if total_requests > 0 else 0
+            prefetch_total = self._prefetch_total
             
-            return CacheStatistics(
-                total_capacity_tb=self.capacity_tb,
+            self._stats_cache = CacheStatistics(
+                total_capacity_tb=capacity_tb,
                 used_capacity_tb=used_tb,
-                free_capacity_tb=self.capacity_tb - used_tb,
-                utilization_pct=(used_tb / self.capacity_tb) * 100,
+                free_capacity_tb=capacity_tb - used_tb,
+                utilization_pct=used_tb * self._capacity_tb_inv * 100,
                 entry_count=len(self._entries),
-                hit_rate_pct=(self._hits / total_requests * 100) if total_requests > 0 else 0,
-                miss_rate_pct=(self._misses / total_requests * 100) if total_requests > 0 else 0,
+                hit_rate_pct=hits * pct_per_request,
+                miss_rate_pct=misses * pct_per_request,
                 eviction_count=self._evictions,
                 prefetch_accuracy_pct=(
-                    self._prefetch_hits / self._prefetch_total * 100
-                    if self._prefetch_total > 0 else 0
+                    self._prefetch_hits * 100.0 / prefetch_total
+                    if prefetch_total > 0 else 0
                 ),
             )
+            return self._stats_cache
     
     def get_status(self) -> CacheStatus:
         """Get current cache health status."""
@@ -7,13 +7,18 @@ mesh, and radio backup systems.
 """
 
 import logging
+import math
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+_RNG = np.random.default_rng()
+
 
 class ConnectivityType(Enum):
     """Types of network connectivity."""
@@ -26,7 +31,13 @@ class ConnectivityType(Enum):
     ETHERNET = "ethernet"
 
 
-@dataclass
+# Ordinal (_idx) per connection type, for list-indexed dispatch
+for _idx, _member in enumerate(ConnectivityType):
+    _member._idx = _idx
+del _idx, _member
+
+
+@dataclass(slots=True)
 class ConnectionConfig:
     """Configuration for a network connection."""
     conn_type: ConnectivityType
@@ -44,7 +55,7 @@ class ConnectionConfig:
             self.config = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionStatus:
     """Current status of a network connection."""
     conn_type: ConnectivityType
@@ -54,13 +65,115 @@ class ConnectionStatus:
     bandwidth_mbps: float
     uptime_seconds: float
     last_error: Optional[str] = None
-    metadata: Dict[str, Any] = None
+    metadata: Any = None  # Per-type *Meta record, or a dict
     
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
 
 
+class StarlinkMeta(NamedTuple):
+    """Starlink terminal status details."""
+    satellites_visible: int
+    obstruction_pct: float
+
+
+class Cellular5GMeta(NamedTuple):
+    """5G modem bank status details."""
+    rsrp_dbm: float
+    rsrq_db: float
+    active_modems: int
+
+
+class LoraMeta(NamedTuple):
+    """LoRa mesh status details."""
+    nodes_in_mesh: int
+    rssi_dbm: float
+
+
+class HFRadioMeta(NamedTuple):
+    """HF radio link status details."""
+    frequency_mhz: float
+    snr_db: float
+
+
+class _SimModel(NamedTuple):
+    """Precomputed jitter arrays for one connection type's simulated status."""
+    metadata_type: type
+    metadata_int: Tuple[bool, ...]
+    base: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+
+
+def _build_sim_model(
+    metadata_type: type,
+    spec: Dict[str, Tuple[float, float, float, bool]]
+) -> _SimModel:
+    """
+    Build a simulation model from {field: (base, low, high, is_int)}.
+    
+    The first four fields are signal_quality_pct, latency_ms, bandwidth_mbps
+    and uptime_seconds; the rest become metadata_type's fields, in order.
+    Integer metadata draws from [low, high + 1) and is floored, matching
+    random.randint bounds.
+    """
+    if tuple(spec)[4:] != metadata_type._fields:
+        raise ValueError(f"Simulation fields do not match {metadata_type.__name__}")
+    
+    values = list(spec.values())
+    return _SimModel(
+        metadata_type=metadata_type,
+        metadata_int=tuple(v[3] for v in values[4:]),
+        base=np.array([v[0] for v in values], dtype=float),
+        low=np.array([v[1] for v in values], dtype=float),
+        high=np.array([v[2] + (1 if v[3] else 0) for v in values], dtype=float),
+    )
+
+
+# Simulated status per connection type: field -> (base, low, high, is_int)
+_SIM_MODELS_BY_TYPE = {
+    ConnectivityType.STARLINK: _build_sim_model(StarlinkMeta, {
+        'signal_quality_pct': (85, -5, 10, False),
+        'latency_ms': (40, -5, 15, False),
+        'bandwidth_mbps': (280, -30, 20, False),
+        'uptime_seconds': (86400, -3600, 3600, False),
+        'satellites_visible': (12, -2, 3, True),
+        'obstruction_pct': (2, -1, 3, False),
+    }),
+    ConnectivityType.CELLULAR_5G: _build_sim_model(Cellular5GMeta, {
+        'signal_quality_pct': (75, -10, 15, False),
+        'latency_ms': (15, -3, 10, False),
+        'bandwidth_mbps': (800, -200, 400, False),
+        'uptime_seconds': (43200, -3600, 3600, False),
+        'rsrp_dbm': (-85, -10, 10, False),
+        'rsrq_db': (-10, -3, 3, False),
+        'active_modems': (4, 0, 0, True),
+    }),
+    ConnectivityType.LORA: _build_sim_model(LoraMeta, {
+        'signal_quality_pct': (70, -15, 20, False),
+        'latency_ms': (150, -30, 50, False),
+        'bandwidth_mbps': (0.05, 0, 0, False),
+        'uptime_seconds': (172800, 0, 0, False),
+        'nodes_in_mesh': (5, -2, 3, True),
+        'rssi_dbm': (-90, -10, 10, False),
+    }),
+    ConnectivityType.HF_RADIO: _build_sim_model(HFRadioMeta, {
+        'signal_quality_pct': (60, -20, 25, False),
+        'latency_ms': (500, -100, 200, False),
+        'bandwidth_mbps': (0.01, 0, 0, False),
+        'uptime_seconds': (259200, 0, 0, False),
+        'frequency_mhz': (14.2, 0, 0, False),
+        'snr_db': (10, -5, 5, False),
+    }),
+}
+
+# Indexed by conn_type._idx; None for types without a simulation model
+_SIM_MODELS: List[Optional[_SimModel]] = [
+    _SIM_MODELS_BY_TYPE.get(conn_type) for conn_type in ConnectivityType
+]
+
+
 class ConnectivityManager:
     """
     Manages all network connectivity options for PodX.
@@ -73,10 +186,20 @@ class ConnectivityManager:
     - WiFi and Ethernet for local connectivity
     """
     
-    def __init__(self):
-        """Initialize connectivity manager."""
+    DEFAULT_STATUS_TTL_MS = 500  # Freshness window for polling helpers
+    
+    def __init__(self, status_ttl_ms: float = DEFAULT_STATUS_TTL_MS):
+        """
+        Initialize connectivity manager.
+        
+        Args:
+            status_ttl_ms: Cache lifetime used by get_all_status,
+                get_best_connection and get_aggregate_bandwidth
+        """
+        self.status_ttl_ms = status_ttl_ms
         self.connections: Dict[ConnectivityType, ConnectionConfig] = {}
         self.status_cache: Dict[ConnectivityType, ConnectionStatus] = {}
+        self._status_cache_ts: Dict[ConnectivityType, float] = {}
         self._initialize_default_connections()
         
         logger.info("Connectivity Manager initialized")
@@ -134,78 +257,60 @@ class ConnectivityManager:
         for config in defaults:
             self.connections[config.conn_type] = config
     
-    def get_connection_status(self, conn_type: ConnectivityType) -> ConnectionStatus:
+    def get_connection_status(
+        self,
+        conn_type: ConnectivityType,
+        ttl_ms: Optional[float] = None
+    ) -> ConnectionStatus:
         """
         Get current status of a connection.
         
         Args:
             conn_type: Type of connection to check
+            ttl_ms: Return the cached status if it is younger than this;
+                None always fetches a fresh status
             
         Returns:
             ConnectionStatus with current metrics
         """
+        if ttl_ms:
+            fetched_at = self._status_cache_ts.get(conn_type)
+            if fetched_at is not None and (time.monotonic() - fetched_at) * 1000 < ttl_ms:
+                return self.status_cache[conn_type]
+        
         # In simulation mode, generate realistic status
-        return self._simulate_status(conn_type)
-    
-    def _simulate_status(self, conn_type: ConnectivityType) -> ConnectionStatus:
-        """Generate simulated connection status."""
-        import random
+        status = self._simulate_status(conn_type)
         
-        if conn_type == ConnectivityType.STARLINK:
-            return ConnectionStatus(
-                conn_type=conn_type,
-                connected=True,
-                signal_quality_pct=85 + random.uniform(-5, 10),
-                latency_ms=40 + random.uniform(-5, 15),
-                bandwidth_mbps=280 + random.uniform(-30, 20),
-                uptime_seconds=86400 + random.uniform(-3600, 3600),
-                metadata={
-                    'satellites_visible': 12 + random.randint(-2, 3),
-                    'obstruction_pct': 2 + random.uniform(-1, 3),
-                }
-            )
-        elif conn_type == ConnectivityType.CELLULAR_5G:
-            return ConnectionStatus(
-                conn_type=conn_type,
-                connected=True,
-                signal_quality_pct=75 + random.uniform(-10, 15),
-                latency_ms=15 + random.uniform(-3, 10),
-                bandwidth_mbps=800 + random.uniform(-200, 400),
-                uptime_seconds=43200 + random.uniform(-3600, 3600),
-                metadata={
-                    'rsrp_dbm': -85 + random.uniform(-10, 10),
-                    'rsrq_db': -10 + random.uniform(-3, 3),
-                    'active_modems': 4,
-                }
-            )
-        elif conn_type == ConnectivityType.LORA:
-            return ConnectionStatus(
-                conn_type=conn_type,
-                connected=True,
-                signal_quality_pct=70 + random.uniform(-15, 20),
-                latency_ms=150 + random.uniform(-30, 50),
-                bandwidth_mbps=0.05,
-                uptime_seconds=172800,
-                metadata={
-                    'nodes_in_mesh': 5 + random.randint(-2, 3),
-                    'rssi_dbm': -90 + random.uniform(-10, 10),
-                }
-            )
-        elif conn_type == ConnectivityType.HF_RADIO:
-            return ConnectionStatus(
-                conn_type=conn_type,
-                connected=True,
-                signal_quality_pct=60 + random.uniform(-20, 25),
-                latency_ms=500 + random.uniform(-100, 200),
-                bandwidth_mbps=0.01,
-                uptime_seconds=259200,
-                metadata={
-                    'frequency_mhz': 14.2,
-                    'snr_db': 10 + random.uniform(-5, 5),
-                }
-            )
+        # Stamp after the fetch so slow fetches don't shorten the TTL
+        self.status_cache[conn_type] = status
+        self._status_cache_ts[conn_type] = time.monotonic()
+        return status
+    
+    def invalidate_status_cache(self, conn_type: Optional[ConnectivityType] = None) -> None:
+        """Drop cached status for one connection, or all if none given."""
+        if conn_type is None:
+            self._status_cache_ts.clear()
         else:
-            return ConnectionStatus(
+            self._status_cache_ts.pop(conn_type, None)
+    
+    def _simulate_status(
+        self,
+        conn_type: ConnectivityType,
+        _models=_SIM_MODELS,
+        _uniform=_RNG.uniform,
+        _floor=math.floor,
+        _status=ConnectionStatus,
+    ) -> ConnectionStatus:
+        """
+        Generate simulated connection status.
+        
+        The trailing keyword defaults pre-bind module globals as locals;
+        callers never pass them.
+        """
+        model = _models[conn_type._idx]
+        
+        if model is None:
+            return _status(
                 conn_type=conn_type,
                 connected=True,
                 signal_quality_pct=100,
@@ -213,11 +318,29 @@ class ConnectivityManager:
                 bandwidth_mbps=10000,
                 uptime_seconds=604800,
             )
+        
+        # One batched draw for every jittered field of this connection type
+        values = (model.base + _uniform(model.low, model.high)).tolist()
+        
+        metadata = model.metadata_type._make(
+            _floor(value) if is_int else value
+            for value, is_int in zip(values[4:], model.metadata_int)
+        )
+        
+        return _status(
+            conn_type=conn_type,
+            connected=True,
+            signal_quality_pct=values[0],
+            latency_ms=values[1],
+            bandwidth_mbps=values[2],
+            uptime_seconds=values[3],
+            metadata=metadata,
+        )
     
     def get_all_status(self) -> Dict[ConnectivityType, ConnectionStatus]:
         """Get status of all configured connections."""
         return {
-            conn_type: self.get_connection_status(conn_type)
+            conn_type: self.get_connection_status(conn_type, self.status_ttl_ms)
             for conn_type in self.connections
         }
     
@@ -225,6 +348,7 @@ class ConnectivityManager:
         """Enable a connection type."""
         if conn_type in self.connections:
             self.connections[conn_type].enabled = True
+            self.invalidate_status_cache(conn_type)
             logger.info(f"Enabled connection: {conn_type.value}")
             return True
         return False
@@ -233,35 +357,35 @@ class ConnectivityManager:
         """Disable a connection type."""
         if conn_type in self.connections:
             self.connections[conn_type].enabled = False
+            self.invalidate_status_cache(conn_type)
             logger.info(f"Disabled connection: {conn_type.value}")
             return True
         return False
     
     def get_best_connection(self) -> Optional[ConnectivityType]:
         """Get the best available connection based on priority and status."""
-        available = []
+        best = None
+        best_rank = None
         
         for conn_type, config in self.connections.items():
             if not config.enabled:
                 continue
             
-            status = self.get_connection_status(conn_type)
+            status = self.get_connection_status(conn_type, self.status_ttl_ms)
             if status.connected and status.signal_quality_pct > 50:
-                available.append((conn_type, config.priority, status))
-        
-        if not available:
-            return None
+                # Priority (lower is better), then by signal quality
+                rank = (config.priority, -status.signal_quality_pct)
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = conn_type, rank
         
-        # Sort by priority (lower is better), then by signal quality
-        available.sort(key=lambda x: (x[1], -x[2].signal_quality_pct))
-        return available[0][0]
+        return best
     
     def get_aggregate_bandwidth(self) -> float:
         """Get total available bandwidth across all connections."""
         total = 0.0
         
         for conn_type in self.connections:
-            status = self.get_connection_status(conn_type)
+            status = self.get_connection_status(conn_type, self.status_ttl_ms)
             if status.connected:
                 total += status.bandwidth_mbps
         
@@ -293,6 +417,7 @@ class ConnectivityManager:
             else:
                 config.config[key] = value
         
+        self.invalidate_status_cache(conn_type)
         logger.info(f"Updated configuration for {conn_type.value}")
         return True
 
@@ -6,16 +6,23 @@ Core controller for Disconnected, Disrupted, Intermittent, and Limited (DDIL)
 network operations, providing seamless connectivity across multiple network paths.
 """
 
+import heapq
 import logging
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
-from threading import Thread, Event
+from typing import Dict, List, Optional, Callable, Any, Tuple
+from threading import Lock
+
+import numpy as np
+
+from .monitor_scheduler import get_monitor_scheduler
 
 logger = logging.getLogger(__name__)
 
+_RNG = np.random.default_rng()
+
 
 class NetworkMode(Enum):
     """Available network connectivity modes."""
@@ -36,7 +43,33 @@ class ConnectionState(Enum):
     FAILING = "failing"
 
 
-@dataclass
+# Cache each member's value as a plain attribute (_v) for hot paths;
+# Enum.value goes through a descriptor on every access
+for _member in (*NetworkMode, *ConnectionState):
+    _member._v = _member.value
+del _member
+
+# Ordinal (_idx) per mode, so per-path state lives in plain lists
+for _idx, _member in enumerate(NetworkMode):
+    _member._idx = _idx
+del _idx, _member
+
+_MODES = tuple(NetworkMode)
+
+
+# Simulated path model per mode: (base, low, high) jitter for
+# latency_ms, bandwidth_mbps and signal_strength_dbm
+_PATH_MODEL = {
+    NetworkMode.SATELLITE: ((40, -5, 15), (150, -20, 50), (-65, -10, 10)),
+    NetworkMode.CELLULAR_5G: ((10, -2, 5), (500, -100, 200), (-75, -15, 15)),
+    NetworkMode.LORA_MESH: ((100, -20, 50), (0.05, -0.01, 0.02), (-90, -10, 10)),
+    NetworkMode.HF_RADIO: ((500, -100, 200), (0.01, -0.005, 0.005), (-100, -10, 10)),
+    NetworkMode.WIRED: ((1, -0.5, 0.5), (10000, 0, 0), (0, 0, 0)),
+}
+_PACKET_LOSS_JITTER = (-0.5, 2)
+
+
+@dataclass(slots=True)
 class NetworkPath:
     """Represents a single network path."""
     mode: NetworkMode
@@ -48,9 +81,116 @@ class NetworkPath:
     last_active: Optional[datetime] = None
     priority: int = 0
     enabled: bool = True
+    version: int = field(default=0, repr=False, compare=False)  # Bumped on every update
+
+
+_PATH_METRIC_KEYS = (
+    'mode', 'state', 'latency_ms', 'bandwidth_mbps', 'packet_loss_pct',
+    'signal_strength_dbm', 'last_active', 'priority', 'enabled',
+)
+
+
+_STATES = tuple(ConnectionState)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_CONNECTED_U8 = _STATE_CODES[ConnectionState.CONNECTED]
+_DEGRADED_U8 = _STATE_CODES[ConnectionState.DEGRADED]
+
+
+def _build_path_model_arrays() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lay out _PATH_MODEL as (base, low, high) matrices indexed by mode._idx.
+    
+    Columns are latency_ms, bandwidth_mbps, signal_strength_dbm and
+    packet_loss_pct; rows for modes without a simulated path stay zero.
+    """
+    base = np.zeros((len(_MODES), 4))
+    low = np.zeros((len(_MODES), 4))
+    high = np.zeros((len(_MODES), 4))
+    for mode, spec in _PATH_MODEL.items():
+        i = mode._idx
+        base[i, :3] = [f[0] for f in spec]
+        low[i] = [f[1] for f in spec] + [_PACKET_LOSS_JITTER[0]]
+        high[i] = [f[2] for f in spec] + [_PACKET_LOSS_JITTER[1]]
+    return base, low, high
+
+
+_BASE, _LOW, _HIGH = _build_path_model_arrays()
+
+# Fixed-layout metric snapshot published from the monitor to readers
+_PATH_RECORD = np.dtype([
+    ('latency_ms', 'f8'),
+    ('bandwidth_mbps', 'f8'),
+    ('packet_loss_pct', 'f8'),
+    ('signal_strength_dbm', 'f8'),
+    ('state', 'u1'),
+    ('timestamp', 'f8'),
+])
+
+
+class PathMetricsRing:
+    """
+    Single-producer / single-consumer ring of path metric snapshots.
+    
+    The monitor writes each refresh into a preallocated record slot and
+    bumps write_seq only after the slot is complete, so the consumer
+    always reads a whole snapshot without locking. Capacity must be a
+    power of two.
+    """
+    
+    DEFAULT_DEPTH = 4
+    
+    def __init__(self, depth: int = DEFAULT_DEPTH):
+        """
+        Initialize ring.
+        
+        Args:
+            depth: Number of snapshots retained (power of two)
+        """
+        if depth <= 0 or depth & (depth - 1):
+            raise ValueError(f"Ring depth must be a power of two, got {depth}")
+        
+        self.depth = depth
+        self._mask = depth - 1
+        self._records = np.zeros(depth, dtype=_PATH_RECORD)
+        self.write_seq = 0
+        self.read_seq = 0
+    
+    def push(self, path: NetworkPath, timestamp: float) -> bool:
+        """
+        Publish a path snapshot (producer side).
+        
+        Returns:
+            True when this push put an attached consumer (one that has
+            read at least once) more than depth snapshots behind
+        """
+        self._records[self.write_seq & self._mask] = (
+            path.latency_ms,
+            path.bandwidth_mbps,
+            path.packet_loss_pct,
+            path.signal_strength_dbm,
+            _STATE_CODES[path.state],
+            timestamp,
+        )
+        self.write_seq += 1  # Publish only after the slot is written
+        return self.read_seq > 0 and self.write_seq - self.read_seq == self.depth + 1
+    
+    def lag(self) -> int:
+        """Snapshots published since the consumer last read."""
+        return self.write_seq - self.read_seq
+    
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Read the most recent snapshot (consumer side)."""
+        seq = self.write_seq
+        if not seq:
+            return None
+        
+        record = dict(zip(_PATH_RECORD.names, self._records[(seq - 1) & self._mask].item()))
+        record['state'] = _STATES[record['state']].value
+        self.read_seq = seq
+        return record
 
 
-@dataclass
+@dataclass(slots=True)
 class DDILStatus:
     """Current DDIL operational status."""
     mode: str
@@ -71,8 +211,17 @@ class DDILController:
     Manages multiple network paths and provides seamless failover,
     predictive buffering, and autonomous operation capabilities.
     
+    Path state is copy-on-write: writers (the monitor thread and
+    enable/disable calls) copy the paths they change into a new snapshot
+    under a writer lock and publish it with a single reference swap.
+    Published paths are never modified again, so readers never take a
+    lock and never see a half-updated path, even if they hold on to it.
+    
+    Per-path state is stored in lists indexed by the mode's ordinal
+    (mode._idx), with None in the OFFLINE slot.
+    
     Attributes:
-        paths: Dictionary of available network paths
+        paths: Dictionary of available network paths (live snapshot)
         active_mode: Current primary network mode
         autonomy_hours: Configured DDIL autonomy duration
     """
@@ -86,6 +235,26 @@ class DDILController:
         NetworkMode.HF_RADIO: 5,
     }
     
+    # Events accepted by register_callback (stored as _on_<event>)
+    CALLBACK_EVENTS = frozenset({
+        'path_change', 'handover', 'ddil_enter', 'ddil_exit', 'backpressure',
+    })
+    
+    # Handover hysteresis: a same-priority path must beat the current one
+    # by this much latency, and the current path is kept for at least
+    # MIN_DWELL_S after a handover while it remains usable
+    HYST_MARGIN_MS = 20
+    MIN_DWELL_S = 5.0
+    
+    # Seconds between metric refreshes per path
+    POLL_INTERVALS = {
+        NetworkMode.WIRED: 10.0,
+        NetworkMode.CELLULAR_5G: 1.0,
+        NetworkMode.SATELLITE: 2.0,
+        NetworkMode.LORA_MESH: 5.0,
+        NetworkMode.HF_RADIO: 30.0,
+    }
+    
     def __init__(
         self,
         autonomy_hours: float = 24,
@@ -104,30 +273,82 @@ class DDILController:
         self.cache_size_tb = cache_size_tb
         self.handover_threshold_ms = handover_threshold_ms
         
-        self.paths: Dict[NetworkMode, NetworkPath] = {}
+        slots = len(_MODES)
+        self._paths_live: List[Optional[NetworkPath]] = [None] * slots
+        # (snapshot, dict view) for the most recent paths_dict() call
+        self._path_view: Tuple[Optional[List[Optional[NetworkPath]]], Dict[NetworkMode, NetworkPath]] = (None, {})
+        self._write_lock = Lock()
         self.active_mode: Optional[NetworkMode] = None
+        self._last_handover_ts = float('-inf')
+        # Path chosen by force_handover; kept until it is lost
+        self._forced_mode: Optional[NetworkMode] = None
+        # Hysteresis kept a degraded path; re-check on later ticks
+        self._handover_held = False
         self._running = False
-        self._monitor_thread: Optional[Thread] = None
-        self._stop_event = Event()
+        # Simulated metrics as structure-of-arrays, indexed by mode._idx
+        self._lat = np.zeros(slots)
+        self._bw = np.zeros(slots)
+        self._sig = np.zeros(slots)
+        self._loss = np.zeros(slots)
+        self._state = np.zeros(slots, dtype=np.uint8)
         
-        self._callbacks: Dict[str, List[Callable]] = {
-            'path_change': [],
-            'handover': [],
-            'ddil_enter': [],
-            'ddil_exit': [],
-        }
+        # Monitor -> reader metric feed, one single-consumer ring per path
+        self._metric_rings: List[Optional[PathMetricsRing]] = [None] * slots
+        
+        # Last get_path_metrics() result per mode, keyed by path version
+        self._metrics_cache: List[Optional[Tuple[int, Dict[str, Any]]]] = [None] * slots
+        
+        # Min-heap of (next_due, index, mode); None until the first tick
+        self._schedule: Optional[List[Tuple[float, int, NetworkMode]]] = None
+        
+        # (state, enabled) last seen by the monitor, to detect path changes
+        self._observed: List[Optional[Tuple[ConnectionState, bool]]] = [None] * slots
+        
+        # Immutable per-event snapshots, replaced on register (copy-on-write)
+        self._on_path_change: Tuple[Callable, ...] = ()
+        self._on_handover: Tuple[Callable, ...] = ()
+        self._on_ddil_enter: Tuple[Callable, ...] = ()
+        self._on_ddil_exit: Tuple[Callable, ...] = ()
+        self._on_backpressure: Tuple[Callable, ...] = ()
         
         self._initialize_paths()
         logger.info(f"DDIL Controller initialized: {autonomy_hours}hr autonomy, {cache_size_tb}TB cache")
     
     def _initialize_paths(self) -> None:
         """Initialize all network paths."""
-        for mode in NetworkMode:
+        for mode in _MODES:
             if mode != NetworkMode.OFFLINE:
-                self.paths[mode] = NetworkPath(
-                    mode=mode,
-                    priority=self.DEFAULT_PRIORITIES.get(mode, 10),
-                )
+                priority = self.DEFAULT_PRIORITIES.get(mode, 10)
+                self._paths_live[mode._idx] = NetworkPath(mode=mode, priority=priority)
+                self._metric_rings[mode._idx] = PathMetricsRing()
+        
+        self._path_modes = tuple(path.mode for path in self._paths_live if path is not None)
+    
+    @property
+    def paths(self) -> Dict[NetworkMode, NetworkPath]:
+        """Live snapshot of all network paths (treat as read-only)."""
+        return self.paths_dict()
+    
+    def paths_dict(self) -> Dict[NetworkMode, NetworkPath]:
+        """
+        Dictionary view of the live path snapshot, keyed by mode.
+        
+        Built once per published snapshot and reused until the next one,
+        since a published snapshot never changes.
+        """
+        live = self._paths_live
+        snapshot, view = self._path_view
+        if snapshot is not live:
+            view = {path.mode: path for path in live if path is not None}
+            self._path_view = (live, view)
+        return view
+    
+    def _copy_on_write(self, idx: List[int]) -> List[Optional[NetworkPath]]:
+        """New snapshot sharing unchanged paths, with fresh copies at idx (hold _write_lock)."""
+        snapshot = list(self._paths_live)
+        for i in idx:
+            snapshot[i] = replace(snapshot[i])
+        return snapshot
     
     def start(self) -> None:
         """Start the DDIL controller and monitoring."""
@@ -135,200 +356,373 @@ class DDILController:
             return
         
         self._running = True
-        self._stop_event.clear()
-        self._monitor_thread = Thread(target=self._monitor_loop, daemon=True)
-        self._monitor_thread.start()
+        self._schedule = None
+        get_monitor_scheduler().register(self, self._tick, interval=1.0)
         
         logger.info("DDIL Controller started")
     
     def stop(self) -> None:
         """Stop the DDIL controller."""
         self._running = False
-        self._stop_event.set()
-        
-        if self._monitor_thread:
-            self._monitor_thread.join(timeout=5)
+        get_monitor_scheduler().unregister(self)
         
         logger.info("DDIL Controller stopped")
     
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
-        while self._running and not self._stop_event.is_set():
+    def _tick(self) -> Optional[float]:
+        """
+        Refresh whichever paths are due; runs on the shared monitor scheduler.
+        
+        Paths are kept in a min-heap keyed by their next due time, so each
+        tick refreshes only the paths that are due. Handover selection runs
+        only when a refresh changes a path's state or enabled flag, or while
+        hysteresis is holding a degraded path.
+        
+        Returns:
+            Seconds until the next path is due
+        """
+        if self._schedule is None:
             try:
                 self._update_path_status()
                 self._check_handover_needed()
             except Exception as e:
-                logger.error(f"Monitor loop error: {e}")
+                logger.error(f"Monitor tick error: {e}")
+            
+            now = time.monotonic()
+            self._schedule = [
+                (now + self.POLL_INTERVALS.get(path.mode, 1.0), path.mode._idx, path.mode)
+                for path in self._paths_live if path is not None
+            ]
+            heapq.heapify(self._schedule)
+        
+        schedule = self._schedule
+        now = time.monotonic()
+        changed = False
+        
+        while schedule and schedule[0][0] <= now:
+            _, i, mode = heapq.heappop(schedule)
+            try:
+                changed |= self._update_path(mode)
+            except Exception as e:
+                logger.error(f"Monitor tick error: {e}")
             
-            self._stop_event.wait(timeout=1.0)
+            interval = self.POLL_INTERVALS.get(mode, 1.0)
+            heapq.heappush(schedule, (time.monotonic() + interval, i, mode))
+        
+        if changed or self._handover_held:
+            try:
+                self._check_handover_needed()
+            except Exception as e:
+                logger.error(f"Monitor tick error: {e}")
+        
+        return schedule[0][0] - time.monotonic() if schedule else None
     
     def _update_path_status(self) -> None:
         """Update status of all network paths."""
-        for mode, path in self.paths.items():
-            if not path.enabled:
-                continue
+        self._refresh_paths(self._path_modes)
+    
+    def _update_path(self, mode: NetworkMode) -> bool:
+        """
+        Refresh a single network path.
+        
+        Returns:
+            True if the path's state or enabled flag changed since last seen
+        """
+        return self._refresh_paths((mode,))
+    
+    def _refresh_paths(
+        self,
+        modes: Tuple[NetworkMode, ...],
+        _now=datetime.now,
+        _states=_STATES,
+    ) -> bool:
+        """
+        Refresh paths in the back buffer and publish; True if any changed.
+        
+        Metrics for every enabled path are generated in one vectorized
+        pass over the SoA arrays, then written column by column into fresh
+        copies of those paths before the new snapshot is published. The trailing
+        keyword defaults pre-bind module globals as locals.
+        """
+        changed = False
+        lagging = []
+        now = _now()
+        timestamp = now.timestamp()
+        
+        with self._write_lock:
+            live = self._paths_live
+            idx = [mode._idx for mode in modes if live[mode._idx].enabled]
+            snapshot = self._copy_on_write(idx)
+            
+            if idx:
+                # In simulation mode, generate realistic metrics
+                self._simulate_paths_vectorized(idx)
+                columns = zip(
+                    idx,
+                    self._lat[idx].tolist(),
+                    self._bw[idx].tolist(),
+                    self._sig[idx].tolist(),
+                    self._loss[idx].tolist(),
+                    self._state[idx].tolist(),
+                )
+                for i, latency, bandwidth, signal, loss, state in columns:
+                    path = snapshot[i]
+                    path.latency_ms = latency
+                    path.bandwidth_mbps = bandwidth
+                    path.signal_strength_dbm = signal
+                    path.packet_loss_pct = loss
+                    path.state = _states[state]
+                    path.last_active = now
+                    path.version += 1
+                    if self._metric_rings[i].push(path, timestamp):
+                        lagging.append(path.mode)
+            
+            for mode in modes:
+                i = mode._idx
+                path = snapshot[i]
+                observed = (path.state, path.enabled)
+                changed |= self._observed[i] != observed
+                self._observed[i] = observed
             
-            # In simulation mode, generate realistic metrics
-            self._simulate_path_metrics(path)
-    
-    def _simulate_path_metrics(self, path: NetworkPath) -> None:
-        """Simulate realistic network metrics for testing."""
-        import random
-        
-        if path.mode == NetworkMode.SATELLITE:
-            path.latency_ms = 40 + random.uniform(-5, 15)
-            path.bandwidth_mbps = 150 + random.uniform(-20, 50)
-            path.signal_strength_dbm = -65 + random.uniform(-10, 10)
-        elif path.mode == NetworkMode.CELLULAR_5G:
-            path.latency_ms = 10 + random.uniform(-2, 5)
-            path.bandwidth_mbps = 500 + random.uniform(-100, 200)
-            path.signal_strength_dbm = -75 + random.uniform(-15, 15)
-        elif path.mode == NetworkMode.LORA_MESH:
-            path.latency_ms = 100 + random.uniform(-20, 50)
-            path.bandwidth_mbps = 0.05 + random.uniform(-0.01, 0.02)
-            path.signal_strength_dbm = -90 + random.uniform(-10, 10)
-        elif path.mode == NetworkMode.HF_RADIO:
-            path.latency_ms = 500 + random.uniform(-100, 200)
-            path.bandwidth_mbps = 0.01 + random.uniform(-0.005, 0.005)
-            path.signal_strength_dbm = -100 + random.uniform(-10, 10)
-        elif path.mode == NetworkMode.WIRED:
-            path.latency_ms = 1 + random.uniform(-0.5, 0.5)
-            path.bandwidth_mbps = 10000
-            path.signal_strength_dbm = 0
-        
-        path.packet_loss_pct = max(0, random.uniform(-0.5, 2))
-        path.state = ConnectionState.CONNECTED if path.signal_strength_dbm > -95 else ConnectionState.DEGRADED
-        path.last_active = datetime.now()
+            self._paths_live = snapshot
+        
+        if lagging:
+            callbacks = self._on_backpressure
+            for mode in lagging:
+                for callback in callbacks:
+                    callback(mode, self._metric_rings[mode._idx].lag())
+        
+        return changed
+    
+    def _simulate_paths_vectorized(
+        self,
+        idx: List[int],
+        _uniform=_RNG.uniform,
+        _maximum=np.maximum,
+        _where=np.where,
+        _connected=_CONNECTED_U8,
+        _degraded=_DEGRADED_U8,
+    ) -> None:
+        """
+        Simulate realistic network metrics for testing.
+        
+        Draws jitter for all requested paths at once and classifies their
+        state with a single comparison over the signal column.
+        
+        Args:
+            idx: Mode ordinals of the paths to refresh
+        """
+        values = _BASE[idx] + _uniform(_LOW[idx], _HIGH[idx])
+        self._lat[idx] = values[:, 0]
+        self._bw[idx] = values[:, 1]
+        self._sig[idx] = values[:, 2]
+        self._loss[idx] = _maximum(values[:, 3], 0)
+        self._state[idx] = _where(values[:, 2] > -95, _connected, _degraded)
     
     def _check_handover_needed(self) -> None:
-        """Check if network handover is needed."""
+        """
+        Check if network handover is needed.
+        
+        A lost or disabled active path is replaced immediately. A degraded
+        one is reconsidered under hysteresis, unless force_handover chose
+        it. A usable active path is never swapped for a better one.
+        """
         if not self.active_mode:
             self._select_best_path()
             return
         
-        current_path = self.paths.get(self.active_mode)
-        if not current_path or current_path.state in [ConnectionState.DISCONNECTED, ConnectionState.FAILING]:
+        current_path = self._paths_live[self.active_mode._idx]
+        if (not current_path or not current_path.enabled
+                or current_path.state in (ConnectionState.DISCONNECTED, ConnectionState.FAILING)):
             self._select_best_path()
+        elif current_path.state is ConnectionState.DEGRADED and self.active_mode != self._forced_mode:
+            self._select_best_path()
+        else:
+            self._handover_held = False
     
     def _select_best_path(self) -> None:
         """Select the best available network path."""
-        available_paths = [
-            (mode, path) for mode, path in self.paths.items()
-            if path.enabled and path.state in [ConnectionState.CONNECTED, ConnectionState.DEGRADED]
-        ]
+        best_mode = None
+        best_rank = None
+        self._handover_held = False
+        
+        for path in self._paths_live:
+            if path is not None and path.enabled and path.state in (ConnectionState.CONNECTED, ConnectionState.DEGRADED):
+                # Priority, then latency
+                rank = (path.priority, path.latency_ms)
+                if best_rank is None or rank < best_rank:
+                    best_mode, best_rank = path.mode, rank
         
-        if not available_paths:
+        if best_mode is None:
             if self.active_mode != NetworkMode.OFFLINE:
                 self._enter_ddil_mode()
             return
         
-        # Sort by priority, then by latency
-        available_paths.sort(key=lambda x: (x[1].priority, x[1].latency_ms))
-        best_mode, best_path = available_paths[0]
-        
         if best_mode != self.active_mode:
-            self._perform_handover(best_mode)
+            if self._hold_current_path(best_mode):
+                self._handover_held = True
+            else:
+                self._perform_handover(best_mode)
+    
+    def _hold_current_path(self, candidate: NetworkMode) -> bool:
+        """
+        Check whether hysteresis keeps the current path over a candidate.
+        
+        Only applies while the current path is still usable; a lost or
+        disabled path is always replaced immediately.
+        """
+        if self.active_mode is None or self.active_mode == NetworkMode.OFFLINE:
+            return False
+        
+        current = self._paths_live[self.active_mode._idx]
+        if not current.enabled or current.state not in (ConnectionState.CONNECTED, ConnectionState.DEGRADED):
+            return False
+        
+        if time.monotonic() - self._last_handover_ts < self.MIN_DWELL_S:
+            return True
+        
+        best = self._paths_live[candidate._idx]
+        return (
+            best.priority == current.priority
+            and best.latency_ms > current.latency_ms - self.HYST_MARGIN_MS
+        )
     
     def _perform_handover(self, new_mode: NetworkMode) -> None:
         """Perform network handover to new path."""
         old_mode = self.active_mode
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         # Simulate handover process
         self.active_mode = new_mode
+        self._forced_mode = None
+        self._last_handover_ts = time.monotonic()
         
-        handover_time_ms = (time.time() - start_time) * 1000
+        handover_time_ms = (time.monotonic_ns() - start_ns) / 1_000_000
         
         logger.info(f"Handover: {old_mode} -> {new_mode} ({handover_time_ms:.1f}ms)")
         
-        for callback in self._callbacks['handover']:
-            callback(old_mode, new_mode, handover_time_ms)
+        callbacks = self._on_handover
+        if callbacks:
+            for callback in callbacks:
+                callback(old_mode, new_mode, handover_time_ms)
     
     def _enter_ddil_mode(self) -> None:
         """Enter full DDIL (offline) mode."""
         logger.warning("Entering DDIL mode - all network paths unavailable")
         self.active_mode = NetworkMode.OFFLINE
+        self._forced_mode = None
         
-        for callback in self._callbacks['ddil_enter']:
-            callback()
+        callbacks = self._on_ddil_enter
+        if callbacks:
+            for callback in callbacks:
+                callback()
     
     def get_status(self) -> DDILStatus:
         """Get current DDIL operational status."""
-        active_paths = [
-            mode.value for mode, path in self.paths.items()
-            if path.state == ConnectionState.CONNECTED
-        ]
-        
-        total_bandwidth = sum(
-            path.bandwidth_mbps for path in self.paths.values()
-            if path.state == ConnectionState.CONNECTED
-        )
+        connected = ConnectionState.CONNECTED
+        active_paths = []
+        total_bandwidth = 0.0
+        latency_sum = 0.0
         
-        latencies = [
-            path.latency_ms for path in self.paths.values()
-            if path.state == ConnectionState.CONNECTED
-        ]
-        avg_latency = sum(latencies) / len(latencies) if latencies else 0
+        for path in self._paths_live:
+            if path is not None and path.state is connected:
+                active_paths.append(path.mode._v)
+                total_bandwidth += path.bandwidth_mbps
+                latency_sum += path.latency_ms
+        
+        avg_latency = latency_sum / len(active_paths) if active_paths else 0
+        now = datetime.now()
         
         return DDILStatus(
             mode="connected" if self.active_mode != NetworkMode.OFFLINE else "ddil",
             active_paths=active_paths,
-            primary_path=self.active_mode.value if self.active_mode else None,
+            primary_path=self.active_mode._v if self.active_mode else None,
             total_bandwidth_mbps=total_bandwidth,
             average_latency_ms=avg_latency,
             ddil_autonomy_remaining_hours=self.autonomy_hours,
             cache_utilization_pct=15.0,  # Simulated
-            last_sync=datetime.now() - timedelta(minutes=5),
-            next_sync_window=datetime.now() + timedelta(minutes=10),
+            last_sync=now - timedelta(minutes=5),
+            next_sync_window=now + timedelta(minutes=10),
         )
     
+    def _set_path_enabled(self, mode: NetworkMode, enabled: bool) -> None:
+        """Publish a snapshot with a path's enabled flag changed."""
+        with self._write_lock:
+            snapshot = self._copy_on_write([mode._idx])
+            path = snapshot[mode._idx]
+            path.enabled = enabled
+            path.version += 1
+            self._paths_live = snapshot
+    
     def enable_path(self, mode: NetworkMode) -> None:
         """Enable a network path."""
-        if mode in self.paths:
-            self.paths[mode].enabled = True
+        if self._paths_live[mode._idx] is not None:
+            self._set_path_enabled(mode, True)
             logger.info(f"Enabled path: {mode.value}")
     
     def disable_path(self, mode: NetworkMode) -> None:
         """Disable a network path."""
-        if mode in self.paths:
-            self.paths[mode].enabled = False
+        if self._paths_live[mode._idx] is not None:
+            self._set_path_enabled(mode, False)
             if self.active_mode == mode:
-                self._select_best_path()
+                self._check_handover_needed()
             logger.info(f"Disabled path: {mode.value}")
     
     def force_handover(self, target_mode: NetworkMode) -> bool:
         """Force handover to specific network path."""
-        if target_mode not in self.paths:
-            return False
-        
-        path = self.paths[target_mode]
-        if not path.enabled:
+        path = self._paths_live[target_mode._idx]
+        if path is None or not path.enabled:
             return False
         
         self._perform_handover(target_mode)
+        self._forced_mode = target_mode
         return True
     
     def register_callback(self, event: str, callback: Callable) -> None:
         """Register callback for network events."""
-        if event in self._callbacks:
-            self._callbacks[event].append(callback)
+        if event in self.CALLBACK_EVENTS:
+            attr = f"_on_{event}"
+            with self._write_lock:
+                setattr(self, attr, getattr(self, attr) + (callback,))
+    
+    def read_path_feed(self, mode: NetworkMode) -> Optional[Dict[str, Any]]:
+        """
+        Read the latest monitor snapshot for a path from its metric ring.
+        
+        Intended for a single consumer per path; that consumer falling more
+        than the ring depth behind fires the 'backpressure' callbacks.
+        """
+        ring = self._metric_rings[mode._idx]
+        return ring.latest() if ring else None
     
     def get_path_metrics(self, mode: NetworkMode) -> Optional[Dict[str, Any]]:
-        """Get detailed metrics for a specific path."""
-        path = self.paths.get(mode)
+        """
+        Get detailed metrics for a specific path.
+        
+        The dict is built once per path update and cached; each call
+        returns a shallow copy, so callers may modify it.
+        """
+        i = mode._idx
+        path = self._paths_live[i]
         if not path:
             return None
         
-        return {
-            'mode': path.mode.value,
-            'state': path.state.value,
-            'latency_ms': path.latency_ms,
-            'bandwidth_mbps': path.bandwidth_mbps,
-            'packet_loss_pct': path.packet_loss_pct,
-            'signal_strength_dbm': path.signal_strength_dbm,
-            'last_active': path.last_active.isoformat() if path.last_active else None,
-            'priority': path.priority,
-            'enabled': path.enabled,
-        }
+        version = path.version
+        cached = self._metrics_cache[i]
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+        
+        metrics = dict(zip(_PATH_METRIC_KEYS, (
+            path.mode._v,
+            path.state._v,
+            path.latency_ms,
+            path.bandwidth_mbps,
+            path.packet_loss_pct,
+            path.signal_strength_dbm,
+            path.last_active.isoformat() if path.last_active else None,
+            path.priority,
+            path.enabled,
+        )))
+        self._metrics_cache[i] = (version, metrics)
+        return dict(metrics)
 
 
@@ -5,16 +5,24 @@ Network Handover Manager
 Manages seamless network transitions with <100ms handover latency.
 """
 
+import asyncio
 import logging
+import math
+import queue
 import time
-from dataclasses import dataclass
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Callable
-from threading import Lock
+from typing import Any, Deque, Dict, Iterable, List, Optional, Callable, Tuple, Union
+from threading import Event, Lock, Thread
 
 logger = logging.getLogger(__name__)
 
+# Queued by close() (or on collection) to end a dispatcher thread
+_CLOSE = object()
+
 
 class HandoverStrategy(Enum):
     """Network handover strategies."""
@@ -23,18 +31,98 @@ class HandoverStrategy(Enum):
     SEAMLESS = "seamless"                     # Parallel operation during transition
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class HandoverMetrics:
-    """Metrics from a handover operation."""
+    """
+    Metrics from a handover operation.
+    
+    Constructed with start_time/end_time datetimes. HandoverManager uses
+    from_ns() with integer time.time_ns() stamps instead, and those
+    datetimes are rendered only when read.
+    """
     source_path: str
     target_path: str
     strategy: HandoverStrategy
-    start_time: datetime
-    end_time: datetime
     duration_ms: float
     packets_lost: int
     success: bool
-    error_message: Optional[str] = None
+    error_message: Optional[str]
+    _start: Union[datetime, int] = field(repr=False)
+    _end: Union[datetime, int] = field(repr=False)
+    
+    def __init__(
+        self,
+        source_path: str,
+        target_path: str,
+        strategy: HandoverStrategy,
+        start_time: datetime,
+        end_time: datetime,
+        duration_ms: float,
+        packets_lost: int,
+        success: bool,
+        error_message: Optional[str] = None
+    ):
+        self.source_path = source_path
+        self.target_path = target_path
+        self.strategy = strategy
+        self._start = start_time
+        self._end = end_time
+        self.duration_ms = duration_ms
+        self.packets_lost = packets_lost
+        self.success = success
+        self.error_message = error_message
+    
+    @classmethod
+    def from_ns(
+        cls,
+        source_path: str,
+        target_path: str,
+        strategy: HandoverStrategy,
+        start_ns: int,
+        end_ns: int,
+        duration_ms: float,
+        packets_lost: int,
+        success: bool,
+        error_message: Optional[str] = None
+    ) -> 'HandoverMetrics':
+        """Build metrics from time.time_ns() stamps without creating datetimes."""
+        return cls(source_path, target_path, strategy, start_ns, end_ns,
+                   duration_ms, packets_lost, success, error_message)
+    
+    @property
+    def start_time(self) -> datetime:
+        """Handover start as a local datetime."""
+        start = self._start
+        return start if isinstance(start, datetime) else datetime.fromtimestamp(start / 1e9)
+    
+    @property
+    def end_time(self) -> datetime:
+        """Handover end as a local datetime."""
+        end = self._end
+        return end if isinstance(end, datetime) else datetime.fromtimestamp(end / 1e9)
+
+
+def _pump_callbacks(manager_ref: "weakref.ref[HandoverManager]", cb_queue: queue.SimpleQueue) -> None:
+    """Dispatcher thread: deliver queued handover metrics to callbacks."""
+    while True:
+        item = cb_queue.get()
+        if item is _CLOSE:
+            return
+        if isinstance(item, Event):
+            item.set()
+            continue
+        
+        manager = manager_ref()
+        if manager is None:
+            return
+        callbacks = manager._callbacks
+        del manager
+        
+        for callback in callbacks:
+            try:
+                callback(item)
+            except Exception as e:
+                logger.error(f"Callback error: {e}")
 
 
 class HandoverManager:
@@ -43,22 +131,67 @@ class HandoverManager:
     
     Implements make-before-break handover to achieve <100ms transitions
     between network paths while maintaining session continuity.
+    
+    Statistics cover the most recent history_size handovers and are kept
+    as running aggregates, updated as entries enter and leave the window.
     """
     
     TARGET_HANDOVER_MS = 100  # Target handover time
     MAX_HANDOVER_MS = 200     # Maximum acceptable handover time
+    DEFAULT_HISTORY_SIZE = 4096
     
-    def __init__(self, strategy: HandoverStrategy = HandoverStrategy.MAKE_BEFORE_BREAK):
+    def __init__(
+        self,
+        strategy: HandoverStrategy = HandoverStrategy.MAKE_BEFORE_BREAK,
+        history_size: int = DEFAULT_HISTORY_SIZE
+    ):
         """
         Initialize handover manager.
         
         Args:
             strategy: Default handover strategy to use
+            history_size: Number of recent handovers retained for statistics
+            
+        Raises:
+            ValueError: If history_size is less than 1
         """
+        if history_size < 1:
+            raise ValueError(f"history_size must be at least 1, got {history_size}")
+        
         self.strategy = strategy
-        self.handover_history: List[HandoverMetrics] = []
+        self.handover_history: Deque[HandoverMetrics] = deque(maxlen=history_size)
         self._lock = Lock()
-        self._callbacks: List[Callable[[HandoverMetrics], None]] = []
+        
+        # Running aggregates over handover_history (durations and packet
+        # loss count successful handovers only)
+        self._stats: Dict[str, Any] = {
+            'total': 0,
+            'successful': 0,
+            'sum_ms': 0.0,
+            'sum_ms_sq': 0.0,
+            'packets_lost': 0,
+        }
+        
+        # Totals since start; never decremented on eviction
+        self._lifetime: Dict[str, int] = {
+            'total': 0,
+            'successful': 0,
+            'packets_lost': 0,
+        }
+        
+        # Sequence number of the next handover, and monotonic queues of
+        # (seq, duration_ms) giving the window min/max at their heads
+        self._seq = 0
+        self._min_window: Deque[Tuple[int, float]] = deque()
+        self._max_window: Deque[Tuple[int, float]] = deque()
+        
+        # Callbacks run on a dispatcher thread fed by a queue, so a slow
+        # callback never delays execute_handover. The tuple is replaced
+        # (not mutated) on register, so the dispatcher reads it unlocked.
+        self._callbacks: Tuple[Callable[[HandoverMetrics], None], ...] = ()
+        self._cb_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._cb_thread: Optional[Thread] = None
+        self._cb_finalizer: Optional[weakref.finalize] = None
         
         logger.info(f"Handover Manager initialized with strategy: {strategy.value}")
     
@@ -71,6 +204,9 @@ class HandoverManager:
         """
         Execute network handover from source to target path.
         
+        Blocks the calling thread for the simulated handover; use
+        execute_handover_async from a running event loop.
+        
         Args:
             source_path: Current network path identifier
             target_path: Target network path identifier
@@ -80,171 +216,306 @@ class HandoverManager:
             HandoverMetrics with operation details
         """
         use_strategy = strategy or self.strategy
-        start_time = datetime.now()
+        start_ns = time.time_ns()
         start_perf = time.perf_counter()
         
         logger.info(f"Starting handover: {source_path} -> {target_path} ({use_strategy.value})")
         
         try:
-            if use_strategy == HandoverStrategy.MAKE_BEFORE_BREAK:
-                packets_lost = self._make_before_break(source_path, target_path)
-            elif use_strategy == HandoverStrategy.BREAK_BEFORE_MAKE:
-                packets_lost = self._break_before_make(source_path, target_path)
-            else:
-                packets_lost = self._seamless_handover(source_path, target_path)
-            
-            end_perf = time.perf_counter()
-            duration_ms = (end_perf - start_perf) * 1000
-            
-            metrics = HandoverMetrics(
-                source_path=source_path,
-                target_path=target_path,
-                strategy=use_strategy,
-                start_time=start_time,
-                end_time=datetime.now(),
-                duration_ms=duration_ms,
-                packets_lost=packets_lost,
-                success=True,
-            )
-            
-            logger.info(f"Handover complete: {duration_ms:.1f}ms, {packets_lost} packets lost")
-            
+            delay_s, packets_lost = self._plan_handover(use_strategy, source_path, target_path)
+            time.sleep(delay_s)
         except Exception as e:
-            end_perf = time.perf_counter()
-            duration_ms = (end_perf - start_perf) * 1000
+            return self._complete(source_path, target_path, use_strategy, start_ns, start_perf, error=e)
+        
+        return self._complete(source_path, target_path, use_strategy, start_ns, start_perf, packets_lost)
+    
+    async def execute_handovers_async(
+        self,
+        transitions: Iterable[Tuple[str, str]],
+        strategy: Optional[HandoverStrategy] = None
+    ) -> List[HandoverMetrics]:
+        """
+        Execute several handovers concurrently.
+        
+        Args:
+            transitions: (source_path, target_path) pairs
+            strategy: Optional override strategy for all of them
             
-            metrics = HandoverMetrics(
-                source_path=source_path,
-                target_path=target_path,
-                strategy=use_strategy,
-                start_time=start_time,
-                end_time=datetime.now(),
-                duration_ms=duration_ms,
-                packets_lost=-1,
-                success=False,
-                error_message=str(e),
-            )
+        Returns:
+            HandoverMetrics for each transition, in order
+        """
+        return list(await asyncio.gather(*(
+            self.execute_handover_async(source, target, strategy)
+            for source, target in transitions
+        )))
+    
+    async def execute_handover_async(
+        self,
+        source_path: str,
+        target_path: str,
+        strategy: Optional[HandoverStrategy] = None
+    ) -> HandoverMetrics:
+        """
+        Execute network handover from source to target path.
+        
+        Coroutine form of execute_handover: the simulated handover yields
+        to the event loop, so concurrent handovers overlap.
+        
+        Args:
+            source_path: Current network path identifier
+            target_path: Target network path identifier
+            strategy: Optional override strategy
             
-            logger.error(f"Handover failed: {e}")
+        Returns:
+            HandoverMetrics with operation details
+        """
+        use_strategy = strategy or self.strategy
+        start_ns = time.time_ns()
+        start_perf = time.perf_counter()
+        
+        logger.info(f"Starting handover: {source_path} -> {target_path} ({use_strategy.value})")
+        
+        try:
+            delay_s, packets_lost = self._plan_handover(use_strategy, source_path, target_path)
+            await asyncio.sleep(delay_s)
+        except Exception as e:
+            return self._complete(source_path, target_path, use_strategy, start_ns, start_perf, error=e)
+        
+        return self._complete(source_path, target_path, use_strategy, start_ns, start_perf, packets_lost)
+    
+    def _complete(
+        self,
+        source_path: str,
+        target_path: str,
+        strategy: HandoverStrategy,
+        start_ns: int,
+        start_perf: float,
+        packets_lost: int = -1,
+        error: Optional[Exception] = None
+    ) -> HandoverMetrics:
+        """Build metrics for a finished handover, record them and notify callbacks."""
+        duration_ms = (time.perf_counter() - start_perf) * 1000
+        
+        metrics = HandoverMetrics.from_ns(
+            source_path=source_path,
+            target_path=target_path,
+            strategy=strategy,
+            start_ns=start_ns,
+            end_ns=time.time_ns(),
+            duration_ms=duration_ms,
+            packets_lost=packets_lost if error is None else -1,
+            success=error is None,
+            error_message=None if error is None else str(error),
+        )
+        
+        if error is None:
+            logger.info(f"Handover complete: {duration_ms:.1f}ms, {packets_lost} packets lost")
+        else:
+            logger.error(f"Handover failed: {error}")
         
         with self._lock:
-            self.handover_history.append(metrics)
+            self._record(metrics)
         
-        for callback in self._callbacks:
-            try:
-                callback(metrics)
-            except Exception as e:
-                logger.error(f"Callback error: {e}")
+        if self._callbacks:
+            self._cb_queue.put(metrics)
         
         return metrics
     
-    def _make_before_break(self, source: str, target: str) -> int:
+    def _plan_handover(self, strategy: HandoverStrategy, source: str, target: str) -> Tuple[float, int]:
+        """Simulated (duration in seconds, packets lost) for a strategy."""
+        if strategy == HandoverStrategy.MAKE_BEFORE_BREAK:
+            return self._make_before_break(source, target)
+        if strategy == HandoverStrategy.BREAK_BEFORE_MAKE:
+            return self._break_before_make(source, target)
+        return self._seamless_handover(source, target)
+    
+    def _make_before_break(self, source: str, target: str) -> Tuple[float, int]:
         """
         Make-before-break handover implementation.
         
         Establishes new connection before dropping old one.
         """
-        # Simulate establishing new connection
-        time.sleep(0.05)  # 50ms to establish
-        
-        # Simulate traffic migration
-        time.sleep(0.03)  # 30ms to migrate
-        
-        # Simulate dropping old connection
-        time.sleep(0.01)  # 10ms to cleanup
-        
-        return 0  # No packets lost with make-before-break
+        # Simulated phases, one 90ms budget:
+        # 50ms establish new connection, 30ms migrate traffic,
+        # 10ms drop old connection
+        return 0.09, 0  # No packets lost with make-before-break
     
-    def _break_before_make(self, source: str, target: str) -> int:
+    def _break_before_make(self, source: str, target: str) -> Tuple[float, int]:
         """
         Break-before-make handover implementation.
         
         Drops old connection before establishing new one.
         """
-        # Simulate dropping old connection
-        time.sleep(0.01)
-        
-        # Gap period (packets may be lost)
-        time.sleep(0.02)
-        
-        # Simulate establishing new connection
-        time.sleep(0.05)
-        
-        return 2  # Some packets lost during gap
+        # Simulated phases, one 80ms budget:
+        # 10ms drop old connection, 20ms gap (packets may be lost),
+        # 50ms establish new connection
+        return 0.08, 2  # Some packets lost during gap
     
-    def _seamless_handover(self, source: str, target: str) -> int:
+    def _seamless_handover(self, source: str, target: str) -> Tuple[float, int]:
         """
         Seamless handover with parallel operation.
         
         Both paths active during transition.
         """
-        # Simulate parallel operation setup
-        time.sleep(0.03)
+        # Simulated phases, one 80ms budget:
+        # 30ms parallel operation setup, 40ms gradual traffic shift,
+        # 10ms cleanup
+        return 0.08, 0  # No packets lost
+    
+    def _record(self, metrics: HandoverMetrics) -> None:
+        """Append a handover to the window and update aggregates (hold _lock)."""
+        history = self.handover_history
+        if len(history) == history.maxlen:
+            self._evict(history[0], self._seq - history.maxlen)
+        
+        history.append(metrics)
+        seq = self._seq
+        self._seq += 1
+        
+        stats = self._stats
+        lifetime = self._lifetime
+        stats['total'] += 1
+        lifetime['total'] += 1
+        if not metrics.success:
+            return
         
-        # Simulate gradual traffic shift
-        time.sleep(0.04)
+        duration = metrics.duration_ms
+        stats['successful'] += 1
+        lifetime['successful'] += 1
+        lifetime['packets_lost'] += metrics.packets_lost
+        stats['sum_ms'] += duration
+        stats['sum_ms_sq'] += duration * duration
+        stats['packets_lost'] += metrics.packets_lost
+        
+        while self._min_window and self._min_window[-1][1] >= duration:
+            self._min_window.pop()
+        self._min_window.append((seq, duration))
+        
+        while self._max_window and self._max_window[-1][1] <= duration:
+            self._max_window.pop()
+        self._max_window.append((seq, duration))
+    
+    def _evict(self, metrics: HandoverMetrics, seq: int) -> None:
+        """Remove the oldest handover's contribution to the aggregates."""
+        stats = self._stats
+        stats['total'] -= 1
+        if not metrics.success:
+            return
         
-        # Simulate cleanup
-        time.sleep(0.01)
+        duration = metrics.duration_ms
+        stats['successful'] -= 1
+        stats['sum_ms'] -= duration
+        stats['sum_ms_sq'] -= duration * duration
+        stats['packets_lost'] -= metrics.packets_lost
         
-        return 0  # No packets lost
+        if self._min_window and self._min_window[0][0] == seq:
+            self._min_window.popleft()
+        if self._max_window and self._max_window[0][0] == seq:
+            self._max_window.popleft()
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copy the aggregates and window min/max; the lock is held only for the copy."""
+        with self._lock:
+            snap = self._stats.copy()
+            snap['min_ms'] = self._min_window[0][1] if self._min_window else 0
+            snap['max_ms'] = self._max_window[0][1] if self._max_window else 0
+            snap['lifetime'] = self._lifetime.copy()
+        return snap
+    
+    @staticmethod
+    def _average_ms(snap: Dict[str, Any]) -> float:
+        """Average successful handover time from an aggregate snapshot."""
+        successful = snap['successful']
+        return snap['sum_ms'] / successful if successful else 0.0
     
     def get_average_handover_time(self) -> float:
         """Get average handover time in milliseconds."""
-        with self._lock:
-            if not self.handover_history:
-                return 0.0
-            
-            successful = [h for h in self.handover_history if h.success]
-            if not successful:
-                return 0.0
-            
-            return sum(h.duration_ms for h in successful) / len(successful)
+        return self._average_ms(self._snapshot())
     
     def get_handover_success_rate(self) -> float:
         """Get handover success rate as percentage."""
-        with self._lock:
-            if not self.handover_history:
-                return 100.0
-            
-            successful = sum(1 for h in self.handover_history if h.success)
-            return (successful / len(self.handover_history)) * 100
+        snap = self._snapshot()
+        if not snap['total']:
+            return 100.0
+        
+        return (snap['successful'] / snap['total']) * 100
     
     def meets_target_latency(self) -> bool:
         """Check if average handover meets target latency."""
         return self.get_average_handover_time() <= self.TARGET_HANDOVER_MS
     
     def register_callback(self, callback: Callable[[HandoverMetrics], None]) -> None:
-        """Register callback for handover events."""
-        self._callbacks.append(callback)
+        """
+        Register callback for handover events.
+        
+        Callbacks are invoked asynchronously on the manager's dispatcher
+        thread, in handover order.
+        """
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+            if self._cb_thread is None:
+                # The thread holds only a weakref, so an unclosed manager
+                # can still be collected; the finalizer then ends it.
+                self._cb_thread = Thread(
+                    target=_pump_callbacks,
+                    args=(weakref.ref(self), self._cb_queue),
+                    name="podx-handover-callbacks",
+                    daemon=True,
+                )
+                self._cb_finalizer = weakref.finalize(self, self._cb_queue.put, _CLOSE)
+                self._cb_thread.start()
+    
+    def wait_for_callbacks(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until callbacks for all handovers so far have run.
+        
+        Returns:
+            False if the timeout expired first
+        """
+        if self._cb_thread is None:
+            return True
+        
+        done = Event()
+        self._cb_queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the callback dispatcher thread.
+        
+        Callbacks already queued are delivered first. A later
+        register_callback starts a new dispatcher.
+        """
+        with self._lock:
+            thread, self._cb_thread = self._cb_thread, None
+            finalizer, self._cb_finalizer = self._cb_finalizer, None
+        
+        if thread is None:
+            return
+        
+        finalizer()
+        thread.join(timeout)
     
     def get_statistics(self) -> Dict:
         """Get comprehensive handover statistics."""
-        with self._lock:
-            if not self.handover_history:
-                return {
-                    'total_handovers': 0,
-                    'successful': 0,
-                    'failed': 0,
-                    'average_duration_ms': 0,
-                    'min_duration_ms': 0,
-                    'max_duration_ms': 0,
-                    'total_packets_lost': 0,
-                    'meets_target': True,
-                }
-            
-            successful = [h for h in self.handover_history if h.success]
-            durations = [h.duration_ms for h in successful]
-            
-            return {
-                'total_handovers': len(self.handover_history),
-                'successful': len(successful),
-                'failed': len(self.handover_history) - len(successful),
-                'average_duration_ms': sum(durations) / len(durations) if durations else 0,
-                'min_duration_ms': min(durations) if durations else 0,
-                'max_duration_ms': max(durations) if durations else 0,
-                'total_packets_lost': sum(h.packets_lost for h in successful),
-                'meets_target': self.meets_target_latency(),
-            }
+        stats = self._snapshot()
+        average = self._average_ms(stats)
+        successful = stats['successful']
+        variance = stats['sum_ms_sq'] / successful - average * average if successful else 0.0
+        
+        return {
+            'total_handovers': stats['total'],
+            'successful': successful,
+            'failed': stats['total'] - successful,
+            'average_duration_ms': average,
+            'min_duration_ms': stats['min_ms'],
+            'max_duration_ms': stats['max_ms'],
+            'stddev_duration_ms': math.sqrt(max(variance, 0.0)),
+            'total_packets_lost': stats['packets_lost'],
+            'meets_target': average <= self.TARGET_HANDOVER_MS,
+            'lifetime_handovers': stats['lifetime']['total'],
+            'lifetime_successful': stats['lifetime']['successful'],
+            'lifetime_packets_lost': stats['lifetime']['packets_lost'],
+        }
 
 
@@ -0,0 +1,119 @@
+"""
+Monitor Scheduler
+=================
+
+Shared timer loop that drives periodic monitor ticks for many managers
+from a single asyncio event loop on one daemon thread.
+"""
+
+import asyncio
+import logging
+from threading import Thread, Event, Lock, get_ident
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MonitorScheduler:
+    """
+    Runs registered tick callbacks on one shared event loop.
+    
+    Each tick returns the number of seconds until it wants to run again
+    (or None to use its registered interval). Ticks run on the scheduler
+    thread, so they must not block.
+    """
+    
+    def __init__(self):
+        """Initialize scheduler (the loop thread starts on first register)."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._start_lock = Lock()
+        self._timers: Dict[int, asyncio.Handle] = {}
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread if it is not running yet."""
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = Thread(
+                    target=self._loop.run_forever,
+                    name="podx-monitor-scheduler",
+                    daemon=True,
+                )
+                self._thread.start()
+                logger.info("Monitor scheduler started")
+            return self._loop
+    
+    def _call_in_loop(self, fn: Callable, *args: Any) -> None:
+        """Run fn on the loop thread and wait for it to finish."""
+        loop = self._ensure_loop()
+        
+        if self._thread.ident == get_ident():
+            fn(*args)
+            return
+        
+        done = Event()
+        
+        def run() -> None:
+            try:
+                fn(*args)
+            finally:
+                done.set()
+        
+        loop.call_soon_threadsafe(run)
+        done.wait(timeout=5)
+    
+    def register(
+        self,
+        owner: Any,
+        tick: Callable[[], Optional[float]],
+        interval: float = 1.0
+    ) -> None:
+        """
+        Start calling tick periodically, beginning immediately.
+        
+        Args:
+            owner: Object the tick belongs to (used as the registration key)
+            tick: Callback returning seconds until its next run, or None
+            interval: Default seconds between ticks
+        """
+        self._call_in_loop(self._add, id(owner), tick, interval)
+    
+    def unregister(self, owner: Any) -> None:
+        """Stop calling an owner's tick; returns once no tick is pending."""
+        if self._loop is None:
+            return
+        self._call_in_loop(self._remove, id(owner))
+    
+    def _add(self, key: int, tick: Callable[[], Optional[float]], interval: float) -> None:
+        self._remove(key)
+        self._timers[key] = self._loop.call_soon(self._run_tick, key, tick, interval)
+    
+    def _remove(self, key: int) -> None:
+        handle = self._timers.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+    
+    def _run_tick(self, key: int, tick: Callable[[], Optional[float]], interval: float) -> None:
+        try:
+            delay = tick()
+        except Exception as e:
+            logger.error(f"Monitor tick error: {e}")
+            delay = None
+        
+        if key in self._timers:
+            delay = interval if delay is None else max(0.0, delay)
+            self._timers[key] = self._loop.call_later(delay, self._run_tick, key, tick, interval)
+
+
+_scheduler: Optional[MonitorScheduler] = None
+_scheduler_lock = Lock()
+
+
+def get_monitor_scheduler() -> MonitorScheduler:
+    """Return the process-wide monitor scheduler."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = MonitorScheduler()
+        return _scheduler
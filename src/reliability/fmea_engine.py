@@ -1,9 +1,98 @@
 import logging
-from typing import Dict, List
+import math
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _binomial_table(groups: Tuple[Tuple[int, int], ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Coefficient and exponent matrices for a set of (n, k) groups.
+    Row g holds C(n_g, i) for k_g <= i <= n_g and 0 elsewhere, with
+    i = 0..max(n); exponents of (1-p) are clipped at 0 in padded columns.
+    """
+    width = max(n for n, _ in groups) + 1
+    i = np.arange(width)
+    coeffs = np.zeros((len(groups), width))
+    for g, (n, k) in enumerate(groups):
+        coeffs[g, k:n + 1] = [math.comb(n, j) for j in range(k, n + 1)]
+    n_col = np.array([n for n, _ in groups])[:, None]
+    return coeffs, i, np.maximum(n_col - i, 0)
+
+
+def k_out_of_n(n: Sequence[int], k: Sequence[int], p_success: np.ndarray) -> np.ndarray:
+    """
+    Probability that at least k of n independent units work, per group.
+    P = sum_{i=k..n} C(n,i) * p^i * (1-p)^(n-i), evaluated for all groups
+    in one array expression.
+    """
+    coeffs, p_exp, q_exp = _binomial_table(tuple(zip(n, k)))
+    p = np.asarray(p_success, dtype=float)[:, None]
+    return (coeffs * p ** p_exp * (1.0 - p) ** q_exp).sum(axis=1)
+
+
+@lru_cache(maxsize=8)
+def _system_availability(
+    component_avail: Tuple[Tuple[str, float], ...],
+    redundancy: Tuple[Tuple[str, int, int], ...],
+) -> float:
+    """
+    Pure system availability calculation behind
+    FMEAEngine.calculate_system_availability.
+    component_avail: (component, availability A) pairs
+    redundancy: (component, n, k) triples
+    """
+    avail = dict(component_avail)
+
+    # 1. Individual availabilities (A), precomputed by the engine
+    components = [c for c, _, _ in redundancy]
+    availability = np.array([avail[c] for c in components])
+
+    # 2. Calculate Redundant Group Availabilities
+    # Probability of System Failure = Sum of Probabilities of failing > (n-k) components
+    
+    # Compute (Need 3 of 4): Fails if < 3 work (i.e., > 1 fail). P(fail) ~ n * (1-A)^2 (approx for high A)
+    # Exact: P(system_success) = P(4 work) + P(3 work)
+    # P(k out of n) = C(n,k) * A^k * (1-A)^(n-k)
+    # All redundancy groups are evaluated together
+    groups = k_out_of_n(
+        [n for _, n, _ in redundancy],
+        [k for _, _, k in redundancy],
+        availability,
+    )
+    sys_avail = dict(zip(components, groups.tolist()))
+
+    # 3. Total System Availability (Series of Subsystems)
+    total_availability = float(groups.prod())
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("System Availability Calculation:")
+        logger.info("  Compute (N+1): %.9f", sys_avail['compute'])
+        logger.info("  Storage (RAID-6): %.9f", sys_avail['storage'])
+        logger.info("  Network (4-path): %.9f", sys_avail['network'])
+        logger.info("  Battery (N+2): %.9f", sys_avail['battery'])
+        logger.info("  Cooling (2N): %.9f", sys_avail['cooling'])
+        logger.info("  TOTAL: %.9f", total_availability)
+    
+    return total_availability
+
+
+def component_availability(rate: float, mttr_hours: float = 2.0) -> float:
+    """
+    Calculate single component availability.
+    A = MTBF / (MTBF + MTTR)
+    MTBF (hours) = 1 / (rate_per_year / 8760)
+    """
+    if rate == 0: return 1.0
+    failures_per_hour = rate / 8760.0
+    mtbf = 1.0 / failures_per_hour
+    return mtbf / (mtbf + mttr_hours)
+
+
 class FMEAEngine:
     """
     Failure Mode and Effects Analysis (FMEA) Engine.
@@ -40,69 +129,53 @@ class FMEAEngine:
             "cooling": {"n": 2, "k": 1}
         }
 
+        # Component availability per failure rate, as (rate, A); an entry
+        # is recomputed only when its rate no longer matches
+        self._mttr_hours = 2.0
+        self._availability: Dict[str, Tuple[float, float]] = {}
+        self._component_availabilities(self._mttr_hours)
+
+    def update_rate(self, component: str, rate: float):
+        """Set a component's failure rate (failures/year)."""
+        self.failure_rates[component] = rate
+        self._availability[component] = (rate, component_availability(rate, self._mttr_hours))
+
+    def _component_availabilities(self, mttr_hours: float) -> Tuple[Tuple[str, float], ...]:
+        """Current (component, A) pairs, refreshing entries whose rate changed."""
+        if mttr_hours != self._mttr_hours:
+            self._mttr_hours = mttr_hours
+            self._availability.clear()
+
+        cache = self._availability
+        for comp, rate in self.failure_rates.items():
+            cached = cache.get(comp)
+            if cached is None or cached[0] != rate:
+                cache[comp] = (rate, component_availability(rate, mttr_hours))
+        return tuple(sorted((comp, cache[comp][1]) for comp in self.failure_rates))
+
     def calculate_component_availability(self, rate: float, mttr_hours: float = 2.0) -> float:
         """
         Calculate single component availability.
         A = MTBF / (MTBF + MTTR)
         MTBF (hours) = 1 / (rate_per_year / 8760)
         """
-        if rate == 0: return 1.0
-        failures_per_hour = rate / 8760.0
-        mtbf = 1.0 / failures_per_hour
-        return mtbf / (mtbf + mttr_hours)
+        return component_availability(rate, mttr_hours)
 
-    def calculate_system_availability(self) -> float:
+    def calculate_system_availability(self, mttr_hours: float = 2.0) -> float:
         """
         Calculate overall system availability considering redundancy.
         Parallel system availability (redundancy):
         Ap = 1 - (1 - A)^n  (for 1-out-of-n)
         For k-out-of-n, it's more complex (Binomial), but for high availability:
         Approximate by calculating probability of failure of the redundant set.
+        Component availabilities are precomputed per failure rate and the
+        result is memoized on them and the redundancy table, so edits to
+        either dict take effect on the next call.
         """
-        
-        # 1. Calculate individual availabilities (A)
-        # Using MTTR < 2 hours as achieved
-        mttr = 2.0 
-        
-        a_compute = self.calculate_component_availability(self.failure_rates["compute"], mttr)
-        a_storage = self.calculate_component_availability(self.failure_rates["storage"], mttr)
-        a_network = self.calculate_component_availability(self.failure_rates["network"], mttr)
-        a_battery = self.calculate_component_availability(self.failure_rates["battery"], mttr)
-        a_cooling = self.calculate_component_availability(self.failure_rates["cooling"], mttr)
-
-        # 2. Calculate Redundant Group Availabilities
-        # Probability of System Failure = Sum of Probabilities of failing > (n-k) components
-        
-        # Compute (Need 3 of 4): Fails if < 3 work (i.e., > 1 fail). P(fail) ~ n * (1-A)^2 (approx for high A)
-        # Exact: P(system_success) = P(4 work) + P(3 work)
-        # P(k out of n) = C(n,k) * A^k * (1-A)^(n-k)
-        
-        def prob_k_out_of_n(n, k, p_success):
-            import math
-            prob = 0.0
-            for i in range(k, n + 1):
-                comb = math.comb(n, i)
-                prob += comb * (p_success ** i) * ((1 - p_success) ** (n - i))
-            return prob
-
-        sys_compute = prob_k_out_of_n(4, 3, a_compute)
-        sys_storage = prob_k_out_of_n(8, 6, a_storage) # RAID-6
-        sys_network = prob_k_out_of_n(4, 1, a_network) # 1 of 4
-        sys_battery = prob_k_out_of_n(4, 2, a_battery) # 2 of 4
-        sys_cooling = prob_k_out_of_n(2, 1, a_cooling) # 1 of 2
-
-        # 3. Total System Availability (Series of Subsystems)
-        total_availability = sys_compute * sys_storage * sys_network * sys_battery * sys_cooling
-        
-        logger.info(f"System Availability Calculation:")
-        logger.info(f"  Compute (N+1): {sys_compute:.9f}")
-        logger.info(f"  Storage (RAID-6): {sys_storage:.9f}")
-        logger.info(f"  Network (4-path): {sys_network:.9f}")
-        logger.info(f"  Battery (N+2): {sys_battery:.9f}")
-        logger.info(f"  Cooling (2N): {sys_cooling:.9f}")
-        logger.info(f"  TOTAL: {total_availability:.9f}")
-        
-        return total_availability
+        return _system_availability(
+            self._component_availabilities(mttr_hours),
+            tuple(sorted((c, g["n"], g["k"]) for c, g in self.redundancy.items())),
+        )
 
     def validate_target(self) -> bool:
         """Validate if system meets 99.99% availability target."""
@@ -111,7 +184,7 @@ class FMEAEngine:
         
         downtime_minutes_per_year = (1.0 - availability) * 365 * 24 * 60
         
-        logger.info(f"Projected Annual Downtime: {downtime_minutes_per_year:.2f} minutes")
+        logger.info("Projected Annual Downtime: %.2f minutes", downtime_minutes_per_year)
         
         if availability >= target:
             logger.info("SUCCESS: 99.99% Availability Target MET.")
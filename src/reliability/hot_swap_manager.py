@@ -1,8 +1,9 @@
 import logging
-from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Set
 from enum import Enum
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ModuleState(Enum):
@@ -12,57 +13,102 @@ class ModuleState(Enum):
     REMOVED = "removed"
     INSERTED = "inserted"
 
+@dataclass(slots=True)
+class Module:
+    """A hot-swappable module tracked by HotSwapManager."""
+    type: str
+    state: Optional[ModuleState] = None
+    health_score: float = 100.0
+
 class HotSwapManager:
     """
     Manages hot-swappable modules, workload migration, and graceful degradation.
     """
 
     def __init__(self):
-        self.modules = {}
+        self.modules: Dict[str, Module] = {}
         self.workloads = {} # module_id -> list of workloads
+        # Healthy module index, kept in sync by _set_state. _rotation is a
+        # round-robin queue of migration targets; entries for modules that
+        # left HEALTHY are dropped lazily when they reach the front.
+        self._healthy: Set[str] = set()
+        self._rotation: Deque[str] = deque()
+        self._in_rotation: Set[str] = set()
+        # Already-degraded modules with new readings, re-shed on the next flush()
+        self._dirty: Set[str] = set()
+
+    def _set_state(self, module_id: str, state: ModuleState):
+        """Set a module's state and update the healthy index."""
+        self.modules[module_id].state = state
+        if state is ModuleState.HEALTHY:
+            self._healthy.add(module_id)
+            if module_id not in self._in_rotation:
+                self._in_rotation.add(module_id)
+                self._rotation.append(module_id)
+        else:
+            self._healthy.discard(module_id)
 
     def register_module(self, module_id: str, module_type: str):
         """Register a new module in the system."""
-        self.modules[module_id] = {
-            "type": module_type,
-            "state": ModuleState.HEALTHY,
-            "health_score": 100.0
-        }
+        self.modules[module_id] = Module(module_type)
+        self._set_state(module_id, ModuleState.HEALTHY)
         self.workloads[module_id] = []
-        logger.info(f"Module {module_id} ({module_type}) registered.")
+        logger.info("Module %s (%s) registered.", module_id, module_type)
 
     def update_health(self, module_id: str, health_score: float):
-        """Update health score of a module."""
+        """
+        Update health score of a module.
+        A failed module's workloads are evacuated immediately, and a module
+        entering DEGRADED sheds non-critical load immediately. Further
+        readings while already degraded are debounced into the next flush().
+        """
         if module_id in self.modules:
-            self.modules[module_id]["health_score"] = health_score
-            if health_score < 50:
-                self.modules[module_id]["state"] = ModuleState.DEGRADED
-                self._trigger_graceful_degradation(module_id)
-            elif health_score == 0:
-                self.modules[module_id]["state"] = ModuleState.FAILED
+            module = self.modules[module_id]
+            module.health_score = health_score
+            if health_score <= 0:
+                self._set_state(module_id, ModuleState.FAILED)
+                self._dirty.discard(module_id)
                 self._evacuate_workloads(module_id)
+            elif health_score < 50:
+                if module.state is ModuleState.DEGRADED:
+                    self._dirty.add(module_id)
+                else:
+                    self._set_state(module_id, ModuleState.DEGRADED)
+                    self._trigger_graceful_degradation(module_id)
+
+    def flush(self):
+        """
+        Shed non-critical load again from modules that reported degraded
+        readings since the last flush, once per module however many readings
+        arrived (e.g. work assigned after the initial shed). Optional; call
+        from the owner's periodic tick.
+        """
+        dirty, self._dirty = self._dirty, set()
+        for module_id in dirty:
+            if self.modules[module_id].state is ModuleState.DEGRADED:
+                self._trigger_graceful_degradation(module_id)
 
     def handle_module_removal(self, module_id: str):
         """Handle physical removal of a module."""
         if module_id in self.modules:
-            logger.warning(f"Module {module_id} removed!")
-            self.modules[module_id]["state"] = ModuleState.REMOVED
+            logger.warning("Module %s removed!", module_id)
+            self._set_state(module_id, ModuleState.REMOVED)
             self._evacuate_workloads(module_id)
 
     def handle_module_insertion(self, module_id: str, module_type: str):
         """Handle physical insertion of a replacement module."""
-        logger.info(f"Module {module_id} inserted.")
+        logger.info("Module %s inserted.", module_id)
         self.register_module(module_id, module_type)
-        self.modules[module_id]["state"] = ModuleState.INSERTED
+        self._set_state(module_id, ModuleState.INSERTED)
         # Verify and activate
         self._verify_and_activate(module_id)
 
     def _verify_and_activate(self, module_id: str):
         """Verify module integrity and activate it."""
         # Simulation of hardware handshake and self-test
-        logger.info(f"Verifying module {module_id}...")
-        self.modules[module_id]["state"] = ModuleState.HEALTHY
-        logger.info(f"Module {module_id} is now ACTIVE.")
+        logger.info("Verifying module %s...", module_id)
+        self._set_state(module_id, ModuleState.HEALTHY)
+        logger.info("Module %s is now ACTIVE.", module_id)
 
     def _evacuate_workloads(self, module_id: str):
         """Migrate workloads from a failed/removed module to a healthy one."""
@@ -71,27 +117,52 @@ class HotSwapManager:
 
         target_module = self._find_healthy_module(exclude=module_id)
         if target_module:
-            logger.info(f"Migrating workloads from {module_id} to {target_module}...")
+            logger.info("Migrating workloads from %s to %s...", module_id, target_module)
             # Move workloads
             self.workloads[target_module].extend(self.workloads[module_id])
             self.workloads[module_id] = []
             logger.info("Migration complete.")
         else:
-            logger.critical(f"No healthy modules available to take over workloads from {module_id}!")
+            logger.critical("No healthy modules available to take over workloads from %s!", module_id)
 
     def _trigger_graceful_degradation(self, module_id: str):
         """Reduce load on a degraded module."""
-        logger.warning(f"Module {module_id} is degraded. Reducing load.")
+        logger.warning("Module %s is degraded. Reducing load.", module_id)
         # Logic to shed non-critical tasks
         current_load = self.workloads[module_id]
-        # Keep only critical tasks (simulated)
-        self.workloads[module_id] = [w for w in current_load if w.get("priority") == "critical"]
-        logger.info(f"Graceful degradation applied to {module_id}.")
+        kept = []
+        shed = []
+        for w in current_load:
+            if w.get("priority") == "critical":
+                kept.append(w)
+            else:
+                shed.append(w)
+
+        if shed:
+            # Re-home shed tasks rather than dropping them
+            target_module = self._find_healthy_module(exclude=module_id)
+            if target_module:
+                # Keep only critical tasks (simulated), in place
+                current_load[:] = kept
+                self.workloads[target_module].extend(shed)
+                logger.info("Moved %s non-critical workloads from %s to %s.", len(shed), module_id, target_module)
+            else:
+                logger.warning("No healthy module to take non-critical workloads from %s; keeping them.", module_id)
+        logger.info("Graceful degradation applied to %s.", module_id)
 
     def _find_healthy_module(self, exclude: str) -> Optional[str]:
-        """Find a healthy module to accept workloads."""
-        for mid, data in self.modules.items():
-            if mid != exclude and data["state"] == ModuleState.HEALTHY:
+        """
+        Find a healthy module to accept workloads.
+        Targets are taken round-robin so successive migrations spread load.
+        """
+        rotation = self._rotation
+        for _ in range(len(rotation)):
+            mid = rotation.popleft()
+            if mid not in self._healthy:
+                self._in_rotation.discard(mid)
+                continue
+            rotation.append(mid)
+            if mid != exclude:
                 return mid
         return None
 
@@ -1,64 +1,221 @@
+import heapq
+import itertools
 import logging
+import numbers
 import random
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Mock anomaly model: score contributions when a reading exceeds its threshold
+TEMPERATURE_THRESHOLD = 80
+TEMPERATURE_WEIGHT = 0.5
+VIBRATION_THRESHOLD = 5.0
+VIBRATION_WEIGHT = 0.4
+
+
+class TelemetryRing:
+    """
+    Fixed-size telemetry history for one component, stored as parallel
+    arrays (one per metric) instead of a dict per sample.
+    Metrics missing from a sample are recorded as NaN.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts_ns = np.zeros(capacity, dtype='i8')  # time.time_ns() stamps
+        self.metrics: Dict[str, np.ndarray] = {}
+        self.count = 0  # Total samples written
+
+    def append(self, ts_ns: int, metrics: Dict[str, float]) -> int:
+        """Write one sample and return its slot index."""
+        i = self.count % self.capacity
+        self.ts_ns[i] = ts_ns
+        for name, arr in self.metrics.items():
+            arr[i] = metrics.get(name, np.nan)
+        for name, value in metrics.items():
+            if name not in self.metrics:
+                arr = self.metrics[name] = np.full(self.capacity, np.nan, dtype='f4')
+                arr[i] = value
+        self.count += 1
+        return i
+
+    def extend(self, ts_ns: np.ndarray, metrics: Dict[str, np.ndarray]):
+        """Write a batch of samples; only the last capacity of them are kept."""
+        n = len(ts_ns)
+        skip = max(0, n - self.capacity)
+        idx = (self.count + np.arange(skip, n)) % self.capacity
+        self.ts_ns[idx] = ts_ns[skip:]
+        for name, arr in self.metrics.items():
+            values = metrics.get(name)
+            arr[idx] = np.nan if values is None else values[skip:]
+        for name, values in metrics.items():
+            if name not in self.metrics:
+                arr = self.metrics[name] = np.full(self.capacity, np.nan, dtype='f4')
+                arr[idx] = values[skip:]
+        self.count += n
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def timestamps(self) -> List[datetime]:
+        """Retained sample times, oldest first, rendered as datetimes."""
+        if self.count <= self.capacity:
+            ts_ns = self.ts_ns[:self.count]
+        else:
+            i = self.count % self.capacity
+            ts_ns = np.concatenate((self.ts_ns[i:], self.ts_ns[:i]))
+        return [datetime.fromtimestamp(ns / 1e9) for ns in ts_ns.tolist()]
+
+    def series(self, name: str) -> np.ndarray:
+        """Retained values of a metric, oldest first."""
+        arr = self.metrics.get(name)
+        if arr is None:
+            return np.full(len(self), np.nan, dtype='f4')
+        if self.count <= self.capacity:
+            return arr[:self.count].copy()
+        i = self.count % self.capacity
+        return np.concatenate((arr[i:], arr[:i]))
+
+
 class PredictiveMaintenance:
     """
     Implements predictive maintenance using ML-based anomaly detection
     to provide advance failure warnings and schedule maintenance.
     """
 
-    def __init__(self):
-        self.telemetry_history = []
+    HISTORY_SIZE = 4096  # Samples retained per component
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self.history_size = history_size
+        self.telemetry: Dict[str, TelemetryRing] = {}  # component_id -> ring
         self.anomaly_threshold = 0.85
-        self.maintenance_schedule = []
+        # Min-heap of (scheduled timestamp, sequence, task); the sequence
+        # breaks ties so task dicts are never compared
+        self._sched_heap: List[Tuple[float, int, Dict]] = []
+        self._sched_seq = itertools.count()
+
+    @property
+    def telemetry_history(self) -> List[Dict]:
+        """
+        Read-only view of the retained telemetry in its original shape:
+        one {"component_id", "metrics", "timestamp"} dict per sample,
+        oldest first. Built on each access, so prefer telemetry for
+        anything hot.
+        """
+        history = []
+        for component_id, ring in self.telemetry.items():
+            columns = {name: ring.series(name).tolist() for name in ring.metrics}
+            for i, timestamp in enumerate(ring.timestamps()):
+                history.append({
+                    "component_id": component_id,
+                    "metrics": {
+                        name: values[i]
+                        for name, values in columns.items()
+                        if values[i] == values[i]  # skip NaN (not reported)
+                    },
+                    "timestamp": timestamp,
+                })
+        history.sort(key=lambda point: point["timestamp"])
+        return history
+
+    @property
+    def maintenance_schedule(self) -> List[Dict]:
+        """Read-only list of scheduled tasks, as get_maintenance_schedule()."""
+        return self.get_maintenance_schedule()
 
     def ingest_telemetry(self, component_id: str, metrics: Dict[str, float]):
-        """Ingest sensor telemetry for analysis."""
-        data_point = {
-            "component_id": component_id,
-            "metrics": metrics,
-            "timestamp": datetime.now()
-        }
-        self.telemetry_history.append(data_point)
-        self._analyze_telemetry(data_point)
+        """
+        Ingest sensor telemetry for analysis.
+
+        Raises:
+            TypeError: if a metric value is not a real number
+        """
+        for name, value in metrics.items():
+            if not isinstance(value, numbers.Real):
+                raise TypeError(
+                    f"Telemetry metric {name!r} for {component_id} must be numeric, "
+                    f"got {type(value).__name__}"
+                )
+        ring = self.telemetry.get(component_id)
+        if ring is None:
+            ring = self.telemetry[component_id] = TelemetryRing(self.history_size)
+        ring.append(time.time_ns(), metrics)
+        self._analyze_telemetry(
+            component_id,
+            metrics.get("temperature", np.nan),
+            metrics.get("vibration", np.nan),
+        )
 
-    def _analyze_telemetry(self, data_point: Dict):
+    def ingest_batch(
+        self,
+        component_id: str,
+        temperature: np.ndarray,
+        vibration: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Ingest a batch of temperature/vibration samples for one component.
+        Scores the whole batch in one vectorized pass and only raises
+        warnings for the samples above the anomaly threshold.
+        Returns the anomaly score of each sample.
+        """
+        temperature = np.asarray(temperature, dtype='f4')
+        vibration = np.asarray(vibration, dtype='f4')
+
+        ring = self.telemetry.get(component_id)
+        if ring is None:
+            ring = self.telemetry[component_id] = TelemetryRing(self.history_size)
+        ring.extend(
+            np.full(len(temperature), time.time_ns(), dtype='i8'),
+            {"temperature": temperature, "vibration": vibration},
+        )
+
+        scores = self._mock_ml_inference_batch(temperature, vibration)
+        for i in np.flatnonzero(scores > self.anomaly_threshold):
+            self._trigger_failure_warning(component_id, float(scores[i]))
+        return scores
+
+    def _analyze_telemetry(self, component_id: str, temperature: float, vibration: float):
         """
         Run ML-based anomaly detection on telemetry.
         (Simulated logic for demonstration)
         """
-        component_id = data_point["component_id"]
-        metrics = data_point["metrics"]
-        
         # Simulated ML inference: Calculate anomaly score based on metrics
         # Higher score = higher probability of failure
-        anomaly_score = self._mock_ml_inference(metrics)
+        anomaly_score = self._mock_ml_inference(temperature, vibration)
         
         if anomaly_score > self.anomaly_threshold:
             self._trigger_failure_warning(component_id, anomaly_score)
 
-    def _mock_ml_inference(self, metrics: Dict[str, float]) -> float:
-        """Mock ML model returning a failure probability."""
+    def _mock_ml_inference(self, temperature: float, vibration: float) -> float:
+        """Mock ML model returning a failure probability (NaN = not reported)."""
         # In a real system, this would be a trained model (e.g., Isolation Forest, LSTM)
         # Here we simulate based on 'temperature' or 'vibration' if present
         score = 0.0
-        if "temperature" in metrics and metrics["temperature"] > 80:
-            score += 0.5
-        if "vibration" in metrics and metrics["vibration"] > 5.0:
-            score += 0.4
+        if temperature > TEMPERATURE_THRESHOLD:
+            score += TEMPERATURE_WEIGHT
+        if vibration > VIBRATION_THRESHOLD:
+            score += VIBRATION_WEIGHT
         return min(score, 1.0)
 
+    def _mock_ml_inference_batch(self, temperature: np.ndarray, vibration: np.ndarray) -> np.ndarray:
+        """Vectorized _mock_ml_inference over arrays of readings."""
+        score = (
+            TEMPERATURE_WEIGHT * (temperature > TEMPERATURE_THRESHOLD)
+            + VIBRATION_WEIGHT * (vibration > VIBRATION_THRESHOLD)
+        )
+        return np.minimum(score, 1.0)
+
     def _trigger_failure_warning(self, component_id: str, probability: float):
         """
         Trigger a 48-72 hour advance failure warning.
         """
-        logger.warning(f"PREDICTIVE ALERT: Component {component_id} shows signs of impending failure! (Prob: {probability:.2f})")
-        logger.info(f"Estimated time to failure: 48-72 hours.")
+        logger.warning("PREDICTIVE ALERT: Component %s shows signs of impending failure! (Prob: %.2f)", component_id, probability)
+        logger.info("Estimated time to failure: 48-72 hours.")
         
         self._schedule_proactive_intervention(component_id)
 
@@ -71,8 +228,17 @@ class PredictiveMaintenance:
             "scheduled_time": scheduled_time,
             "priority": "HIGH"
         }
-        self.maintenance_schedule.append(maintenance_task)
-        logger.info(f"Maintenance scheduled for {component_id} at {scheduled_time}.")
+        heapq.heappush(self._sched_heap, (scheduled_time.timestamp(), next(self._sched_seq), maintenance_task))
+        logger.info("Maintenance scheduled for %s at %s.", component_id, scheduled_time)
 
     def get_maintenance_schedule(self) -> List[Dict]:
-        return self.maintenance_schedule
+        """Scheduled maintenance tasks in chronological order."""
+        return [task for _, _, task in sorted(self._sched_heap)]
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[Dict]:
+        """Remove and return tasks scheduled at or before now, earliest first."""
+        cutoff = (now or datetime.now()).timestamp()
+        due = []
+        while self._sched_heap and self._sched_heap[0][0] <= cutoff:
+            due.append(heapq.heappop(self._sched_heap)[2])
+        return due
@@ -1,8 +1,9 @@
-from typing import List, Dict, Any
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict
 from enum import Enum
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class ComponentStatus(Enum):
@@ -11,6 +12,39 @@ class ComponentStatus(Enum):
     FAILED = "failed"
     MAINTENANCE = "maintenance"
 
+@dataclass(slots=True)
+class ComputeModule:
+    """A compute node in the N+1 pool."""
+    id: str
+    status: ComponentStatus
+    role: str
+
+@dataclass(slots=True)
+class Disk:
+    """A member disk of the RAID-6 array."""
+    id: int
+    status: ComponentStatus
+
+@dataclass(slots=True)
+class WANPath:
+    """An independent WAN uplink."""
+    id: str
+    provider: str
+    status: ComponentStatus
+
+@dataclass(slots=True)
+class BatteryBank:
+    """A battery bank in the N+2 set."""
+    id: str
+    status: ComponentStatus
+    capacity_percent: float = 100
+
+@dataclass(slots=True)
+class CoolingSystem:
+    """One of the dual cooling systems."""
+    id: str
+    status: ComponentStatus
+
 class RedundancyManager:
     """
     Manages hardware redundancy configurations to ensure high availability.
@@ -20,6 +54,8 @@ class RedundancyManager:
     - 4 independent WAN paths
     - N+2 battery banks
     - Dual redundant cooling systems
+    Component status changes must go through set_state so the per-group
+    status counts used by the health checks stay current.
     """
 
     def __init__(self, compute_nodes: int = 4, storage_disks: int = 8):
@@ -31,15 +67,15 @@ class RedundancyManager:
             "raid_level": "RAID-6",
             "total_disks": storage_disks,
             "min_disks_required": storage_disks - 2,
-            "disks": [{"id": i, "status": ComponentStatus.ACTIVE} for i in range(storage_disks)]
+            "disks": [Disk(i, ComponentStatus.ACTIVE) for i in range(storage_disks)]
         }
         
         # 4 Independent WAN Paths
         self.wan_paths = [
-            {"id": "wan_1", "provider": "ISP_A", "status": ComponentStatus.ACTIVE},
-            {"id": "wan_2", "provider": "ISP_B", "status": ComponentStatus.ACTIVE},
-            {"id": "wan_3", "provider": "Satellite", "status": ComponentStatus.STANDBY},
-            {"id": "wan_4", "provider": "5G_Backup", "status": ComponentStatus.STANDBY}
+            WANPath("wan_1", "ISP_A", ComponentStatus.ACTIVE),
+            WANPath("wan_2", "ISP_B", ComponentStatus.ACTIVE),
+            WANPath("wan_3", "Satellite", ComponentStatus.STANDBY),
+            WANPath("wan_4", "5G_Backup", ComponentStatus.STANDBY)
         ]
         
         # N+2 Battery Banks
@@ -47,70 +83,97 @@ class RedundancyManager:
         
         # Dual Redundant Cooling
         self.cooling_systems = [
-            {"id": "cooling_primary", "status": ComponentStatus.ACTIVE},
-            {"id": "cooling_secondary", "status": ComponentStatus.STANDBY}
+            CoolingSystem("cooling_primary", ComponentStatus.ACTIVE),
+            CoolingSystem("cooling_secondary", ComponentStatus.STANDBY)
         ]
 
-    def _initialize_compute(self, count: int) -> List[Dict[str, Any]]:
+        self._groups = {
+            "compute": self.compute_modules,
+            "disks": self.storage_config["disks"],
+            "wan": self.wan_paths,
+            "battery": self.battery_banks,
+            "cooling": self.cooling_systems,
+        }
+        # Status counts per group, maintained by set_state
+        self._counts: Dict[str, Counter] = {
+            group: Counter(c.status for c in components)
+            for group, components in self._groups.items()
+        }
+
+    def set_state(self, group: str, idx: int, status: ComponentStatus):
+        """
+        Change one component's status.
+        group: "compute", "disks", "wan", "battery" or "cooling"
+        idx: Position of the component within its group
+        """
+        component = self._groups[group][idx]
+        counts = self._counts[group]
+        counts[component.status] -= 1
+        counts[status] += 1
+        component.status = status
+
+    def _initialize_compute(self, count: int) -> List[ComputeModule]:
         """Initialize N+1 compute modules."""
         modules = []
         for i in range(count):
-            modules.append({
-                "id": f"compute_{i}",
-                "status": ComponentStatus.ACTIVE if i < count - 1 else ComponentStatus.STANDBY,
-                "role": "worker" if i < count - 1 else "spare"
-            })
+            modules.append(ComputeModule(
+                id=f"compute_{i}",
+                status=ComponentStatus.ACTIVE if i < count - 1 else ComponentStatus.STANDBY,
+                role="worker" if i < count - 1 else "spare"
+            ))
         return modules
 
-    def _initialize_batteries(self, required: int, redundancy: int) -> List[Dict[str, Any]]:
+    def _initialize_batteries(self, required: int, redundancy: int) -> List[BatteryBank]:
         """Initialize N+2 battery banks."""
         total = required + redundancy
         banks = []
         for i in range(total):
-            banks.append({
-                "id": f"battery_{i}",
-                "status": ComponentStatus.ACTIVE, # All active for load balancing usually, or some standby
-                "capacity_percent": 100
-            })
+            banks.append(BatteryBank(
+                id=f"battery_{i}",
+                status=ComponentStatus.ACTIVE, # All active for load balancing usually, or some standby
+                capacity_percent=100
+            ))
         return banks
 
     def check_compute_health(self) -> bool:
         """Verify N+1 compute redundancy."""
-        active = sum(1 for m in self.compute_modules if m["status"] == ComponentStatus.ACTIVE)
-        standby = sum(1 for m in self.compute_modules if m["status"] == ComponentStatus.STANDBY)
+        counts = self._counts["compute"]
+        active = counts[ComponentStatus.ACTIVE]
+        standby = counts[ComponentStatus.STANDBY]
         # Assuming we need len - 1 active
         required = len(self.compute_modules) - 1
         is_healthy = active >= required or (active + standby) >= required
-        logger.info(f"Compute Health: {'OK' if is_healthy else 'CRITICAL'} (Active: {active}, Standby: {standby})")
+        logger.info("Compute Health: %s (Active: %s, Standby: %s)", 'OK' if is_healthy else 'CRITICAL', active, standby)
         return is_healthy
 
     def check_storage_health(self) -> bool:
         """Verify RAID-6 storage integrity (can survive 2 failures)."""
-        active_disks = sum(1 for d in self.storage_config["disks"] if d["status"] == ComponentStatus.ACTIVE)
+        active_disks = self._counts["disks"][ComponentStatus.ACTIVE]
         is_healthy = active_disks >= self.storage_config["min_disks_required"]
-        logger.info(f"Storage Health (RAID-6): {'OK' if is_healthy else 'CRITICAL'} (Active Disks: {active_disks}/{self.storage_config['total_disks']})")
+        logger.info("Storage Health (RAID-6): %s (Active Disks: %s/%s)", 'OK' if is_healthy else 'CRITICAL', active_disks, self.storage_config['total_disks'])
         return is_healthy
 
     def check_wan_redundancy(self) -> bool:
         """Verify at least one WAN path is active."""
-        active_paths = sum(1 for p in self.wan_paths if p["status"] == ComponentStatus.ACTIVE)
+        active_paths = self._counts["wan"][ComponentStatus.ACTIVE]
         is_healthy = active_paths >= 1
-        logger.info(f"WAN Health: {'OK' if is_healthy else 'CRITICAL'} (Active Paths: {active_paths}/4)")
+        logger.info("WAN Health: %s (Active Paths: %s/4)", 'OK' if is_healthy else 'CRITICAL', active_paths)
         return is_healthy
 
     def check_power_redundancy(self) -> bool:
         """Verify N+2 battery redundancy."""
         # Simplified check: ensure we haven't lost more than 2
-        failed = sum(1 for b in self.battery_banks if b["status"] == ComponentStatus.FAILED)
+        failed = self._counts["battery"][ComponentStatus.FAILED]
         is_healthy = failed <= 2
-        logger.info(f"Power Health: {'OK' if is_healthy else 'CRITICAL'} (Failed Banks: {failed})")
+        logger.info("Power Health: %s (Failed Banks: %s)", 'OK' if is_healthy else 'CRITICAL', failed)
         return is_healthy
 
     def check_cooling_redundancy(self) -> bool:
         """Verify cooling redundancy."""
-        operational = sum(1 for c in self.cooling_systems if c["status"] in [ComponentStatus.ACTIVE, ComponentStatus.STANDBY])
+        counts = self._counts["cooling"]
+        operational = counts[ComponentStatus.ACTIVE] + counts[ComponentStatus.STANDBY]
         is_healthy = operational >= 1
-        logger.info(f"Cooling Health: {'OK' if is_healthy else 'CRITICAL'} (Operational: {operational}/2)")
+        logger.info("Cooling Health: %s (Operational: %s/2)", 'OK' if is_healthy else 'CRITICAL', operational)
         return is_healthy
 
     def get_system_status(self) -> Dict[str, bool]:
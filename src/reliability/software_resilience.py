@@ -1,10 +1,37 @@
 import time
 import logging
+import pickle
+import threading
+import weakref
 from typing import Dict, Any, Optional
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _run_watchdog(layer_ref: "weakref.ref", fed: threading.Event, stop: threading.Event, timeout: float):
+    """
+    Watchdog thread: wakes only on a feed or when the timeout expires.
+    
+    Holds the layer through a weak reference, so an abandoned layer is
+    collected and its finalizer stops the thread.
+    """
+    while not stop.is_set():
+        if fed.wait(timeout):
+            fed.clear()
+            continue
+        layer = layer_ref()
+        if layer is None:
+            return
+        layer._expire_watchdog()
+        del layer
+
+
+def _stop_watchdog(fed: threading.Event, stop: threading.Event):
+    """Wake the watchdog thread and make it exit."""
+    stop.set()
+    fed.set()
+
+
 class ResilienceLayer:
     """
     Manages software resilience including distributed control plane,
@@ -31,62 +58,104 @@ class ResilienceLayer:
         self.last_checkpoint_time = time.time()
         self.checkpoints = {}
         
-        # Hardware Watchdog
+        # Hardware Watchdog: once armed (start_watchdog() or the first
+        # feed), a daemon thread blocks on _fed for up to the timeout and
+        # flags _timed_out if no feed arrives in that window
         self.watchdog_enabled = True
         self.watchdog_timeout_seconds = 10
-        self.last_heartbeat = time.time()
+        self._fed = threading.Event()
+        self._timed_out = False
+        self._watchdog_thread: Optional[threading.Thread] = None
+        self._watchdog_finalizer: Optional[weakref.finalize] = None
+
+    def __enter__(self) -> "ResilienceLayer":
+        self.start_watchdog()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop_watchdog()
 
     def check_k8s_health(self) -> bool:
         """Verify Kubernetes control plane health."""
         # Simulated check
         healthy = self.k8s_config["control_plane_nodes"] >= 3 and self.k8s_config["etcd_members"] >= 3
-        logger.info(f"K8s Control Plane: {'HEALTHY' if healthy else 'DEGRADED'}")
+        logger.info("K8s Control Plane: %s", 'HEALTHY' if healthy else 'DEGRADED')
         return healthy
 
     def check_minio_replication(self) -> bool:
         """Verify MinIO 3-way replication."""
         # Simulated check
         synced = self.minio_config["replication_factor"] == 3 and self.minio_config["sync_status"] == "synced"
-        logger.info(f"MinIO Replication: {'SYNCED' if synced else 'OUT_OF_SYNC'}")
+        logger.info("MinIO Replication: %s", 'SYNCED' if synced else 'OUT_OF_SYNC')
         return synced
 
     def perform_checkpoint(self, app_id: str, state: Dict[str, Any]) -> bool:
         """
         Perform application checkpoint.
         Should be called every 60 seconds.
+        The state is serialized at checkpoint time, so later changes to the
+        caller's dict do not alter the saved checkpoint.
         """
         current_time = time.time()
         if current_time - self.last_checkpoint_time >= self.checkpoint_interval_seconds:
             self.checkpoints[app_id] = {
-                "state": state,
+                "blob": pickle.dumps(state, protocol=5),
                 "timestamp": current_time
             }
             self.last_checkpoint_time = current_time
-            logger.info(f"Checkpoint saved for {app_id} at {current_time}")
+            logger.info("Checkpoint saved for %s at %s", app_id, current_time)
             return True
         return False
 
     def restart_application(self, app_id: str) -> Optional[Dict[str, Any]]:
         """Restart application from last checkpoint."""
         if app_id in self.checkpoints:
-            logger.info(f"Restoring {app_id} from checkpoint.")
-            return self.checkpoints[app_id]["state"]
-        logger.warning(f"No checkpoint found for {app_id}.")
+            logger.info("Restoring %s from checkpoint.", app_id)
+            return pickle.loads(self.checkpoints[app_id]["blob"])
+        logger.warning("No checkpoint found for %s.", app_id)
         return None
 
+    def start_watchdog(self):
+        """Arm the watchdog thread; a no-op if it is already running."""
+        if self._watchdog_thread is not None:
+            return
+        stop = threading.Event()
+        self._fed.clear()
+        self._watchdog_thread = threading.Thread(
+            target=_run_watchdog,
+            args=(weakref.ref(self), self._fed, stop, self.watchdog_timeout_seconds),
+            name="podx-watchdog",
+            daemon=True,
+        )
+        # Stops the thread if the layer is dropped without stop_watchdog()
+        self._watchdog_finalizer = weakref.finalize(self, _stop_watchdog, self._fed, stop)
+        self._watchdog_thread.start()
+
     def feed_watchdog(self):
-        """Reset the hardware watchdog timer."""
+        """Reset the hardware watchdog timer, arming it on the first feed."""
         if self.watchdog_enabled:
-            self.last_heartbeat = time.time()
+            self.start_watchdog()
+            self._timed_out = False
+            self._fed.set()
             logger.debug("Watchdog fed.")
 
     def check_watchdog(self) -> bool:
         """Check if watchdog has timed out (simulating hardware check)."""
         if not self.watchdog_enabled:
             return True
-        
-        elapsed = time.time() - self.last_heartbeat
-        if elapsed > self.watchdog_timeout_seconds:
+        return not self._timed_out
+
+    def stop_watchdog(self):
+        """Stop the watchdog thread, if running."""
+        thread = self._watchdog_thread
+        if thread is None:
+            return
+        self._watchdog_finalizer()
+        thread.join()
+        self._watchdog_thread = None
+
+    def _expire_watchdog(self):
+        """Called by the watchdog thread when no feed arrived in time."""
+        if self.watchdog_enabled and not self._timed_out:
+            self._timed_out = True
             logger.critical("WATCHDOG TIMEOUT! System hang detected.")
-            return False
-        return True
@@ -1,25 +1,180 @@
 import os
 import logging
 import hashlib
+import hmac
 import base64
-from typing import Tuple, Optional
+import ctypes
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from typing import Iterable, List, Tuple, Optional
 
 # Attempt to import standard crypto libraries. 
 # If not available, we will use standard library or mock for the purpose of this architecture demonstration.
 try:
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.primitives.asymmetric import rsa, ec
-    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives import serialization
     from cryptography.hazmat.backends import default_backend
     CRYPTO_LIB_AVAILABLE = True
 except ImportError:
     CRYPTO_LIB_AVAILABLE = False
     logging.warning("Cryptography library not found. Falling back to simulation/mocks.")
 
+# liboqs-python provides real CRYSTALS-Kyber; without it the KEM is simulated.
+try:
+    import oqs
+    OQS_AVAILABLE = True
+except (ImportError, RuntimeError):
+    OQS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+GCM_TAG_SIZE = 16
+AES_CONTEXT_CACHE_SIZE = 32  # AESGCM contexts kept per CryptoEngine
+RSA_KEY_SIZE = 4096
+RSA_PUBLIC_EXPONENT = 65537
+# liboqs mechanism names, most preferred first: ML-KEM-768 (FIPS 203)
+# replaces Kyber768 in newer builds; both use the sizes below
+OQS_KEM_ALGS = ("ML-KEM-768", "Kyber768")
+
+# Kyber768 sizes (bytes)
+KYBER_PK_BYTES = 1184
+KYBER_SK_BYTES = 2400
+KYBER_CT_BYTES = 1088
+KYBER_SS_BYTES = 32
+
+# PQClean builds, most preferred first; the AVX2 build needs AVX2 at runtime.
+PQCLEAN_KYBER_LIBS = (
+    ("libpqclean_kyber768_avx2.so", "PQCLEAN_KYBER768_AVX2", "avx2"),
+    ("libpqclean_kyber768_clean.so", "PQCLEAN_KYBER768_CLEAN", None),
+)
+
+
+def _generate_rsa_private_pem(key_size: int = RSA_KEY_SIZE) -> bytes:
+    """Generates one RSA private key as unencrypted PKCS#8 PEM (worker entry point)."""
+    private_key = rsa.generate_private_key(public_exponent=RSA_PUBLIC_EXPONENT, key_size=key_size)
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
+def _cpu_flags() -> frozenset:
+    """Returns the CPU feature flags from /proc/cpuinfo (empty if unreadable)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def _check_len(name: str, value: bytes, expected: int) -> None:
+    """Raises ValueError unless value is exactly expected bytes long."""
+    if len(value) != expected:
+        raise ValueError(f"Kyber768 {name} must be {expected} bytes, got {len(value)}")
+
+
+class _PQCleanKyber:
+    """
+    ctypes binding to a PQClean Kyber768 shared library.
+    
+    The C functions read fixed-size buffers, so every input length is
+    checked before the call.
+    """
+
+    def __init__(self, lib: ctypes.CDLL, prefix: str):
+        self.name = prefix
+        self._keypair = getattr(lib, prefix + "_crypto_kem_keypair")
+        self._enc = getattr(lib, prefix + "_crypto_kem_enc")
+        self._dec = getattr(lib, prefix + "_crypto_kem_dec")
+        # int keypair(uint8_t *pk, uint8_t *sk)
+        # int enc(uint8_t *ct, uint8_t *ss, const uint8_t *pk)
+        # int dec(uint8_t *ss, const uint8_t *ct, const uint8_t *sk)
+        for fn, nargs in ((self._keypair, 2), (self._enc, 3), (self._dec, 3)):
+            fn.argtypes = [ctypes.c_char_p] * nargs
+            fn.restype = ctypes.c_int
+
+    def keypair(self) -> Tuple[bytes, bytes]:
+        pk = ctypes.create_string_buffer(KYBER_PK_BYTES)
+        sk = ctypes.create_string_buffer(KYBER_SK_BYTES)
+        if self._keypair(pk, sk) != 0:
+            raise RuntimeError(f"{self.name} keypair failed")
+        return sk.raw, pk.raw
+
+    def encap(self, public_key: bytes) -> Tuple[bytes, bytes]:
+        _check_len("public key", public_key, KYBER_PK_BYTES)
+        ct = ctypes.create_string_buffer(KYBER_CT_BYTES)
+        ss = ctypes.create_string_buffer(KYBER_SS_BYTES)
+        if self._enc(ct, ss, bytes(public_key)) != 0:
+            raise RuntimeError(f"{self.name} encapsulation failed")
+        return ct.raw, ss.raw
+
+    def decap(self, private_key: bytes, ciphertext: bytes) -> bytes:
+        _check_len("private key", private_key, KYBER_SK_BYTES)
+        _check_len("ciphertext", ciphertext, KYBER_CT_BYTES)
+        ss = ctypes.create_string_buffer(KYBER_SS_BYTES)
+        if self._dec(ss, bytes(ciphertext), bytes(private_key)) != 0:
+            raise RuntimeError(f"{self.name} decapsulation failed")
+        return ss.raw
+
+
+@lru_cache(maxsize=None)
+def _load_pqclean_kyber(allow_portable: bool) -> Optional[_PQCleanKyber]:
+    """
+    Loads the fastest usable PQClean Kyber768 build, or None.
+    
+    The portable (clean) build is only considered when allow_portable is set,
+    since liboqs already dispatches to its own optimized code.
+    """
+    flags = _cpu_flags()
+    for lib_name, prefix, required_flag in PQCLEAN_KYBER_LIBS:
+        if required_flag is None and not allow_portable:
+            continue
+        if required_flag is not None and required_flag not in flags:
+            continue
+        try:
+            backend = _PQCleanKyber(ctypes.CDLL(lib_name), prefix)
+        except (OSError, AttributeError):
+            continue
+        logger.info("Kyber backend: %s", prefix)
+        return backend
+    return None
+
+def _open_oqs_kem() -> Tuple[Optional[str], Optional["oqs.KeyEncapsulation"]]:
+    """
+    Opens a liboqs KEM handle for the first enabled OQS_KEM_ALGS entry.
+    
+    Returns (None, None) when liboqs is missing or has neither mechanism
+    enabled, so the engine falls back to PQClean or simulation.
+    """
+    if not OQS_AVAILABLE:
+        return None, None
+    try:
+        enabled = set(oqs.get_enabled_kem_mechanisms())
+    except Exception as e:
+        logger.warning("liboqs mechanism query failed: %s", e)
+        return None, None
+    for alg in OQS_KEM_ALGS:
+        if alg not in enabled:
+            continue
+        try:
+            kem = oqs.KeyEncapsulation(alg)
+        except Exception as e:
+            logger.warning("liboqs %s unavailable: %s", alg, e)
+            continue
+        logger.info("Kyber backend: liboqs %s", alg)
+        return alg, kem
+    logger.warning("liboqs has no ML-KEM-768/Kyber768 enabled; using fallback KEM")
+    return None, None
+
+
 class CryptoEngine:
     """
     Implements Post-Quantum Cryptography and military-grade encryption standards.
@@ -28,8 +183,57 @@ class CryptoEngine:
 
     def __init__(self):
         self.backend = default_backend() if CRYPTO_LIB_AVAILABLE else None
+        # Constant keygen parameters, built once rather than per call
+        self._rsa_gen_kwargs = dict(public_exponent=RSA_PUBLIC_EXPONENT, key_size=RSA_KEY_SIZE, backend=self.backend)
+        self._ecc_curve = ec.SECP384R1() if CRYPTO_LIB_AVAILABLE else None
+        # Persistent KEM handle so parameter setup is not repeated per call
+        self._kyber_alg, self._kyber = _open_oqs_kem()
+        self._kyber_sk: Optional[bytes] = None
+        # The shared handle holds one secret key; keygen and decap with it
+        # must not interleave between threads
+        self._kyber_lock = Lock()
+        self._pqclean = _load_pqclean_kyber(allow_portable=self._kyber is None)
+        # Per-engine AESGCM contexts, least recently used first, so repeat
+        # calls skip the key schedule. Entries are keyed by a keyed BLAKE2b
+        # digest of the AES key, never the key itself, but each context
+        # still holds its key schedule until evicted, retire_key() or close().
+        self._aes_contexts: "OrderedDict[bytes, AESGCM]" = OrderedDict()
+        self._aes_cache_salt = os.urandom(32)
+        self._aes_lock = Lock()
         logger.info("CryptoEngine initialized. Hardware Acceleration: Enabled (Simulated)")
 
+    def _aes_cache_id(self, key: bytes) -> bytes:
+        """Cache id for an AES key: BLAKE2b keyed with this engine's random salt."""
+        return hashlib.blake2b(key, key=self._aes_cache_salt, digest_size=16).digest()
+
+    def _aesgcm_for_key(self, key: bytes) -> "AESGCM":
+        """Returns this engine's cached AESGCM context for key, creating it if needed."""
+        key_id = self._aes_cache_id(key)
+        contexts = self._aes_contexts
+        with self._aes_lock:
+            ctx = contexts.get(key_id)
+            if ctx is not None:
+                contexts.move_to_end(key_id)
+                return ctx
+        # Key schedule outside the lock; a racing thread may build the same context
+        ctx = AESGCM(bytes(key))
+        with self._aes_lock:
+            contexts[key_id] = ctx
+            if len(contexts) > AES_CONTEXT_CACHE_SIZE:
+                contexts.popitem(last=False)
+        return ctx
+
+    def retire_key(self, key: bytes) -> None:
+        """Drops the cached context for a rotated-out AES key."""
+        key_id = self._aes_cache_id(key)
+        with self._aes_lock:
+            self._aes_contexts.pop(key_id, None)
+
+    def close(self) -> None:
+        """Drops every cached AES key context held by this engine."""
+        with self._aes_lock:
+            self._aes_contexts.clear()
+
     def encrypt_data(self, data: bytes, key: bytes) -> Tuple[bytes, bytes, bytes]:
         """
         Encrypts data using AES-256-GCM.
@@ -47,10 +251,8 @@ class CryptoEngine:
         nonce = os.urandom(12) # GCM standard nonce size
 
         if CRYPTO_LIB_AVAILABLE:
-            cipher = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=self.backend)
-            encryptor = cipher.encryptor()
-            ciphertext = encryptor.update(data) + encryptor.finalize()
-            return nonce, ciphertext, encryptor.tag
+            sealed = self._aesgcm_for_key(key).encrypt(nonce, data, None)
+            return nonce, sealed[:-GCM_TAG_SIZE], sealed[-GCM_TAG_SIZE:]
         else:
             # Mock encryption for environment without libraries
             logger.warning("Using MOCK encryption (insecure)")
@@ -61,9 +263,7 @@ class CryptoEngine:
         Decrypts data using AES-256-GCM.
         """
         if CRYPTO_LIB_AVAILABLE:
-            cipher = Cipher(algorithms.AES(key), modes.GCM(nonce, tag), backend=self.backend)
-            decryptor = cipher.decryptor()
-            return decryptor.update(ciphertext) + decryptor.finalize()
+            return self._aesgcm_for_key(key).decrypt(nonce, ciphertext + tag, None)
         else:
             return base64.b64decode(ciphertext)
 
@@ -71,47 +271,70 @@ class CryptoEngine:
         """Generates RSA-4096 Key Pair."""
         logger.info("Generating RSA-4096 Key Pair...")
         if CRYPTO_LIB_AVAILABLE:
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=4096,
-                backend=self.backend
-            )
+            private_key = rsa.generate_private_key(**self._rsa_gen_kwargs)
             public_key = private_key.public_key()
             return private_key, public_key
         return "mock_rsa_private", "mock_rsa_public"
 
+    def generate_rsa_key_pairs(self, n: int, max_workers: Optional[int] = None) -> List[Tuple[object, object]]:
+        """
+        Generates n RSA-4096 key pairs in parallel across processes.
+        
+        Returns (private, public) tuples, as generate_rsa_key_pair() does.
+        Workers hand keys back as PKCS#8 PEM, which carries the CRT
+        components (dmp1, dmq1, iqmp) so loaded keys sign and decrypt via CRT.
+        """
+        if n <= 1 or not CRYPTO_LIB_AVAILABLE:
+            return [self.generate_rsa_key_pair() for _ in range(n)]
+        logger.info("Generating %d RSA-4096 Key Pairs...", n)
+        workers = min(n, max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pems = list(pool.map(_generate_rsa_private_pem, [RSA_KEY_SIZE] * n))
+        pairs = []
+        for pem in pems:
+            private_key = serialization.load_pem_private_key(pem, password=None, backend=self.backend)
+            pairs.append((private_key, private_key.public_key()))
+        return pairs
+
     def generate_ecc_key_pair(self) -> Tuple[object, object]:
         """Generates ECC P-384 Key Pair."""
         logger.info("Generating ECC P-384 Key Pair...")
         if CRYPTO_LIB_AVAILABLE:
-            private_key = ec.generate_private_key(ec.SECP384R1(), backend=self.backend)
+            private_key = ec.generate_private_key(self._ecc_curve, backend=self.backend)
             public_key = private_key.public_key()
             return private_key, public_key
         return "mock_ecc_private", "mock_ecc_public"
 
     def hash_data(self, data: bytes) -> bytes:
         """Hashes data using SHA-3-512."""
-        if CRYPTO_LIB_AVAILABLE:
-            digest = hashes.Hash(hashes.SHA3_512(), backend=self.backend)
-            digest.update(data)
-            return digest.finalize()
-        else:
-            return hashlib.sha3_512(data).digest()
+        return hashlib.sha3_512(data).digest()
+
+    def hash_stream(self, chunks: Iterable[bytes]) -> bytes:
+        """Hashes a sequence of chunks with SHA-3-512 as one message."""
+        h = hashlib.sha3_512()
+        for chunk in chunks:
+            h.update(chunk)
+        return h.digest()
 
-    # --- Post-Quantum Cryptography (PQC) Simulation ---
-    # Since standard Python libraries for Kyber (like `pqcrypto`) might not be present,
-    # we simulate the interface and behavior of a Key Encapsulation Mechanism (KEM).
+    # --- Post-Quantum Cryptography (PQC) ---
+    # Uses PQClean's AVX2 build when present, then liboqs. Otherwise we simulate the interface and
+    # behavior of a Key Encapsulation Mechanism (KEM) with Kyber768 sizes.
 
     def generate_kyber_key_pair(self) -> Tuple[bytes, bytes]:
         """
-        Generates a CRYSTALS-Kyber key pair (Simulated).
+        Generates a CRYSTALS-Kyber key pair.
         Kyber is a KEM (Key Encapsulation Mechanism).
         """
         logger.info("Generating CRYSTALS-Kyber (PQC) Key Pair...")
-        # In a real implementation, call liboqs or similar
-        pk = os.urandom(1184) # Kyber768 public key size
-        sk = os.urandom(2400) # Kyber768 private key size
-        return sk, pk
+        if self._pqclean is not None:
+            return self._pqclean.keypair()
+        if self._kyber is not None:
+            with self._kyber_lock:
+                pk = self._kyber.generate_keypair()
+                sk = self._kyber_sk = self._kyber.export_secret_key()
+            return sk, pk
+        buf = os.urandom(KYBER_PK_BYTES + KYBER_SK_BYTES)
+        return buf[KYBER_PK_BYTES:], buf[:KYBER_PK_BYTES]
 
     def encapsulate_key(self, public_key: bytes) -> Tuple[bytes, bytes]:
         """
@@ -119,21 +342,52 @@ class CryptoEngine:
         Returns (ciphertext, shared_secret).
         """
         logger.info("Encapsulating key with CRYSTALS-Kyber...")
+        if self._pqclean is not None:
+            return self._pqclean.encap(public_key)
+        if self._kyber is not None:
+            return self._kyber.encap_secret(public_key)
         # Simulate encapsulation
-        shared_secret = os.urandom(32) # 256-bit shared secret
-        ciphertext = os.urandom(1088) # Kyber768 ciphertext size
-        return ciphertext, shared_secret
+        buf = os.urandom(KYBER_CT_BYTES + KYBER_SS_BYTES)
+        return buf[:KYBER_CT_BYTES], buf[KYBER_CT_BYTES:]
+
+    def encapsulate_keys(self, public_key: bytes, count: int) -> List[Tuple[bytes, bytes]]:
+        """
+        Encapsulates count independent shared secrets against one public key.
+        Returns a list of (ciphertext, shared_secret).
+        """
+        logger.info("Encapsulating %d keys with CRYSTALS-Kyber...", count)
+        if self._pqclean is not None:
+            encap = self._pqclean.encap
+            return [encap(public_key) for _ in range(count)]
+        if self._kyber is not None:
+            encap = self._kyber.encap_secret
+            return [encap(public_key) for _ in range(count)]
+        step = KYBER_CT_BYTES + KYBER_SS_BYTES
+        buf = os.urandom(step * count)
+        return [
+            (buf[off:off + KYBER_CT_BYTES], buf[off + KYBER_CT_BYTES:off + step])
+            for off in range(0, step * count, step)
+        ]
 
     def decapsulate_key(self, private_key: bytes, ciphertext: bytes) -> bytes:
         """
         Decapsulates the shared secret using the private key (Kyber).
         """
         logger.info("Decapsulating key with CRYSTALS-Kyber...")
+        if self._pqclean is not None:
+            return self._pqclean.decap(private_key, ciphertext)
+        if self._kyber is not None:
+            with self._kyber_lock:
+                sk = self._kyber_sk
+                if sk is not None and hmac.compare_digest(private_key, sk):
+                    return self._kyber.decap_secret(ciphertext)
+            with oqs.KeyEncapsulation(self._kyber_alg, secret_key=private_key) as kem:
+                return kem.decap_secret(ciphertext)
         # Simulate decapsulation - in reality this would derive the SAME shared secret
         # For simulation, we just return a new random one if we can't actually derive it
         # NOTE: This mock breaks the correctness property for testing if we don't store state,
         # but sufficient for architectural demonstration.
-        return os.urandom(32)
+        return os.urandom(KYBER_SS_BYTES)
 
 # Example Usage
 if __name__ == "__main__":
@@ -1,14 +1,40 @@
 import logging
-import json
+import struct
+import sys
 import time
 import hashlib
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Dict, FrozenSet, Any
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+GENESIS_HASH = "0" * 64
+LEDGER_HASH_ALG = "blake3" if BLAKE3_AVAILABLE else "sha256"
+
+_ENTRY_HEADER = struct.Struct("!dII")
+
+
+def _entry_bytes(timestamp: float, event_type: str, details: str) -> bytes:
+    """Canonical fixed-layout encoding of an audit entry's content."""
+    event = event_type.encode()
+    text = details.encode()
+    return _ENTRY_HEADER.pack(timestamp, len(event), len(text)) + event + text
+
+
+def _ledger_hash(alg: str, data: bytes) -> str:
+    """Hex digest of data using the named ledger hash algorithm."""
+    if alg == "blake3":
+        return blake3.blake3(data).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
 class DataClassification(Enum):
     PUBLIC = "public"
     INTERNAL = "internal"
@@ -16,19 +42,36 @@ class DataClassification(Enum):
     SECRET = "secret"
     TOP_SECRET = "top_secret"
 
+# Tags that may not leave the vehicle/secure edge, and the destinations that count as leaving
+EXFIL_RESTRICTED_TAGS = frozenset({DataClassification.TOP_SECRET, DataClassification.SECRET})
+EXFIL_BLOCKED_DESTINATIONS = frozenset({"cloud_storage", "public_internet", "external_drive"})
+
 class DataSovereignty:
     """
     Implements Automotive Data Sovereignty controls including classification,
     exfiltration prevention, blockchain audit logging, and geo-fencing.
     """
 
+    # Source -> classification; unknown sources are INTERNAL
+    _CLASS_MAP: Dict[str, DataClassification] = {
+        "engine_ecu": DataClassification.CONFIDENTIAL,
+        "navigation_history": DataClassification.SECRET,
+        "military_comms": DataClassification.TOP_SECRET,
+        "infotainment": DataClassification.PUBLIC,
+    }
+
+    # Classification -> countries where it may be accessed; unlisted tags are unrestricted
+    _GEO_RESTRICTIONS: Dict[DataClassification, FrozenSet[str]] = {
+        DataClassification.TOP_SECRET: frozenset({"US"}),
+    }
+
     def __init__(self):
         self.blockchain_ledger = []
-        self.geo_policies = {
+        self.geo_policies = {sys.intern(k): v for k, v in {
             "US": [DataClassification.TOP_SECRET, DataClassification.SECRET],
             "EU": [DataClassification.CONFIDENTIAL],
             "GLOBAL": [DataClassification.PUBLIC]
-        }
+        }.items()}
         logger.info("DataSovereignty module initialized.")
 
     def classify_data(self, data: Any, source: str) -> DataClassification:
@@ -43,16 +86,7 @@ class DataSovereignty:
             DataClassification tag.
         """
         # Rule-based classification engine
-        if source == "engine_ecu":
-            return DataClassification.CONFIDENTIAL
-        elif source == "navigation_history":
-            return DataClassification.SECRET
-        elif source == "military_comms":
-            return DataClassification.TOP_SECRET
-        elif source == "infotainment":
-            return DataClassification.PUBLIC
-        
-        return DataClassification.INTERNAL
+        return self._CLASS_MAP.get(source, DataClassification.INTERNAL)
 
     def check_exfiltration_policy(self, data_tag: DataClassification, destination: str) -> bool:
         """
@@ -68,8 +102,8 @@ class DataSovereignty:
         logger.info(f"Checking exfiltration policy for {data_tag.value} to {destination}")
         
         # Strict policy: Top Secret and Secret cannot leave the vehicle/secure edge
-        if data_tag in [DataClassification.TOP_SECRET, DataClassification.SECRET]:
-            if destination in ["cloud_storage", "public_internet", "external_drive"]:
+        if data_tag in EXFIL_RESTRICTED_TAGS:
+            if destination in EXFIL_BLOCKED_DESTINATIONS:
                 logger.critical(f"BLOCKED exfiltration of {data_tag.value} data to {destination}")
                 self.log_audit_event("EXFILTRATION_ATTEMPT", f"Blocked {data_tag.value} to {destination}")
                 return False
@@ -79,25 +113,49 @@ class DataSovereignty:
     def log_audit_event(self, event_type: str, details: str):
         """
         Logs an event to an immutable blockchain ledger (Simulated).
+        
+        The entry's content is digested as canonical bytes, then chained as
+        H(previous_hash + content_hash) so every entry is bound to its
+        predecessor. H is BLAKE3 when the blake3 package is installed and
+        SHA-256 otherwise; the choice is recorded per entry.
         """
         timestamp = time.time()
-        # Create a hash chain to simulate blockchain immutability
-        previous_hash = self.blockchain_ledger[-1]['hash'] if self.blockchain_ledger else "0" * 64
+        previous_hash = self.blockchain_ledger[-1]['hash'] if self.blockchain_ledger else GENESIS_HASH
+        
+        alg = LEDGER_HASH_ALG
+        content_hash = _ledger_hash(alg, _entry_bytes(timestamp, event_type, details))
+        entry_hash = _ledger_hash(alg, bytes.fromhex(previous_hash) + bytes.fromhex(content_hash))
         
-        entry = {
+        self.blockchain_ledger.append({
             "timestamp": timestamp,
             "event_type": event_type,
             "details": details,
-            "previous_hash": previous_hash
-        }
-        
-        # Calculate hash of this entry
-        entry_str = json.dumps(entry, sort_keys=True)
-        entry_hash = hashlib.sha256(entry_str.encode()).hexdigest()
-        entry['hash'] = entry_hash
+            "previous_hash": previous_hash,
+            "content_hash": content_hash,
+            "hash_alg": alg,
+            "hash": entry_hash,
+        })
+        logger.info("Audit Logged: %s - %s (Hash: %s...)", event_type, details, entry_hash[:8])
+
+    def verify_audit_chain(self) -> bool:
+        """
+        Recomputes every ledger hash and checks the chain links.
         
-        self.blockchain_ledger.append(entry)
-        logger.info(f"Audit Logged: {event_type} - {details} (Hash: {entry_hash[:8]}...)")
+        Returns:
+            bool: True if no entry has been altered, reordered, or removed.
+        """
+        previous_hash = GENESIS_HASH
+        for entry in self.blockchain_ledger:
+            alg = entry['hash_alg']
+            if alg == "blake3" and not BLAKE3_AVAILABLE:
+                logger.error("Cannot verify BLAKE3 ledger entries: blake3 not installed")
+                return False
+            content_hash = _ledger_hash(alg, _entry_bytes(entry['timestamp'], entry['event_type'], entry['details']))
+            expected = _ledger_hash(alg, bytes.fromhex(previous_hash) + bytes.fromhex(content_hash))
+            if entry['previous_hash'] != previous_hash or entry['hash'] != expected:
+                return False
+            previous_hash = entry['hash']
+        return True
 
     def enforce_geo_fencing(self, current_location_country: str, data_tag: DataClassification) -> bool:
         """
@@ -110,9 +168,10 @@ class DataSovereignty:
         Returns:
             bool: True if access is allowed in this location.
         """
-        # If data is Top Secret, it might only be accessible in US
-        if data_tag == DataClassification.TOP_SECRET and current_location_country != "US":
-             logger.warning(f"Geo-fencing: Access to TOP_SECRET denied in {current_location_country}")
+        # Restricted tags (e.g. Top Secret) are only accessible in listed countries
+        allowed = self._GEO_RESTRICTIONS.get(data_tag)
+        if allowed is not None and current_location_country not in allowed:
+             logger.warning(f"Geo-fencing: Access to {data_tag.name} denied in {current_location_country}")
              return False
              
         # Example: GDPR restrictions might apply, handled here
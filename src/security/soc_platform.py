@@ -1,7 +1,13 @@
 import time
 import json
 import random
-from typing import List, Dict, Any, Optional
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -11,7 +17,7 @@ class Severity(Enum):
     HIGH = "HIGH"
     CRITICAL = "CRITICAL"
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     timestamp: float
     source: str
@@ -19,7 +25,7 @@ class LogEntry:
     message: str
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Incident:
     id: str
     timestamp: float
@@ -33,19 +39,35 @@ class LogAggregator:
     """
     Aggregates logs from various sources in real-time.
     """
+    MAX_LOGS = 10000  # Keep only last 10000 logs in memory for simulation
+
     def __init__(self):
-        self.logs: List[LogEntry] = []
+        # Logs and their timestamps are kept in lock-step; entries before
+        # _head have been evicted and are dropped in bulk once _head reaches
+        # MAX_LOGS, so eviction is amortized O(1).
+        self._logs: List[LogEntry] = []
+        self._ts = array('d')
+        self._head = 0
         self.sources: List[str] = ["firewall", "auth_server", "app_server", "database"]
 
+    @property
+    def logs(self) -> List[LogEntry]:
+        return self._logs[self._head:]
+
     def ingest_log(self, entry: LogEntry):
-        self.logs.append(entry)
-        # Keep only last 10000 logs in memory for simulation
-        if len(self.logs) > 10000:
-            self.logs = self.logs[-10000:]
+        self._logs.append(entry)
+        self._ts.append(entry.timestamp)
+        if len(self._logs) - self._head > self.MAX_LOGS:
+            self._head += 1
+            if self._head >= self.MAX_LOGS:
+                del self._logs[:self._head]
+                del self._ts[:self._head]
+                self._head = 0
         
     def get_recent_logs(self, duration_seconds: float) -> List[LogEntry]:
+        # Logs are ingested in time order, so the cutoff is a binary search
         cutoff = time.time() - duration_seconds
-        return [log for log in self.logs if log.timestamp >= cutoff]
+        return self._logs[bisect_left(self._ts, cutoff, self._head):]
 
     def simulate_log_stream(self, count: int = 1):
         """Generates random logs for testing."""
@@ -61,8 +83,8 @@ class IncidentResponse:
     Automated incident response actions.
     """
     def __init__(self):
-        self.active_blocks: List[str] = []
-        self.quarantined_users: List[str] = []
+        self.active_blocks: Set[str] = set()
+        self.quarantined_users: Set[str] = set()
         self.terminated_processes: List[str] = []
 
     def execute_response(self, action: str, target: str) -> str:
@@ -79,13 +101,13 @@ class IncidentResponse:
 
     def block_ip(self, ip_address: str) -> str:
         if ip_address not in self.active_blocks:
-            self.active_blocks.append(ip_address)
+            self.active_blocks.add(ip_address)
             return f"ACTION: Blocked IP {ip_address}"
         return f"ACTION: IP {ip_address} already blocked"
 
     def quarantine_user(self, user_id: str) -> str:
         if user_id not in self.quarantined_users:
-            self.quarantined_users.append(user_id)
+            self.quarantined_users.add(user_id)
             return f"ACTION: Quarantined user {user_id}"
         return f"ACTION: User {user_id} already quarantined"
 
@@ -100,26 +122,53 @@ class CorrelationEngine:
     """
     Correlates logs to detect threats using rule-based logic.
     """
+    _RULES = re.compile(
+        r"(?P<brute_force>failed login)"
+        r"|(?P<malware>suspicious process)"
+        r"|(?P<exfiltration>large data transfer)"
+        r"|(?P<privilege>sudo usage)",
+        re.IGNORECASE
+    )
+
     def __init__(self, response_system: IncidentResponse):
         self.response_system = response_system
+        # Rule name -> detector, run in this order over the logs each rule matched
+        self._detectors = {
+            "brute_force": self._detect_brute_force,
+            "malware": self._detect_malware_activity,
+            "exfiltration": self._detect_data_exfiltration,
+            "privilege": self._detect_privilege_escalation,
+        }
         self.incidents: List[Incident] = []
+        self._open_by_desc: Dict[str, Incident] = {}
+        # Incidents attributed to a source/destination IP, in creation order
+        self.incidents_by_ip: Dict[str, List[Incident]] = defaultdict(list)
 
     def analyze_logs(self, logs: List[LogEntry]):
         """
         Analyzes a batch of logs for threat patterns.
+        
+        Each distinct message is scanned once against all rules (repeats hit
+        a cache); each detector then only sees the logs that matched its rule.
         """
-        self._detect_brute_force(logs)
-        self._detect_malware_activity(logs)
-        self._detect_data_exfiltration(logs)
-        self._detect_privilege_escalation(logs)
+        matched: Dict[str, List[LogEntry]] = {name: [] for name in self._detectors}
+        classify = self._classify
+        for log in logs:
+            for kind in classify(log.message):
+                matched[kind].append(log)
+        
+        for kind, detect in self._detectors.items():
+            detect(matched[kind])
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify(message: str) -> Tuple[str, ...]:
+        """Names of the rules a log message matches."""
+        return tuple({m.lastgroup for m in CorrelationEngine._RULES.finditer(message)})
 
     def _detect_brute_force(self, logs: List[LogEntry]):
-        failed_logins = {}
-        for log in logs:
-            if "failed login" in log.message.lower():
-                ip = log.metadata.get("ip")
-                if ip:
-                    failed_logins[ip] = failed_logins.get(ip, 0) + 1
+        ips = (log.metadata.get("ip") for log in logs)
+        failed_logins = Counter(ip for ip in ips if ip)
         
         for ip, count in failed_logins.items():
             if count >= 3:
@@ -128,54 +177,55 @@ class CorrelationEngine:
                     f"Brute force detected from {ip}", 
                     [ip],
                     "block_ip",
-                    ip
+                    ip,
+                    ip=ip
                 )
 
     def _detect_malware_activity(self, logs: List[LogEntry]):
         for log in logs:
-            if "suspicious process" in log.message.lower():
-                proc_id = log.metadata.get("process_id")
-                host = log.metadata.get("host")
-                if proc_id:
-                    self._create_incident(
-                        Severity.CRITICAL,
-                        f"Malware activity detected: {proc_id} on {host}",
-                        [host],
-                        "terminate_process",
-                        proc_id
-                    )
+            proc_id = log.metadata.get("process_id")
+            host = log.metadata.get("host")
+            if proc_id:
+                self._create_incident(
+                    Severity.CRITICAL,
+                    f"Malware activity detected: {proc_id} on {host}",
+                    [host],
+                    "terminate_process",
+                    proc_id
+                )
 
     def _detect_data_exfiltration(self, logs: List[LogEntry]):
         # Simplified logic: look for large data transfer logs
         for log in logs:
-            if "large data transfer" in log.message.lower():
-                user = log.metadata.get("user")
-                ip = log.metadata.get("ip")
-                self._create_incident(
-                    Severity.HIGH,
-                    f"Potential data exfiltration by {user} to {ip}",
-                    [ip],
-                    "quarantine_user",
-                    user
-                )
+            user = log.metadata.get("user")
+            ip = log.metadata.get("ip")
+            self._create_incident(
+                Severity.HIGH,
+                f"Potential data exfiltration by {user} to {ip}",
+                [ip],
+                "quarantine_user",
+                user,
+                ip=ip
+            )
 
     def _detect_privilege_escalation(self, logs: List[LogEntry]):
         for log in logs:
-            if "sudo usage" in log.message.lower() and log.level == "WARNING":
-                user = log.metadata.get("user")
-                self._create_incident(
-                    Severity.MEDIUM,
-                    f"Suspicious privilege escalation by {user}",
-                    [user],
-                    "quarantine_user",
-                    user
-                )
+            if log.level != "WARNING":
+                continue
+            user = log.metadata.get("user")
+            self._create_incident(
+                Severity.MEDIUM,
+                f"Suspicious privilege escalation by {user}",
+                [user],
+                "quarantine_user",
+                user
+            )
 
-    def _create_incident(self, severity: Severity, description: str, assets: List[str], response_action: str = None, action_target: str = None):
-        # Deduplicate open incidents
-        for inc in self.incidents:
-            if inc.description == description and inc.status == "OPEN":
-                return
+    def _create_incident(self, severity: Severity, description: str, assets: List[str], response_action: str = None, action_target: str = None, ip: Optional[str] = None):
+        # Deduplicate open incidents (re-check status in case it was changed directly)
+        existing = self._open_by_desc.get(description)
+        if existing is not None and existing.status == "OPEN":
+            return
         
         incident = Incident(
             id=f"INC-{len(self.incidents)+1}",
@@ -190,18 +240,31 @@ class CorrelationEngine:
             incident.actions_taken.append(result)
             
         self.incidents.append(incident)
+        self._open_by_desc[description] = incident
+        if ip:
+            self.incidents_by_ip[ip].append(incident)
         print(f"ALERT: New Incident {incident.id} [{severity.value}]: {description}")
         if incident.actions_taken:
             print(f"  -> Response: {incident.actions_taken[-1]}")
 
+    def close_incident(self, incident: Incident, status: str = "CLOSED"):
+        """Moves an incident out of OPEN so new alerts for it are raised again."""
+        incident.status = status
+        if self._open_by_desc.get(incident.description) is incident:
+            del self._open_by_desc[incident.description]
+
 class ComplianceReporter:
     """
     Generates compliance reports.
     """
     def generate_report(self, incidents: List[Incident]) -> str:
         total = len(incidents)
-        open_incidents = [i for i in incidents if i.status == "OPEN"]
-        critical = [i for i in incidents if i.severity == Severity.CRITICAL]
+        open_count = critical_count = 0
+        for inc in incidents:
+            if inc.status == "OPEN":
+                open_count += 1
+            if inc.severity is Severity.CRITICAL:
+                critical_count += 1
         
         # Calculate Mean Time To Detect (MTTD) - Simulated
         # In a real system, we'd compare log timestamp vs incident timestamp
@@ -216,9 +279,9 @@ Generated at: {time.ctime()}
 
 ## Summary
 - **Total Incidents**: {total}
-- **Open Incidents**: {len(open_incidents)}
-- **Critical Incidents**: {len(critical)}
-- **Compliance Status**: {"NON-COMPLIANT" if open_incidents else "COMPLIANT"}
+- **Open Incidents**: {open_count}
+- **Critical Incidents**: {critical_count}
+- **Compliance Status**: {"NON-COMPLIANT" if open_count else "COMPLIANT"}
 - **Mean Time To Detect (MTTD)**: {mttd / 60:.2f} minutes (Target: <15 mins)
 
 ## Incident Details
@@ -229,19 +292,62 @@ Generated at: {time.ctime()}
         return report
 
 class SOCPlatform:
-    def __init__(self):
+    """
+    Ingests events and runs correlation over the recent log window.
+    
+    Analysis is coalesced: it runs once analysis_batch events have queued up,
+    on the first event after analysis_interval seconds of quiet, or from a
+    timer analysis_interval seconds after the first queued event, so a burst
+    is never left unanalyzed. Call flush() to analyze immediately.
+    """
+    def __init__(self, analysis_batch: int = 16, analysis_interval: float = 0.25):
         self.aggregator = LogAggregator()
         self.response = IncidentResponse()
         self.engine = CorrelationEngine(self.response)
         self.reporter = ComplianceReporter()
+        self.analysis_batch = analysis_batch
+        self.analysis_interval = analysis_interval
+        self._lock = threading.Lock()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def process_event(self, source: str, message: str, metadata: Dict = None,
+                      timestamp: Optional[float] = None):
+        """
+        Ingests one event. timestamp defaults to now; injected timestamps
+        must not go backwards, since the aggregator keeps logs in time order.
+        """
+        entry = LogEntry(time.time() if timestamp is None else timestamp,
+                         source, "INFO", message, metadata or {})
+        with self._lock:
+            self.aggregator.ingest_log(entry)
+            self._unflushed += 1
+            if (self._unflushed >= self.analysis_batch
+                    or time.monotonic() - self._last_flush >= self.analysis_interval):
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.analysis_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Runs correlation over the recent window for any unanalyzed events."""
+        with self._lock:
+            self._flush_locked()
 
-    def process_event(self, source: str, message: str, metadata: Dict = None):
-        entry = LogEntry(time.time(), source, "INFO", message, metadata or {})
-        self.aggregator.ingest_log(entry)
-        # Real-time analysis of recent window (e.g., last 60 seconds)
-        self.engine.analyze_logs(self.aggregator.get_recent_logs(60))
+    def _flush_locked(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._unflushed:
+            # Real-time analysis of recent window (e.g., last 60 seconds)
+            self.engine.analyze_logs(self.aggregator.get_recent_logs(60))
+            self._unflushed = 0
+        self._last_flush = time.monotonic()
 
     def get_status(self):
+        self.flush()
         return self.reporter.generate_report(self.engine.incidents)
 
 if __name__ == "__main__":
@@ -258,6 +364,7 @@ if __name__ == "__main__":
     # Simulate malware
     print("\n--- Simulating Malware ---")
     soc.process_event("endpoint_agent", "suspicious process started", {"process_id": "malware.exe", "host": "workstation-01"})
+    soc.flush()
     
     print("\n--- Generating Report ---")
     print(soc.get_status())
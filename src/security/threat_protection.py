@@ -1,12 +1,27 @@
+import itertools
 import logging
 import random
 import time
 from typing import List, Dict, Any
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Column order for batched telemetry, with the baseline multiple that counts
+# as anomalous and the description reported for it.
+ANOMALY_METRICS = ("cpu_usage", "network_throughput", "login_attempts")
+ANOMALY_MULTIPLIERS = np.array([2.0, 3.0, 5.0])
+ANOMALY_DESCRIPTIONS = (
+    "ANOMALY: CPU usage spike detected (>80%)",
+    "ANOMALY: Network exfiltration pattern detected",
+    "ANOMALY: Brute force authentication attempt",
+)
+# Same rules with plain floats, for the per-sample path
+_ANOMALY_RULES = tuple(zip(ANOMALY_METRICS, ANOMALY_MULTIPLIERS.tolist(), ANOMALY_DESCRIPTIONS))
+
 class ThreatProtection:
     """
     Implements comprehensive threat protection including IDS/IPS, EDR, SIEM,
@@ -14,7 +29,8 @@ class ThreatProtection:
     """
 
     def __init__(self):
-        self.active_threats = []
+        self.active_threats: Dict[str, Dict[str, Any]] = {}
+        self._threat_seq = itertools.count(1)
         self.ids_rules_loaded = False
         self.baseline_behavior = {
             "cpu_usage": 40.0,
@@ -43,23 +59,39 @@ class ThreatProtection:
         Returns:
             List of detected anomaly descriptions.
         """
-        anomalies = []
-        
-        # Simple threshold-based anomaly detection (simulating ML model inference)
-        if telemetry.get("cpu_usage", 0) > self.baseline_behavior["cpu_usage"] * 2:
-            anomalies.append("ANOMALY: CPU usage spike detected (>80%)")
-            
-        if telemetry.get("network_throughput", 0) > self.baseline_behavior["network_throughput"] * 3:
-            anomalies.append("ANOMALY: Network exfiltration pattern detected")
-            
-        if telemetry.get("login_attempts", 0) > self.baseline_behavior["login_attempts"] * 5:
-            anomalies.append("ANOMALY: Brute force authentication attempt")
+        baseline = self.baseline_behavior
+        anomalies = [
+            desc for metric, mult, desc in _ANOMALY_RULES
+            if telemetry.get(metric, 0) > baseline[metric] * mult
+        ]
             
         if anomalies:
             logger.warning(f" anomalies detected: {anomalies}")
             
         return anomalies
 
+    def detect_anomalies_batch(self, telemetry: np.ndarray) -> np.ndarray:
+        """
+        Vectorized anomaly detection over a batch of telemetry samples.
+        
+        Args:
+            telemetry: Array of shape (N, 3), one row per sample, columns in
+                ANOMALY_METRICS order.
+            
+        Returns:
+            Boolean mask of shape (N, 3); True where a metric is anomalous.
+        """
+        baseline = np.array([self.baseline_behavior[m] for m in ANOMALY_METRICS], dtype=float)
+        mask = np.asarray(telemetry, dtype=np.float64) > baseline * ANOMALY_MULTIPLIERS
+        
+        flagged = np.flatnonzero(mask.any(axis=1))
+        if flagged.size and logger.isEnabledFor(logging.WARNING):
+            for row in flagged:
+                anomalies = [d for d, hit in zip(ANOMALY_DESCRIPTIONS, mask[row]) if hit]
+                logger.warning(f"sample {row}: anomalies detected: {anomalies}")
+        
+        return mask
+
     def correlate_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         SIEM Logic: Correlates multiple events to identify complex threats.
@@ -72,13 +104,14 @@ class ThreatProtection:
         
         if failed_logins and high_cpu:
             threat = {
-                "id": f"THREAT-{int(time.time())}",
+                # Sequence suffix keeps ids unique within the same second
+                "id": f"THREAT-{int(time.time())}-{next(self._threat_seq)}",
                 "severity": "HIGH",
                 "description": "Potential Compromise: Failed logins followed by high resource usage",
                 "confidence": 0.85
             }
             correlated_threats.append(threat)
-            self.active_threats.append(threat)
+            self.active_threats[threat["id"]] = threat
             
         return correlated_threats
 
@@ -88,11 +121,10 @@ class ThreatProtection:
         """
         logger.info(f"EDR: Initiating response for {threat_id}")
         
-        threat = next((t for t in self.active_threats if t["id"] == threat_id), None)
+        threat = self.active_threats.pop(threat_id, None)
         if threat:
             logger.info(f"EDR Action: Isolating affected endpoint. Terminating suspicious processes.")
             # Simulate action
-            self.active_threats.remove(threat)
             logger.info(f"EDR: Threat {threat_id} mitigated.")
         else:
             logger.warning(f"EDR: Threat {threat_id} not found.")
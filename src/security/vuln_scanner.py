@@ -1,12 +1,22 @@
+import json
 import time
 import random
 from typing import List, Dict, Optional
+from collections import Counter
 from dataclasses import dataclass, field
+from enum import IntEnum
 
-@dataclass
+class Severity(IntEnum):
+    """Vulnerability severity; the value is the security score deduction while open."""
+    CRITICAL = 20
+    HIGH = 10
+    MEDIUM = 5
+    LOW = 1
+
+@dataclass(slots=True)
 class Vulnerability:
     cve_id: str
-    severity: str
+    severity: Severity
     component: str
     description: str
     status: str = "OPEN" # OPEN, PATCHED
@@ -16,15 +26,17 @@ class PatchManager:
     """
     Manages patching of vulnerabilities.
     """
-    def __init__(self):
+    def __init__(self, simulate_delay: bool = False):
         self.applied_patches: List[str] = []
+        self._simulate_delay = simulate_delay
 
     def apply_patch(self, cve_id: str) -> bool:
         """
         Simulates applying a patch.
         """
         print(f"PATCH: Applying patch for {cve_id}...")
-        time.sleep(0.1) # Simulate work
+        if self._simulate_delay:
+            time.sleep(0.1) # Simulate work
         self.applied_patches.append(cve_id)
         return True
 
@@ -37,13 +49,46 @@ class VulnerabilityScanner:
     """
     def __init__(self):
         self.known_vulns: List[Vulnerability] = []
+        # Indexes kept in step with known_vulns; mutate only via add_vuln/remediate_vuln
+        self._by_cve: Dict[str, Vulnerability] = {}
+        self._open_by_severity: Counter = Counter()
+        self._patched_count = 0
+        self._details: Optional[List[Dict]] = None
         # Seed with some dummy data for simulation
         self._seed_vulns()
 
     def _seed_vulns(self):
-        self.known_vulns.append(Vulnerability("CVE-2024-0001", "HIGH", "OpenSSL", "Buffer overflow"))
-        self.known_vulns.append(Vulnerability("CVE-2024-0002", "MEDIUM", "Kernel", "Privilege escalation"))
-        self.known_vulns.append(Vulnerability("CVE-2024-0003", "CRITICAL", "Apache Struts", "RCE"))
+        self.add_vuln(Vulnerability("CVE-2024-0001", Severity.HIGH, "OpenSSL", "Buffer overflow"))
+        self.add_vuln(Vulnerability("CVE-2024-0002", Severity.MEDIUM, "Kernel", "Privilege escalation"))
+        self.add_vuln(Vulnerability("CVE-2024-0003", Severity.CRITICAL, "Apache Struts", "RCE"))
+
+    def add_vuln(self, vuln: Vulnerability):
+        self.known_vulns.append(vuln)
+        self._by_cve[vuln.cve_id] = vuln
+        if vuln.status == "OPEN":
+            self._open_by_severity[vuln.severity] += 1
+        elif vuln.status == "PATCHED":
+            self._patched_count += 1
+        self._details = None
+
+    def get_vuln(self, cve_id: str) -> Optional[Vulnerability]:
+        return self._by_cve.get(cve_id)
+
+    @property
+    def open_by_severity(self) -> Dict[Severity, int]:
+        return dict(self._open_by_severity)
+
+    @property
+    def patched_count(self) -> int:
+        return self._patched_count
+
+    def details(self) -> List[Dict]:
+        """Per-CVE summary rows, cached until the catalogue changes."""
+        if self._details is None:
+            self._details = [
+                {"cve": v.cve_id, "severity": v.severity.name, "status": v.status} for v in self.known_vulns
+            ]
+        return self._details
 
     def scan_system(self, target_ip: str = "localhost") -> List[Vulnerability]:
         """
@@ -54,16 +99,26 @@ class VulnerabilityScanner:
         # Here we just return the known open vulns.
         return [v for v in self.known_vulns if v.status == "OPEN"]
 
+    def rescan(self, previous: List[Vulnerability]) -> List[Vulnerability]:
+        """
+        Re-checks only the findings of an earlier scan, returning those still open.
+        """
+        return [v for v in previous if v.status == "OPEN"]
+
     def remediate_vuln(self, cve_id: str, patch_manager: PatchManager):
-        for v in self.known_vulns:
-            if v.cve_id == cve_id and v.status == "OPEN":
-                if patch_manager.apply_patch(cve_id):
-                    # Verify
-                    if patch_manager.verify_patch(cve_id):
-                        v.status = "PATCHED"
-                        print(f"REMEDIATION: {cve_id} marked as PATCHED")
-                    else:
-                        print(f"REMEDIATION: Failed to verify patch for {cve_id}")
+        v = self._by_cve.get(cve_id)
+        if v is None or v.status != "OPEN":
+            return
+        if patch_manager.apply_patch(cve_id):
+            # Verify
+            if patch_manager.verify_patch(cve_id):
+                v.status = "PATCHED"
+                self._open_by_severity[v.severity] -= 1
+                self._patched_count += 1
+                self._details = None
+                print(f"REMEDIATION: {cve_id} marked as PATCHED")
+            else:
+                print(f"REMEDIATION: Failed to verify patch for {cve_id}")
 
 class SecurityDashboard:
     """
@@ -72,30 +127,30 @@ class SecurityDashboard:
     def __init__(self, scanner: VulnerabilityScanner):
         self.scanner = scanner
 
-    def generate_dashboard(self) -> Dict:
-        vulns = self.scanner.known_vulns
-        total = len(vulns)
-        open_vulns = [v for v in vulns if v.status == "OPEN"]
+    def generate_dashboard(self, include_details: bool = False) -> Dict:
+        """
+        Summarizes the security posture.
         
-        score = 100
-        for v in open_vulns:
-            if v.severity == "CRITICAL": score -= 20
-            elif v.severity == "HIGH": score -= 10
-            elif v.severity == "MEDIUM": score -= 5
-            elif v.severity == "LOW": score -= 1
+        Args:
+            include_details: Also include one row per CVE under "details".
+        """
+        scanner = self.scanner
+        open_by_severity = scanner.open_by_severity
+        
+        score = 100 - sum(sev * n for sev, n in open_by_severity.items())
         
-        return {
+        dashboard = {
             "timestamp": time.time(),
             "security_score": max(0, score),
-            "total_vulns": total,
-            "open_vulns": len(open_vulns),
-            "patched_vulns": len([v for v in vulns if v.status == "PATCHED"]),
-            "critical_open": len([v for v in vulns if v.status == "OPEN" and v.severity == "CRITICAL"]),
-            "high_open": len([v for v in vulns if v.status == "OPEN" and v.severity == "HIGH"]),
-            "details": [
-                {"cve": v.cve_id, "severity": v.severity, "status": v.status} for v in vulns
-            ]
+            "total_vulns": len(scanner.known_vulns),
+            "open_vulns": sum(open_by_severity.values()),
+            "patched_vulns": scanner.patched_count,
+            "critical_open": open_by_severity.get(Severity.CRITICAL, 0),
+            "high_open": open_by_severity.get(Severity.HIGH, 0),
         }
+        if include_details:
+            dashboard["details"] = list(scanner.details())
+        return dashboard
 
 if __name__ == "__main__":
     scanner = VulnerabilityScanner()
@@ -109,4 +164,4 @@ if __name__ == "__main__":
     
     print("\nFinal Dashboard:")
     dash = SecurityDashboard(scanner)
-    print(json.dumps(dash.generate_dashboard(), indent=2))
+    print(json.dumps(dash.generate_dashboard(include_details=True), indent=2))
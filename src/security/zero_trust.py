@@ -3,7 +3,7 @@ import logging
 import datetime
 import hashlib
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -21,9 +21,31 @@ class ZeroTrustFramework:
     Certificate-based authentication, MFA, RBAC, Micro-segmentation, and SDP.
     """
 
+    _CERT_SUFFIXES = ('.pem', '.crt')
+
+    # Simple RBAC policy; wildcard roles can access everything
+    _WILDCARD_ROLES: FrozenSet[Role] = frozenset({Role.ADMIN})
+    _POLICY: Dict[Role, FrozenSet[str]] = {
+        Role.USER: frozenset({"read_data", "write_own_data"}),
+        Role.GUEST: frozenset({"public_info"}),
+        Role.SERVICE: frozenset({"api_endpoints"}),
+    }
+
+    # Micro-segmentation allow list: source -> allowed destinations
+    _SEG_RULES: Dict[str, FrozenSet[str]] = {
+        "gateway": frozenset({"auth_service", "public_api"}),
+        "auth_service": frozenset({"db_users"}),
+        "public_api": frozenset({"business_logic"}),
+        "business_logic": frozenset({"db_app"}),
+        "db_users": frozenset(),  # Database shouldn't initiate connections usually
+        "db_app": frozenset(),
+    }
+
     def __init__(self):
         self.hsm_initialized = False
         self.root_of_trust = None
+        self._root_digest: Optional[bytes] = None  # raw digest, for keyed use (HMAC)
+        self._root_short = ""
         self.active_sessions: Dict[str, Dict] = {}
         self.network_segments: Dict[str, List[str]] = {}
         self.sdp_controllers: List[str] = []
@@ -36,9 +58,11 @@ class ZeroTrustFramework:
         """
         logger.info("Initializing HSM Root of Trust...")
         # Simulate hardware initialization delay and secure boot check
-        self.root_of_trust = hashlib.sha256(os.urandom(32)).hexdigest()
+        self._root_digest = hashlib.sha256(os.urandom(32)).digest()
+        self.root_of_trust = self._root_digest.hex()
+        self._root_short = self.root_of_trust[:8]
         self.hsm_initialized = True
-        logger.info(f"HSM Initialized. Root of Trust: {self.root_of_trust[:8]}...")
+        logger.info("HSM Initialized. Root of Trust: %s...", self._root_short)
 
     def authenticate_device(self, cert_path: str) -> bool:
         """
@@ -54,17 +78,20 @@ class ZeroTrustFramework:
             logger.error("HSM not initialized. Cannot authenticate.")
             return False
 
-        if not os.path.exists(cert_path):
-            logger.error(f"Certificate not found at {cert_path}")
+        try:
+            st = os.stat(cert_path)
+        except OSError as e:
+            # Same outcome as the old os.path.exists check for any stat failure
+            logger.error("Certificate not found at %s: %s", cert_path, e)
             return False
 
         # In a real implementation, we would parse and verify the X.509 certificate chain
         # using a library like `cryptography` or `OpenSSL`.
         # For this implementation, we simulate validation.
-        logger.info(f"Validating certificate: {cert_path}")
+        logger.info("Validating certificate: %s", cert_path)
         
         # Simulate check: file size > 0 and ends with .pem or .crt
-        if os.path.getsize(cert_path) > 0 and (cert_path.endswith('.pem') or cert_path.endswith('.crt')):
+        if st.st_size > 0 and cert_path.endswith(self._CERT_SUFFIXES):
             logger.info("Certificate signature verified against Root CA.")
             return True
         
@@ -84,7 +111,7 @@ class ZeroTrustFramework:
         """
         # Simulate MFA verification (e.g., TOTP check)
         # In production, integrate with an MFA provider or library (e.g., pyotp)
-        logger.info(f"Verifying MFA for user: {user_id}")
+        logger.info("Verifying MFA for user: %s", user_id)
         
         # Mock logic: Token must be 6 digits
         if len(token) == 6 and token.isdigit():
@@ -106,25 +133,16 @@ class ZeroTrustFramework:
         Returns:
             bool: True if access is granted.
         """
-        logger.info(f"Checking authorization for {user_id} ({role.value}) to access {resource}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Checking authorization for %s (%s) to access %s", user_id, role.value, resource)
         
-        # Define simple RBAC policy
-        policy = {
-            Role.ADMIN: ["*"],  # Admin can access everything
-            Role.USER: ["read_data", "write_own_data"],
-            Role.GUEST: ["public_info"],
-            Role.SERVICE: ["api_endpoints"]
-        }
-
-        allowed_resources = policy.get(role, [])
-        
-        if "*" in allowed_resources:
+        if role in self._WILDCARD_ROLES:
             return True
         
-        if resource in allowed_resources:
+        if resource in self._POLICY.get(role, frozenset()):
             return True
             
-        logger.warning(f"Access denied for {user_id} to {resource}")
+        logger.warning("Access denied for %s to %s", user_id, resource)
         return False
 
     def enforce_micro_segmentation(self, module_id: str, target_module_id: str) -> bool:
@@ -138,24 +156,10 @@ class ZeroTrustFramework:
         Returns:
             bool: True if communication is allowed.
         """
-        # Define segmentation rules (allow list)
-        # Format: source -> [allowed_destinations]
-        segmentation_rules = {
-            "gateway": ["auth_service", "public_api"],
-            "auth_service": ["db_users"],
-            "public_api": ["business_logic"],
-            "business_logic": ["db_app"],
-            "db_users": [], # Database shouldn't initiate connections usually
-            "db_app": []
-        }
-        
-        allowed_targets = segmentation_rules.get(module_id, [])
-        
-        if target_module_id in allowed_targets:
-            logger.info(f"Micro-segmentation: Allowed traffic {module_id} -> {target_module_id}")
+        if target_module_id in self._SEG_RULES.get(module_id, frozenset()):
             return True
             
-        logger.warning(f"Micro-segmentation: BLOCKED traffic {module_id} -> {target_module_id}")
+        logger.warning("Micro-segmentation: BLOCKED traffic %s -> %s", module_id, target_module_id)
         return False
 
     def configure_sdp(self, external_entity_id: str, allowed_services: List[str]):
@@ -166,11 +170,11 @@ class ZeroTrustFramework:
             external_entity_id: ID of the external entity (e.g., remote mechanic).
             allowed_services: List of services they are allowed to see.
         """
-        logger.info(f"Configuring SDP for {external_entity_id}")
+        logger.info("Configuring SDP for %s", external_entity_id)
         self.sdp_controllers.append(external_entity_id)
         # In a real system, this would update firewall rules or an SDP controller configuration
         # to "cloak" infrastructure and only reveal specific ports/services after authentication.
-        logger.info(f"SDP Tunnel established for {external_entity_id}. Visible services: {allowed_services}")
+        logger.info("SDP Tunnel established for %s. Visible services: %s", external_entity_id, allowed_services)
 
 # Example Usage
 if __name__ == "__main__":
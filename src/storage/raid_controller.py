@@ -6,10 +6,11 @@ RAID-6 array management for data protection.
 """
 
 import logging
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, ValuesView
+
+from .timestamps import iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -32,18 +33,59 @@ class ArrayStatus(Enum):
     OFFLINE = "offline"
 
 
-@dataclass
+_PROTECTED_STATES = frozenset({ArrayStatus.OPTIMAL, ArrayStatus.REBUILDING})
+
+
+@dataclass(slots=True, init=False)
 class RAIDArray:
-    """Represents a RAID array."""
+    """
+    Represents a RAID array.
+    
+    Member and spare drive ids are held as ordered sets (dict keys) for
+    O(1) removal; the drives/spare_drives properties return them as
+    lists, oldest member first.
+    """
     id: str
     level: RAIDLevel
     status: ArrayStatus
     capacity_tb: float
     usable_capacity_tb: float
     stripe_size_kb: int
-    drives: List[str]
-    spare_drives: List[str]
-    rebuild_progress_pct: Optional[float] = None
+    _drives: Dict[str, None] = field(repr=False)
+    _spares: Dict[str, None] = field(repr=False)
+    rebuild_progress_pct: Optional[float]
+    
+    def __init__(
+        self,
+        id: str,
+        level: RAIDLevel,
+        status: ArrayStatus,
+        capacity_tb: float,
+        usable_capacity_tb: float,
+        stripe_size_kb: int,
+        drives: Iterable[str],
+        spare_drives: Iterable[str],
+        rebuild_progress_pct: Optional[float] = None,
+    ):
+        self.id = id
+        self.level = level
+        self.status = status
+        self.capacity_tb = capacity_tb
+        self.usable_capacity_tb = usable_capacity_tb
+        self.stripe_size_kb = stripe_size_kb
+        self._drives = dict.fromkeys(drives)
+        self._spares = dict.fromkeys(spare_drives)
+        self.rebuild_progress_pct = rebuild_progress_pct
+    
+    @property
+    def drives(self) -> List[str]:
+        """Member drive ids."""
+        return list(self._drives)
+    
+    @property
+    def spare_drives(self) -> List[str]:
+        """Hot spare drive ids."""
+        return list(self._spares)
 
 
 class RAIDController:
@@ -60,6 +102,8 @@ class RAIDController:
     def __init__(self):
         """Initialize RAID controller."""
         self._arrays: Dict[str, RAIDArray] = {}
+        # array_id -> ((status, progress), status dict) for get_rebuild_status
+        self._rebuild_cache: Dict[str, Tuple[Tuple[ArrayStatus, Optional[float]], Dict]] = {}
         self._initialize_default_array()
         
         logger.info("RAID Controller initialized")
@@ -81,9 +125,9 @@ class RAIDController:
         """Get status of a RAID array."""
         return self._arrays.get(array_id)
     
-    def get_all_arrays(self) -> List[RAIDArray]:
+    def get_all_arrays(self) -> ValuesView[RAIDArray]:
         """Get all RAID arrays."""
-        return list(self._arrays.values())
+        return self._arrays.values()
     
     def check_redundancy(self, array_id: str = 'primary') -> Dict:
         """Check redundancy status of an array."""
@@ -97,8 +141,8 @@ class RAIDController:
             'status': array.status.value,
             'fault_tolerance': 2 if array.level == RAIDLevel.RAID_6 else 1,
             'can_lose_drives': 2 if array.status == ArrayStatus.OPTIMAL else 1,
-            'spare_drives_available': len(array.spare_drives),
-            'is_protected': array.status in [ArrayStatus.OPTIMAL, ArrayStatus.REBUILDING],
+            'spare_drives_available': len(array._spares),
+            'is_protected': array.status in _PROTECTED_STATES,
         }
     
     def start_rebuild(self, array_id: str, failed_drive: str, spare_drive: str) -> bool:
@@ -107,16 +151,14 @@ class RAIDController:
         if not array:
             return False
         
-        if spare_drive not in array.spare_drives:
+        if spare_drive not in array._spares:
             logger.error(f"Drive {spare_drive} is not a spare")
             return False
         
         # Remove failed drive and add spare
-        if failed_drive in array.drives:
-            array.drives.remove(failed_drive)
-        
-        array.spare_drives.remove(spare_drive)
-        array.drives.append(spare_drive)
+        array._drives.pop(failed_drive, None)
+        del array._spares[spare_drive]
+        array._drives[spare_drive] = None
         
         array.status = ArrayStatus.REBUILDING
         array.rebuild_progress_pct = 0.0
@@ -125,22 +167,35 @@ class RAIDController:
         return True
     
     def get_rebuild_status(self, array_id: str = 'primary') -> Optional[Dict]:
-        """Get rebuild progress."""
+        """
+        Get rebuild progress.
+        
+        The dict is cached until the array's status or progress changes;
+        each call returns a shallow copy, so callers may modify it.
+        """
         array = self._arrays.get(array_id)
         if not array:
             return None
         
+        key = (array.status, array.rebuild_progress_pct)
+        cached = self._rebuild_cache.get(array_id)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        
         if array.status != ArrayStatus.REBUILDING:
-            return {
+            result = {
                 'rebuilding': False,
                 'status': array.status.value,
             }
+        else:
+            result = {
+                'rebuilding': True,
+                'progress_pct': array.rebuild_progress_pct,
+                'estimated_time_remaining_hours': (100 - array.rebuild_progress_pct) * 0.1,
+            }
         
-        return {
-            'rebuilding': True,
-            'progress_pct': array.rebuild_progress_pct,
-            'estimated_time_remaining_hours': (100 - array.rebuild_progress_pct) * 0.1,
-        }
+        self._rebuild_cache[array_id] = (key, result)
+        return dict(result)
     
     def complete_rebuild(self, array_id: str = 'primary') -> bool:
         """Complete a rebuild operation."""
@@ -166,7 +221,7 @@ class RAIDController:
         # Simulate scrub results
         return {
             'array_id': array_id,
-            'started': datetime.now().isoformat(),
+            'started': iso_now(),
             'status': 'completed',
             'errors_found': 0,
             'errors_corrected': 0,
@@ -6,10 +6,14 @@ Manages 480TB NVMe storage array with RAID-6 protection.
 """
 
 import logging
+import random
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from .timestamps import iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +27,27 @@ class DriveStatus(Enum):
     SPARE = "spare"
 
 
-@dataclass
+# Drive status <-> uint8 code for the array-backed drive telemetry
+_STATUSES = tuple(DriveStatus)
+_STATUS_CODE = {status: code for code, status in enumerate(_STATUSES)}
+_NUM_STATUSES = len(_STATUSES)
+_HEALTHY_STATES = frozenset({DriveStatus.HEALTHY, DriveStatus.SPARE})
+
+
+def _reduce_drives(temps: np.ndarray, healths: np.ndarray, status: np.ndarray):
+    """Temperature sum, health sum and per-status drive counts."""
+    counts = np.bincount(status, minlength=_NUM_STATUSES)
+    return temps.sum(), healths.sum(), counts
+
+
+@dataclass(slots=True, frozen=True)
 class StorageDrive:
-    """Represents a storage drive."""
+    """
+    Snapshot of a storage drive.
+    
+    Built on request from StorageManager's telemetry arrays; change drive
+    state through the manager (set_drive_status, update_drive_telemetry).
+    """
     id: str
     capacity_tb: float
     status: DriveStatus
@@ -69,9 +91,26 @@ class StorageManager:
     DRIVE_CAPACITY_TB = 24  # Per drive
     SPARE_DRIVES = 2
     
-    def __init__(self):
-        """Initialize storage manager."""
-        self._drives: Dict[str, StorageDrive] = {}
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize storage manager.
+        
+        Args:
+            seed: Seed for the simulated drive telemetry and usage (None for random)
+        """
+        self._rng = np.random.default_rng(seed)
+        self._stats_rng = random.Random(seed)
+        # Per-drive state lives only in these arrays, indexed by position in
+        # _drive_ids; StorageDrive objects are snapshots built from them.
+        n = self.DRIVE_COUNT
+        self._drive_ids: List[str] = [f"NVMe-{i:02d}" for i in range(n)]
+        self._index: Dict[str, int] = {drive_id: i for i, drive_id in enumerate(self._drive_ids)}
+        self._temps = np.empty(n, dtype=np.float64)
+        self._healths = np.empty(n, dtype=np.float64)
+        self._status = np.empty(n, dtype=np.uint8)
+        self._hours = np.empty(n, dtype=np.int64)
+        self._read_errors = np.zeros(n, dtype=np.int64)
+        self._write_errors = np.zeros(n, dtype=np.int64)
         self._used_tb = 0.0
         self._initialize_drives()
         
@@ -79,46 +118,50 @@ class StorageManager:
     
     def _initialize_drives(self) -> None:
         """Initialize storage drives."""
-        import random
+        n = self.DRIVE_COUNT
+        rng = self._rng
+        self._temps[:] = 35 + rng.uniform(-3, 5, n)
+        self._healths[:] = 100 - rng.uniform(0, 2, n)
+        self._hours[:] = rng.integers(100, 5000, n, endpoint=True)
         
-        for i in range(self.DRIVE_COUNT):
-            drive_id = f"NVMe-{i:02d}"
-            
-            # Last 2 drives are spares
-            is_spare = i >= (self.DRIVE_COUNT - self.SPARE_DRIVES)
-            
-            self._drives[drive_id] = StorageDrive(
-                id=drive_id,
-                capacity_tb=self.DRIVE_CAPACITY_TB,
-                status=DriveStatus.SPARE if is_spare else DriveStatus.HEALTHY,
-                temperature_c=35 + random.uniform(-3, 5),
-                health_pct=100 - random.uniform(0, 2),
-                power_on_hours=random.randint(100, 5000),
-                read_errors=0,
-                write_errors=0,
-            )
+        # Last 2 drives are spares
+        self._status[:] = _STATUS_CODE[DriveStatus.HEALTHY]
+        self._status[n - self.SPARE_DRIVES:] = _STATUS_CODE[DriveStatus.SPARE]
+    
+    def _snapshot(self, i: int) -> StorageDrive:
+        """Build the StorageDrive snapshot for the drive at array index i."""
+        return StorageDrive(
+            id=self._drive_ids[i],
+            capacity_tb=self.DRIVE_CAPACITY_TB,
+            status=_STATUSES[self._status[i]],
+            temperature_c=float(self._temps[i]),
+            health_pct=float(self._healths[i]),
+            power_on_hours=int(self._hours[i]),
+            read_errors=int(self._read_errors[i]),
+            write_errors=int(self._write_errors[i]),
+        )
     
     def get_stats(self) -> StorageStats:
         """Get current storage statistics."""
-        import random
-        
-        healthy_drives = sum(
-            1 for d in self._drives.values()
-            if d.status in [DriveStatus.HEALTHY, DriveStatus.SPARE]
-        )
+        return self._stats_from_counts(self._scan_drives()[0])
+    
+    def _stats_from_counts(self, counts: Dict[DriveStatus, int]) -> StorageStats:
+        """Build statistics from per-status drive counts."""
+        healthy_drives = sum(counts[status] for status in _HEALTHY_STATES)
         
         # Simulate usage
-        used = 72 + random.uniform(-5, 10)
+        r = self._stats_rng
+        used = 72 + r.uniform(-5, 10)
         
         return StorageStats(
             total_capacity_tb=self.TOTAL_CAPACITY_TB,
             used_capacity_tb=used,
             free_capacity_tb=self.TOTAL_CAPACITY_TB - used,
             utilization_pct=(used / self.TOTAL_CAPACITY_TB) * 100,
-            read_iops=2500000 + random.randint(-100000, 200000),
-            write_iops=1800000 + random.randint(-100000, 150000),
-            read_throughput_gbps=28 + random.uniform(-2, 1),
-            write_throughput_gbps=24 + random.uniform(-2, 1),
+            read_iops=2500000 + r.randint(-100000, 200000),
+            write_iops=1800000 + r.randint(-100000, 150000),
+            read_throughput_gbps=28 + r.uniform(-2, 1),
+            write_throughput_gbps=24 + r.uniform(-2, 1),
             raid_status="optimal",
             drives_healthy=healthy_drives,
             drives_total=self.DRIVE_COUNT,
@@ -126,71 +169,107 @@ class StorageManager:
     
     def get_drive_status(self, drive_id: str) -> Optional[StorageDrive]:
         """Get status of a specific drive."""
-        return self._drives.get(drive_id)
+        i = self._index.get(drive_id)
+        return None if i is None else self._snapshot(i)
     
     def get_all_drives(self) -> List[StorageDrive]:
         """Get status of all drives."""
-        return list(self._drives.values())
+        return [self._snapshot(i) for i in range(len(self._drive_ids))]
+    
+    def set_drive_status(self, drive_id: str, status: DriveStatus) -> bool:
+        """
+        Change a drive's status.
+        
+        Returns:
+            False if the drive is unknown
+        """
+        i = self._index.get(drive_id)
+        if i is None:
+            return False
+        self._status[i] = _STATUS_CODE[status]
+        return True
+    
+    def update_drive_telemetry(
+        self,
+        drive_id: str,
+        temperature_c: Optional[float] = None,
+        health_pct: Optional[float] = None
+    ) -> bool:
+        """
+        Record new temperature and/or health readings for a drive.
+        
+        Returns:
+            False if the drive is unknown
+        """
+        i = self._index.get(drive_id)
+        if i is None:
+            return False
+        if temperature_c is not None:
+            self._temps[i] = temperature_c
+        if health_pct is not None:
+            self._healths[i] = health_pct
+        return True
+    
+    def _scan_drives(self) -> Tuple[Dict[DriveStatus, int], float, float]:
+        """Single reduction over the drives: (count per status, temperature sum, health sum)."""
+        temp_sum, health_sum, counts = _reduce_drives(self._temps, self._healths, self._status)
+        return dict(zip(_STATUSES, counts.tolist())), float(temp_sum), float(health_sum)
     
     def check_raid_health(self) -> Dict[str, Any]:
         """Check RAID array health."""
-        failed = [d for d in self._drives.values() if d.status == DriveStatus.FAILED]
-        degraded = [d for d in self._drives.values() if d.status == DriveStatus.DEGRADED]
-        rebuilding = [d for d in self._drives.values() if d.status == DriveStatus.REBUILDING]
+        return self._raid_health(self._scan_drives()[0])
+    
+    def _raid_health(self, counts: Dict[DriveStatus, int]) -> Dict[str, Any]:
+        """RAID health from per-status drive counts."""
+        failed = counts[DriveStatus.FAILED]
+        degraded = counts[DriveStatus.DEGRADED]
+        rebuilding = counts[DriveStatus.REBUILDING]
         
-        if len(failed) >= 3:
+        if failed >= 3:
             status = "critical"
-        elif len(failed) >= 1 or len(degraded) >= 2:
+        elif failed >= 1 or degraded >= 2:
             status = "degraded"
-        elif len(rebuilding) > 0:
+        elif rebuilding > 0:
             status = "rebuilding"
         else:
             status = "optimal"
         
         return {
             'status': status,
-            'failed_drives': len(failed),
-            'degraded_drives': len(degraded),
-            'rebuilding_drives': len(rebuilding),
-            'can_survive_failure': len(failed) < 2,
-            'spare_drives_available': sum(
-                1 for d in self._drives.values() if d.status == DriveStatus.SPARE
-            ),
+            'failed_drives': failed,
+            'degraded_drives': degraded,
+            'rebuilding_drives': rebuilding,
+            'can_survive_failure': failed < 2,
+            'spare_drives_available': counts[DriveStatus.SPARE],
         }
     
     def simulate_drive_failure(self, drive_id: str) -> bool:
         """Simulate a drive failure for testing."""
-        if drive_id not in self._drives:
+        if not self.set_drive_status(drive_id, DriveStatus.FAILED):
             return False
         
-        drive = self._drives[drive_id]
-        drive.status = DriveStatus.FAILED
-        
         # Find a spare and start rebuild
-        for spare_id, spare in self._drives.items():
-            if spare.status == DriveStatus.SPARE:
-                spare.status = DriveStatus.REBUILDING
-                logger.warning(f"Drive {drive_id} failed, rebuilding on {spare_id}")
-                break
+        spares = np.flatnonzero(self._status == _STATUS_CODE[DriveStatus.SPARE])
+        if spares.size:
+            spare_id = self._drive_ids[spares[0]]
+            self.set_drive_status(spare_id, DriveStatus.REBUILDING)
+            logger.warning(f"Drive {drive_id} failed, rebuilding on {spare_id}")
         
         return True
     
     def get_health_report(self) -> Dict[str, Any]:
         """Generate comprehensive health report."""
-        stats = self.get_stats()
-        raid = self.check_raid_health()
+        counts, temp_sum, health_sum = self._scan_drives()
+        stats = self._stats_from_counts(counts)
+        raid = self._raid_health(counts)
         
-        drives_by_status = {}
-        for status in DriveStatus:
-            drives_by_status[status.value] = sum(
-                1 for d in self._drives.values() if d.status == status
-            )
+        drives_by_status = {status.value: n for status, n in counts.items()}
         
-        avg_temp = sum(d.temperature_c for d in self._drives.values()) / len(self._drives)
-        avg_health = sum(d.health_pct for d in self._drives.values()) / len(self._drives)
+        avg_temp = temp_sum / len(self._drive_ids)
+        avg_health = health_sum / len(self._drive_ids)
         
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': iso_now(),
             'overall_status': raid['status'],
             'capacity': {
                 'total_tb': stats.total_capacity_tb,
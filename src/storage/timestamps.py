@@ -0,0 +1,30 @@
+"""
+Timestamps
+==========
+
+Cheap ISO-8601 timestamps for storage health polling.
+"""
+
+import time
+from datetime import datetime
+from typing import Tuple
+
+# (whole second, formatted string); replaced as one tuple so readers on
+# other threads never see a mismatched pair.
+_cached: Tuple[int, str] = (-1, "")
+
+
+def iso_now() -> str:
+    """
+    Current local time in ISO-8601, at one-second resolution.
+
+    The formatted string is rebuilt only when the second changes, so
+    high-rate pollers skip building a datetime on every call.
+    """
+    global _cached
+    sec = int(time.time())
+    cached_sec, text = _cached
+    if sec != cached_sec:
+        text = datetime.fromtimestamp(sec).isoformat()
+        _cached = (sec, text)
+    return text
@@ -21,17 +21,14 @@ class SecurityTestSuite:
         
         # Simulate 3 failed logins
         for i in range(3):
-            self.soc.process_event("AuthServer", "Failed login attempt", {"ip": attacker_ip})
-            time.sleep(0.01)
+            self.soc.process_event("AuthServer", "Failed login attempt", {"ip": attacker_ip},
+                                   timestamp=start_time + i * 0.001)
+        self.soc.flush()
             
         # Check for incident
-        detected = False
-        detection_time = 0
-        for inc in self.soc.engine.incidents:
-            if attacker_ip in inc.description:
-                detected = True
-                detection_time = inc.timestamp - start_time
-                break
+        incidents = self.soc.engine.incidents_by_ip.get(attacker_ip, [])
+        detected = bool(incidents)
+        detection_time = incidents[0].timestamp - start_time if detected else 0
         
         # Check for response
         blocked = attacker_ip in self.soc.response.active_blocks
@@ -59,8 +56,8 @@ class SecurityTestSuite:
             target_cve = scan_results[0].cve_id
             self.vuln_scanner.remediate_vuln(target_cve, self.patch_manager)
             
-        # Rescan
-        post_patch_results = self.vuln_scanner.scan_system()
+        # Rescan (delta against the initial findings)
+        post_patch_results = self.vuln_scanner.rescan(scan_results)
         final_count = len(post_patch_results)
         
         self.results["vuln_mgmt"] = {
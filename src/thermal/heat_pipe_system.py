@@ -1,5 +1,34 @@
 import math
 
+import numpy as np
+
+STEFAN_BOLTZMANN = 5.67e-8  # W/(m²·K⁴)
+
+
+def _dissipation(panel_temp_c, ambient_temp_c, fan_speed_rpm, emissivity, surface_area_m2):
+    """
+    Radiated plus convected watts from a panel (see RadiatorPanel).
+    Pure arithmetic, so it works on scalars and elementwise on arrays.
+    """
+    # Stefan-Boltzmann Law for Radiation: P = ε * σ * A * (T_obj^4 - T_env^4)
+    # Factored as (T_obj - T_env)(T_obj + T_env)(T_obj² + T_env²): no pow
+    # call, and no cancellation between two large quartics near ambient.
+    t_panel_k = panel_temp_c + 273.15
+    t_ambient_k = ambient_temp_c + 273.15
+    t4_diff = ((panel_temp_c - ambient_temp_c) * (t_panel_k + t_ambient_k)
+               * (t_panel_k * t_panel_k + t_ambient_k * t_ambient_k))
+    radiation_watts = emissivity * STEFAN_BOLTZMANN * surface_area_m2 * t4_diff
+
+    # Convection: P = h * A * ΔT
+    # Natural convection h ~ 10. Forced convection h can be 50-150 depending on airflow.
+    # Simple model: h = 10 + (fan_speed_rpm / 50.0)
+    # Max fan speed 5000 RPM -> h = 10 + 100 = 110 W/m²K
+    h_convection = 10.0 + (fan_speed_rpm / 50.0)
+    convection_watts = h_convection * surface_area_m2 * (panel_temp_c - ambient_temp_c)
+
+    return radiation_watts + convection_watts
+
+
 class HeatPipe:
     """
     Models a copper/water heat pipe.
@@ -22,6 +51,39 @@ class HeatPipe:
         length_m = self.length_mm / 1000.0
         return length_m / (effective_conductivity * self.cross_sectional_area_m2)
 
+class HeatPipeArray:
+    """
+    A bank of heat pipes stored as per-pipe NumPy arrays (one entry per pipe).
+    """
+    def __init__(self, diameters_mm, lengths_mm, thermal_conductivity_w_mk=400.0):
+        self.diameters_mm = np.asarray(diameters_mm, dtype=np.float64)
+        self.lengths_mm = np.broadcast_to(np.asarray(lengths_mm, dtype=np.float64), self.diameters_mm.shape)
+        self.thermal_conductivity = np.broadcast_to(
+            np.asarray(thermal_conductivity_w_mk, dtype=np.float64), self.diameters_mm.shape)
+        self.cross_sectional_area_m2 = np.pi * ((self.diameters_mm / 1000.0) / 2) ** 2
+        # Same model as HeatPipe: R = L / (k_eff * A), k_eff = 100 * k
+        self.thermal_resistance = (self.lengths_mm / 1000.0) / (
+            self.thermal_conductivity * 100 * self.cross_sectional_area_m2)
+
+    @classmethod
+    def uniform(cls, count: int, diameter_mm: float, length_mm: float,
+                thermal_conductivity_w_mk: float = 400.0) -> "HeatPipeArray":
+        """
+        Builds a bank of identical pipes.
+        """
+        return cls(np.full(count, diameter_mm), length_mm, thermal_conductivity_w_mk)
+
+    def __len__(self) -> int:
+        return self.diameters_mm.shape[0]
+
+    def parallel_resistance(self) -> float:
+        """
+        Combined resistance of all pipes in parallel (°C/W).
+        """
+        if len(self) == 0:
+            return float('inf')
+        return float(1.0 / np.sum(1.0 / self.thermal_resistance))
+
 class VaporChamber:
     """
     Models a vapor chamber for CPU/GPU contact.
@@ -46,48 +108,52 @@ class RadiatorPanel:
         """
         Calculates heat dissipation via radiation and convection (natural or forced).
         """
-        # Stefan-Boltzmann Law for Radiation: P = ε * σ * A * (T_obj^4 - T_env^4)
-        sigma = 5.67e-8
-        t_panel_k = panel_temp_c + 273.15
-        t_ambient_k = ambient_temp_c + 273.15
-        
-        radiation_watts = self.emissivity * sigma * self.surface_area_m2 * (t_panel_k**4 - t_ambient_k**4)
-        
-        # Convection: P = h * A * ΔT
-        # Natural convection h ~ 10. Forced convection h can be 50-150 depending on airflow.
-        # Simple model: h = 10 + (fan_speed_rpm / 50.0)
-        # Max fan speed 5000 RPM -> h = 10 + 100 = 110 W/m²K
-        h_convection = 10.0 + (fan_speed_rpm / 50.0)
-        convection_watts = h_convection * self.surface_area_m2 * (panel_temp_c - ambient_temp_c)
-        
-        return radiation_watts + convection_watts
+        return _dissipation(float(panel_temp_c), float(ambient_temp_c), float(fan_speed_rpm),
+                            self.emissivity, self.surface_area_m2)
+
+    def calculate_heat_dissipation_batch(self, panel_temps_c: np.ndarray, ambient_temps_c: np.ndarray,
+                                         fan_speeds_rpm: np.ndarray) -> np.ndarray:
+        """
+        Elementwise calculate_heat_dissipation over arrays of operating points.
+        """
+        return _dissipation(np.asarray(panel_temps_c, dtype=np.float64),
+                            np.asarray(ambient_temps_c, dtype=np.float64),
+                            np.asarray(fan_speeds_rpm, dtype=np.float64),
+                            self.emissivity, self.surface_area_m2)
 
 class CoolingSystem:
     """
     Integrates heat pipes, vapor chambers, and radiators.
     """
     def __init__(self):
-        self.heat_pipes = [HeatPipe(8.0, 300.0) for _ in range(48)]
+        self.heat_pipes = HeatPipeArray.uniform(48, 8.0, 300.0)
         self.cpu_vapor_chamber = VaporChamber(100.0, 100.0, 5.0)
         self.gpu_vapor_chambers = [VaporChamber(80.0, 80.0, 5.0) for _ in range(8)]
         self.radiator = RadiatorPanel(4.0)
+        # Components are fixed after construction, so the aggregate is too.
+        self._total_resistance = self._compute_total_thermal_resistance()
 
     def calculate_total_thermal_resistance(self) -> float:
+        """
+        Returns the aggregate thermal resistance of the system (°C/W).
+        """
+        return self._total_resistance
+
+    def _compute_total_thermal_resistance(self) -> float:
         """
         Calculates the aggregate thermal resistance of the system.
         Parallel heat pipes reduce resistance.
         """
         # Resistance of 48 heat pipes in parallel
-        if not self.heat_pipes:
-            return float('inf')
-        
-        single_pipe_r = self.heat_pipes[0].thermal_resistance
-        heat_pipes_r = single_pipe_r / len(self.heat_pipes)
+        heat_pipes_r = self.heat_pipes.parallel_resistance()
+        if math.isinf(heat_pipes_r):
+            return heat_pipes_r
         
         # Total R = Vapor Chamber + Heat Pipes + Interface Materials (assumed small)
         # We average the vapor chamber resistance contribution
         total_vapor_r = (self.cpu_vapor_chamber.thermal_resistance + 
-                         sum(vc.thermal_resistance for vc in self.gpu_vapor_chambers) / 8) / 2
+                         sum(vc.thermal_resistance for vc in self.gpu_vapor_chambers)
+                         / len(self.gpu_vapor_chambers)) / 2
         
         # Target is < 0.8 °C/W. 
         # This is a simplified system level resistance metric.
@@ -97,5 +163,5 @@ class CoolingSystem:
         return {
             "heat_pipes_count": len(self.heat_pipes),
             "radiator_area_m2": self.radiator.surface_area_m2,
-            "thermal_resistance_cw": self.calculate_total_thermal_resistance()
+            "thermal_resistance_cw": self._total_resistance
         }
@@ -1,6 +1,37 @@
 import time
 from typing import Dict, List
 
+import numpy as np
+
+MAX_FAN_RPM = 5000.0
+NUM_CPUS = 4
+NUM_GPUS = 8
+
+
+def _ambient_gain(ambient_temp_c):
+    """
+    Adaptive gain based on ambient.
+    """
+    if ambient_temp_c > 40.0:
+        return 1.5  # Boost cooling in hot environments
+    elif ambient_temp_c < -20.0:
+        return 0.5  # Reduce cooling in cold environments (save power)
+    return 1.0
+
+
+def _demand(hottest_c, target_c, ambient_temp_c, max_rpm):
+    """
+    Proportional fan demand (RPM), clamped to [0, max_rpm].
+    """
+    # PID-like proportional control (simplified)
+    demand = (hottest_c - target_c) * 100.0 * _ambient_gain(ambient_temp_c) # Increased gain
+    if demand < 0.0:
+        return 0.0
+    if demand > max_rpm:
+        return max_rpm
+    return demand
+
+
 class ThermalController:
     """
     Manages the thermal state of the compute system.
@@ -10,59 +41,70 @@ class ThermalController:
         self.target_temp_c = target_temp_c
         self.max_temp_c = max_temp_c
         self.current_ambient_temp_c = 25.0
-        self.cpu_temps: List[float] = [25.0] * 4
-        self.gpu_temps: List[float] = [25.0] * 8
+        self._cpu_temps: List[float] = [25.0] * NUM_CPUS
+        self._gpu_temps: List[float] = [25.0] * NUM_GPUS
         self.cooling_power_percent = 0.0  # 0.0 to 100.0
+        self._hottest = 25.0
+        self._demand_stale = True  # inputs changed since cooling_power_percent was set
 
     def update_ambient_temperature(self, temp_c: float):
         """
         Updates the external ambient temperature reading.
         """
         self.current_ambient_temp_c = temp_c
+        self._demand_stale = True
 
     def update_component_temperatures(self, cpu_temps: List[float], gpu_temps: List[float]):
         """
         Updates the internal component temperatures.
         """
-        self.cpu_temps = cpu_temps
-        self.gpu_temps = gpu_temps
+        self._cpu_temps = list(cpu_temps)
+        self._gpu_temps = list(gpu_temps)
+        self._hottest = max(max(self._cpu_temps), max(self._gpu_temps))
+        self._demand_stale = True
+
+    @property
+    def cpu_temps(self) -> List[float]:
+        """Copy of the CPU readings; update via update_component_temperatures."""
+        return list(self._cpu_temps)
+
+    @property
+    def gpu_temps(self) -> List[float]:
+        """Copy of the GPU readings; update via update_component_temperatures."""
+        return list(self._gpu_temps)
 
     def _calculate_cooling_demand(self) -> float:
         """
         Calculates the required cooling power based on the hottest component.
         """
-        max_cpu = max(self.cpu_temps)
-        max_gpu = max(self.gpu_temps)
-        hottest_component = max(max_cpu, max_gpu)
+        return _demand(float(self._hottest), self.target_temp_c,
+                       float(self.current_ambient_temp_c), MAX_FAN_RPM) # Return RPM
 
-        # PID-like proportional control (simplified)
-        error = hottest_component - self.target_temp_c
-        
-        # Adaptive strategy based on ambient
-        ambient_factor = 1.0
-        if self.current_ambient_temp_c > 40.0:
-            ambient_factor = 1.5  # Boost cooling in hot environments
-        elif self.current_ambient_temp_c < -20.0:
-            ambient_factor = 0.5  # Reduce cooling in cold environments (save power)
-
-        demand = error * 100.0 * ambient_factor # Increased gain
-        return max(0.0, min(5000.0, demand)) # Return RPM, max 5000
+    def calculate_cooling_demand_batch(self, hottest_temps: np.ndarray) -> np.ndarray:
+        """
+        Cooling demand (RPM) for several independent hottest-component readings.
+        Stateless counterpart of run_control_loop for batch simulations.
+        """
+        error = np.asarray(hottest_temps, dtype=np.float64) - self.target_temp_c
+        return np.clip(error * 100.0 * _ambient_gain(float(self.current_ambient_temp_c)), 0.0, MAX_FAN_RPM)
 
     def run_control_loop(self):
         """
         Executes one iteration of the thermal control logic.
         """
-        self.cooling_power_percent = self._calculate_cooling_demand() # This is now RPM
+        if self._demand_stale:
+            self.cooling_power_percent = self._calculate_cooling_demand() # This is now RPM
+            self._demand_stale = False
         
         # Safety check: Throttling warning
-        if max(max(self.cpu_temps), max(self.gpu_temps)) >= self.max_temp_c:
+        if self._hottest >= self.max_temp_c:
             return "THROTTLE_WARNING"
         return "NORMAL"
 
     def get_status(self) -> Dict:
         return {
             "ambient_temp_c": self.current_ambient_temp_c,
-            "max_component_temp_c": max(max(self.cpu_temps), max(self.gpu_temps)),
+            "max_component_temp_c": self._hottest,
             "cooling_power_percent": self.cooling_power_percent,
             "status": self.run_control_loop()
         }
@@ -0,0 +1,16 @@
+"""
+Shared pytest setup.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "serial: writes shared files under data/; keep out of parallel (xdist) runs"
+    )
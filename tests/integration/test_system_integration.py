@@ -3,10 +3,6 @@ Integration tests for PodX system components.
 """
 
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from core.orchestrator import SystemOrchestrator, SystemState
 from core.config_manager import ConfigManager
@@ -14,6 +10,13 @@ from monitoring.system_monitor import SystemMonitor, HealthStatus
 from benchmark.xdop_engine import XdoPBenchmarkEngine
 
 
+@pytest.fixture(scope="module")
+def benchmark_result():
+    """One simulated full benchmark run, shared by tests that only read it."""
+    engine = XdoPBenchmarkEngine(config={'simulation': True})
+    return engine.run_full_benchmark(simulation_mode=True)
+
+
 class TestSystemIntegration:
     """Integration tests for system components."""
     
@@ -37,13 +40,9 @@ class TestSystemIntegration:
         validation = config.validate()
         assert validation['valid'] is True
     
-    def test_benchmark_with_config(self):
+    def test_benchmark_with_config(self, benchmark_result):
         """Test benchmark engine respects configuration."""
-        config = ConfigManager()
-        engine = XdoPBenchmarkEngine(config={'simulation': True})
-        
-        result = engine.run_full_benchmark(simulation_mode=True)
-        assert result.wcbi_score >= 85
+        assert benchmark_result.wcbi_score >= 85
     
     def test_monitor_health_tracking(self):
         """Test system monitor health tracking."""
@@ -76,10 +75,9 @@ class TestSystemIntegration:
 class TestXdoPCompliance:
     """Integration tests for XdoP compliance."""
     
-    def test_level_3_requirements(self):
+    def test_level_3_requirements(self, benchmark_result):
         """Test all Level 3 requirements are met."""
-        engine = XdoPBenchmarkEngine()
-        result = engine.run_full_benchmark(simulation_mode=True)
+        result = benchmark_result
         
         # Check overall WCBI
         assert result.wcbi_score >= 85, f"WCBI {result.wcbi_score} < 85"
@@ -98,6 +96,7 @@ class TestXdoPCompliance:
         
         assert status.ddil_autonomy_remaining_hours >= 12
     
+    @pytest.mark.serial
     def test_certification_readiness(self):
         """Test certification readiness."""
         from benchmark.certification import CertificationManager
@@ -1,102 +1,298 @@
-import unittest
 import os
-import sys
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 
-# Add src to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src')))
+import numpy as np
+import pytest
 
 from security.zero_trust import ZeroTrustFramework, Role
-from security.crypto_engine import CryptoEngine
+from security import crypto_engine
+from security.crypto_engine import CryptoEngine, _PQCleanKyber, KYBER_CT_BYTES, KYBER_PK_BYTES
 from security.data_sovereignty import DataSovereignty, DataClassification
 from security.threat_protection import ThreatProtection
 from compliance.compliance_manager import ComplianceManager
 
-class TestSecurityArchitecture(unittest.TestCase):
-
-    def setUp(self):
-        self.zt = ZeroTrustFramework()
-        self.ce = CryptoEngine()
-        self.ds = DataSovereignty()
-        self.tp = ThreatProtection()
-        self.cm = ComplianceManager()
-
-    def test_zero_trust_authentication(self):
-        """Test Zero Trust Authentication and RBAC"""
-        # Create a dummy cert
-        with open("test_cert.pem", "w") as f:
-            f.write("-----BEGIN CERTIFICATE-----\nMOCK\n-----END CERTIFICATE-----")
-        
-        try:
-            self.assertTrue(self.zt.authenticate_device("test_cert.pem"))
-            self.assertTrue(self.zt.verify_mfa("user1", "123456"))
-            self.assertTrue(self.zt.authorize_access("user1", Role.ADMIN, "restricted_area"))
-            self.assertFalse(self.zt.authorize_access("guest1", Role.GUEST, "restricted_area"))
-        finally:
-            if os.path.exists("test_cert.pem"):
-                time.sleep(0.1)
-                try:
-                    os.remove("test_cert.pem")
-                except PermissionError:
-                    pass
-
-    def test_crypto_engine(self):
-        """Test Cryptographic Operations"""
-        key = os.urandom(32)
+
+# Module-scoped components are built once per worker: ThreatProtection alone
+# takes ~0.5s to load IDS rules
+@pytest.fixture(scope="module")
+def zt():
+    return ZeroTrustFramework()
+
+
+@pytest.fixture(scope="module")
+def ce():
+    return CryptoEngine()
+
+
+@pytest.fixture(scope="module")
+def aes_key():
+    return os.urandom(32)
+
+
+@pytest.fixture(scope="module")
+def kyber_pair(ce):
+    return ce.generate_kyber_key_pair()
+
+
+@pytest.fixture(scope="module")
+def tp():
+    return ThreatProtection()
+
+
+@pytest.fixture(scope="module")
+def cm():
+    return ComplianceManager()
+
+
+@pytest.fixture(scope="module")
+def cert_path(tmp_path_factory):
+    """Mock device certificate, removed with pytest's temp directory."""
+    path = tmp_path_factory.mktemp("certs") / "test_cert.pem"
+    path.write_text("-----BEGIN CERTIFICATE-----\nMOCK\n-----END CERTIFICATE-----")
+    return str(path)
+
+
+@pytest.fixture
+def ds():
+    # Per-test state: the audit ledger is checked by length
+    return DataSovereignty()
+
+
+@pytest.fixture
+def threat_protection(tp):
+    tp.active_threats.clear()
+    return tp
+
+
+class TestZeroTrust:
+    """Zero Trust authentication and RBAC."""
+
+    def test_authenticate_device(self, zt, cert_path):
+        assert zt.authenticate_device(cert_path)
+
+    def test_verify_mfa(self, zt):
+        assert zt.verify_mfa("user1", "123456")
+
+    @pytest.mark.parametrize("user,role,area,expected", [
+        ("user1", Role.ADMIN, "restricted_area", True),
+        ("guest1", Role.GUEST, "restricted_area", False),
+    ])
+    def test_authorize_access(self, zt, user, role, area, expected):
+        assert zt.authorize_access(user, role, area) == expected
+
+
+class TestCryptoEngine:
+    """Cryptographic operations."""
+
+    def test_aes_gcm_round_trip(self, ce, aes_key):
+        data = b"Secret Message"
+        nonce, ct, tag = ce.encrypt_data(data, aes_key)
+        assert ce.decrypt_data(nonce, ct, tag, aes_key) == data
+
+    def test_aes_contexts_are_per_engine(self, aes_key):
+        engine = CryptoEngine()
+        nonce, ct, tag = engine.encrypt_data(b"data", aes_key)
+        assert len(engine._aes_contexts) == 1
+        assert aes_key not in engine._aes_contexts  # keyed by digest, not the key
+        assert not CryptoEngine()._aes_contexts
+
+        engine.retire_key(aes_key)
+        assert not engine._aes_contexts
+        assert engine.decrypt_data(nonce, ct, tag, aes_key) == b"data"
+        engine.close()
+        assert not engine._aes_contexts
+
+    def test_aes_context_cache_is_thread_safe(self):
+        # Concurrent lookups and evictions must not race move_to_end/popitem
+        engine = CryptoEngine()
+        keys = [os.urandom(32) for _ in range(crypto_engine.AES_CONTEXT_CACHE_SIZE * 2)]
+
+        def work(offset):
+            for i in range(200):
+                key = keys[(offset + i) % len(keys)]
+                nonce, ct, tag = engine.encrypt_data(b"x", key)
+                assert engine.decrypt_data(nonce, ct, tag, key) == b"x"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        assert len(engine._aes_contexts) <= crypto_engine.AES_CONTEXT_CACHE_SIZE
+
+    @pytest.mark.skipif(not crypto_engine.CRYPTO_LIB_AVAILABLE, reason="needs cryptography")
+    def test_rsa_key_pairs_match_single_key_type(self, ce):
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        pairs = ce.generate_rsa_key_pairs(2, max_workers=2)
+        assert len(pairs) == 2
+        private_key, public_key = pairs[0]
+        single_private, _ = ce.generate_rsa_key_pair()
+        assert type(private_key) is type(single_private)
+        assert private_key.public_key().public_numbers() == public_key.public_numbers()
+        assert private_key.private_numbers().dmp1  # CRT components survive the PEM hop
+        signature = private_key.sign(b"payload", padding.PKCS1v15(), hashes.SHA256())
+        public_key.verify(signature, b"payload", padding.PKCS1v15(), hashes.SHA256())
+
+    def test_sha3_digest(self, ce):
+        # SHA-3-512, whole buffer and streamed chunks
         data = b"Secret Message"
-        
-        # AES-256-GCM
-        nonce, ct, tag = self.ce.encrypt_data(data, key)
-        decrypted = self.ce.decrypt_data(nonce, ct, tag, key)
-        self.assertEqual(data, decrypted)
-        
+        digest = ce.hash_data(data)
+        assert len(digest) == 64
+        assert ce.hash_stream([data[:6], data[6:]]) == digest
+
+    def test_kyber_encapsulation(self, ce, kyber_pair):
         # Post-Quantum Kyber Mock
-        sk, pk = self.ce.generate_kyber_key_pair()
-        self.assertTrue(len(pk) > 0)
-        ct_pqc, ss = self.ce.encapsulate_key(pk)
-        self.assertTrue(len(ct_pqc) > 0)
-
-    def test_data_sovereignty(self):
-        """Test Data Sovereignty Controls"""
-        tag = self.ds.classify_data({}, "military_comms")
-        self.assertEqual(tag, DataClassification.TOP_SECRET)
-        
-        # Should block Top Secret to Cloud
-        allowed = self.ds.check_exfiltration_policy(tag, "cloud_storage")
-        self.assertFalse(allowed)
-        
-        # Should allow Public to Cloud
-        public_tag = self.ds.classify_data({}, "infotainment")
-        allowed = self.ds.check_exfiltration_policy(public_tag, "cloud_storage")
-        self.assertTrue(allowed)
-
-    def test_compliance_manager(self):
-        """Test Compliance Checks"""
-        status = self.cm.run_compliance_check()
-        self.assertTrue(status["FedRAMP_High"])
-        self.assertTrue(status["ITAR"])
-        report = self.cm.generate_audit_report()
-        self.assertIn("COMPLIANCE AUDIT REPORT", report)
-
-    def test_threat_protection(self):
-        """Test Threat Detection and Response"""
-        # Anomaly Detection
+        sk, pk = kyber_pair
+        assert len(pk) > 0
+        ct_pqc, ss = ce.encapsulate_key(pk)
+        assert len(ct_pqc) > 0
+        batch = ce.encapsulate_keys(pk, 3)
+        assert len(batch) == 3
+        assert len({ss for _, ss in batch}) == 3
+
+    @pytest.mark.parametrize("enabled,expected", [
+        (["Kyber768", "ML-KEM-768"], "ML-KEM-768"),
+        (["Kyber768"], "Kyber768"),
+        (["ML-KEM-1024"], None),
+    ])
+    def test_oqs_mechanism_selection(self, monkeypatch, enabled, expected):
+        # Builds without Kyber768 must not break engine construction
+        def kem(alg, secret_key=None):
+            if alg not in enabled:
+                raise RuntimeError(f"{alg} is not enabled")
+            return types.SimpleNamespace(alg=alg)
+
+        fake_oqs = types.SimpleNamespace(get_enabled_kem_mechanisms=lambda: enabled, KeyEncapsulation=kem)
+        monkeypatch.setattr(crypto_engine, "oqs", fake_oqs, raising=False)
+        monkeypatch.setattr(crypto_engine, "OQS_AVAILABLE", True)
+
+        engine = CryptoEngine()
+        assert engine._kyber_alg == expected
+        assert (engine._kyber is None) == (expected is None)
+
+    def test_oqs_handle_keys_stay_paired(self, monkeypatch):
+        # Concurrent keygen on the shared handle must not hand out another
+        # caller's secret key, and decap must use the key it was given
+        class FakeKEM:
+            def __init__(self, alg, secret_key=None):
+                self.sk = secret_key
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def generate_keypair(self):
+                tag = os.urandom(8)
+                self.sk = b"sk" + tag
+                time.sleep(0)  # invite a thread switch between keygen and export
+                return b"pk" + tag
+
+            def export_secret_key(self):
+                return self.sk
+
+            def decap_secret(self, ciphertext):
+                return self.sk
+
+        fake_oqs = types.SimpleNamespace(get_enabled_kem_mechanisms=lambda: ["ML-KEM-768"], KeyEncapsulation=FakeKEM)
+        monkeypatch.setattr(crypto_engine, "oqs", fake_oqs, raising=False)
+        monkeypatch.setattr(crypto_engine, "OQS_AVAILABLE", True)
+        monkeypatch.setattr(crypto_engine, "_load_pqclean_kyber", lambda allow_portable: None)
+        engine = CryptoEngine()
+
+        def work(_):
+            for _ in range(200):
+                sk, pk = engine.generate_kyber_key_pair()
+                assert sk[2:] == pk[2:]
+                assert engine.decapsulate_key(sk, b"ct") == sk
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+
+    def test_pqclean_rejects_short_buffers(self):
+        # Native code reads fixed-size buffers; short input must never reach it
+        calls = []
+
+        class FakeLib:
+            def __getattr__(self, name):
+                def fn(*args):
+                    calls.append(name)
+                    return 0
+                return fn
+
+        kyber = _PQCleanKyber(FakeLib(), "PQCLEAN_KYBER768_CLEAN")
+        with pytest.raises(ValueError):
+            kyber.encap(b"\x00" * (KYBER_PK_BYTES - 1))
+        with pytest.raises(ValueError):
+            kyber.decap(b"\x00" * 32, b"\x00" * KYBER_CT_BYTES)
+        assert calls == []
+
+
+class TestDataSovereignty:
+    """Data sovereignty controls."""
+
+    @pytest.mark.parametrize("source,destination,allowed", [
+        ("military_comms", "cloud_storage", False),  # Top Secret blocked from cloud
+        ("infotainment", "cloud_storage", True),     # Public allowed to cloud
+    ])
+    def test_exfiltration_policy(self, ds, source, destination, allowed):
+        tag = ds.classify_data({}, source)
+        assert ds.check_exfiltration_policy(tag, destination) == allowed
+
+    def test_classification(self, ds):
+        assert ds.classify_data({}, "military_comms") == DataClassification.TOP_SECRET
+
+    def test_audit_chain(self, ds):
+        tag = ds.classify_data({}, "military_comms")
+        ds.check_exfiltration_policy(tag, "cloud_storage")
+
+        # Blocked attempt above is chained immediately, ahead of later events
+        assert len(ds.blockchain_ledger) == 1
+        assert ds.blockchain_ledger[0]['event_type'] == "EXFILTRATION_ATTEMPT"
+        for i in range(5):
+            ds.log_audit_event("ACCESS_GRANT", f"event {i}")
+        assert len(ds.blockchain_ledger) == 6
+        assert ds.verify_audit_chain()
+        ds.blockchain_ledger[2]['details'] = "tampered"
+        assert not ds.verify_audit_chain()
+
+
+def test_compliance_manager(cm):
+    """Test Compliance Checks"""
+    status = cm.run_compliance_check()
+    assert status["FedRAMP_High"]
+    assert status["ITAR"]
+    assert "COMPLIANCE AUDIT REPORT" in cm.generate_audit_report()
+
+
+class TestThreatProtection:
+    """Threat detection and response."""
+
+    def test_anomaly_detection(self, threat_protection):
         telemetry = {"cpu_usage": 95.0, "network_throughput": 500.0, "login_attempts": 20}
-        anomalies = self.tp.detect_anomalies(telemetry)
-        self.assertTrue(len(anomalies) > 0)
-        
-        # SIEM Correlation
+        anomalies = threat_protection.detect_anomalies(telemetry)
+        assert len(anomalies) > 0
+
+        # Batched anomaly detection matches the per-sample path
+        batch = np.array([[95.0, 500.0, 20.0], [10.0, 50.0, 1.0]])
+        mask = threat_protection.detect_anomalies_batch(batch)
+        assert int(mask[0].sum()) == len(anomalies)
+        assert not mask[1].any()
+
+    def test_siem_correlation(self, threat_protection):
+        events = [
+            {"type": "LOGIN_FAILURE", "timestamp": time.time()},
+            {"type": "HIGH_CPU", "timestamp": time.time()}
+        ]
+        assert len(threat_protection.correlate_events(events)) > 0
+
+    def test_edr_response(self, threat_protection):
         events = [
             {"type": "LOGIN_FAILURE", "timestamp": time.time()},
             {"type": "HIGH_CPU", "timestamp": time.time()}
         ]
-        threats = self.tp.correlate_events(events)
-        self.assertTrue(len(threats) > 0)
-        
-        # EDR
-        threat_id = threats[0]["id"]
-        self.tp.respond_to_threat(threat_id)
-        self.assertEqual(len(self.tp.active_threats), 0)
-
-if __name__ == '__main__':
-    unittest.main()
+        threats = threat_protection.correlate_events(events)
+        threat_protection.respond_to_threat(threats[0]["id"])
+        assert len(threat_protection.active_threats) == 0
@@ -1,9 +1,15 @@
 import os
 import sys
-from dotenv import load_dotenv
 
-def test_environment_variables():
+import pytest
+
+
+@pytest.fixture(scope="session")
+def dotenv_loaded():
+    from dotenv import load_dotenv
     load_dotenv()
+
+def test_environment_variables(dotenv_loaded):
     assert os.getenv('PODX_ENV') == 'development'
     assert os.getenv('XDOP_COMPLIANCE_LEVEL') == 'strict'
 
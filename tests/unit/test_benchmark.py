@@ -3,11 +3,6 @@ Unit tests for XdoP Benchmark Engine.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from benchmark.xdop_engine import XdoPBenchmarkEngine, ComplianceLevel
 from benchmark.wcbi_calculator import WCBICalculator
@@ -18,6 +13,13 @@ from benchmark.domain_benchmarks import (
 )
 
 
+@pytest.fixture(scope="module")
+def full_benchmark():
+    """One simulated full benchmark run, shared by tests that only read it."""
+    engine = XdoPBenchmarkEngine()
+    return engine, engine.run_full_benchmark(simulation_mode=True)
+
+
 class TestXdoPBenchmarkEngine:
     """Tests for XdoPBenchmarkEngine."""
     
@@ -29,24 +31,20 @@ class TestXdoPBenchmarkEngine:
         
     def test_domain_weights_sum_to_one(self):
         """Test that domain weights sum to 1.0."""
-        engine = XdoPBenchmarkEngine()
-        total = sum(engine.DOMAIN_WEIGHTS.values())
-        assert abs(total - 1.0) < 0.001
+        assert XdoPBenchmarkEngine.DOMAIN_WEIGHTS_SUM == pytest.approx(1.0, abs=1e-3)
     
-    def test_run_full_benchmark(self):
+    def test_run_full_benchmark(self, full_benchmark):
         """Test running full benchmark in simulation mode."""
-        engine = XdoPBenchmarkEngine()
-        result = engine.run_full_benchmark(simulation_mode=True)
+        _, result = full_benchmark
         
         assert result is not None
         assert result.wcbi_score >= 0
         assert result.wcbi_score <= 100
         assert len(result.domain_results) == 7
     
-    def test_benchmark_achieves_level_3(self):
+    def test_benchmark_achieves_level_3(self, full_benchmark):
         """Test that simulation achieves Level 3 compliance."""
-        engine = XdoPBenchmarkEngine()
-        result = engine.run_full_benchmark(simulation_mode=True)
+        _, result = full_benchmark
         
         assert result.wcbi_score >= 85
         assert result.compliance_level == ComplianceLevel.LEVEL_3_MISSION_CRITICAL
@@ -68,10 +66,9 @@ class TestXdoPBenchmarkEngine:
         with pytest.raises(ValueError):
             engine.run_domain_benchmark('invalid_domain')
     
-    def test_generate_report(self):
+    def test_generate_report(self, full_benchmark):
         """Test report generation."""
-        engine = XdoPBenchmarkEngine()
-        result = engine.run_full_benchmark(simulation_mode=True)
+        engine, result = full_benchmark
         report = engine.generate_report(result)
         
         assert "XDOP BENCHMARK REPORT" in report
@@ -0,0 +1,167 @@
+"""
+Unit tests for Monitoring module.
+"""
+
+import os
+import select
+
+import pytest
+
+from monitoring.metrics_collector import MetricRing
+from monitoring.sensor_reader import PreadSensorReader, parse_millidegrees
+from monitoring.system_monitor import SystemMonitor, SubsystemType, HealthStatus
+
+needs_epoll = pytest.mark.skipif(not hasattr(select, 'epoll'), reason="sensor fds need Linux epoll")
+
+
+@pytest.fixture
+def pipe_fds():
+    """A pipe whose read end always polls readable, like a sysfs attribute."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"42000\n")
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+@needs_epoll
+class TestSensorEvents:
+    """Tests for sensor fd driven collection."""
+    
+    def test_readable_fd_is_not_an_event(self, pipe_fds):
+        """Test an always-readable sensor fd does not re-trigger collection."""
+        monitor = SystemMonitor()
+        collected = []
+        monitor._collect_thermal_metrics = lambda: collected.append(1)
+        monitor.register_sensor_fd(pipe_fds[0], SubsystemType.THERMAL)
+        with monitor._lock:
+            monitor._open_poller()
+        
+        monitor._wait_for_sensor_events(0.1)
+        
+        assert collected == []
+        monitor.stop()
+    
+    def test_register_before_start_opens_nothing(self, pipe_fds):
+        """Test the epoll set and wakeup pipe wait for start()."""
+        monitor = SystemMonitor()
+        monitor.register_sensor_fd(pipe_fds[0], SubsystemType.THERMAL)
+        
+        assert monitor._epoll is None
+        assert monitor._wakeup_fds is None
+    
+    def test_stop_closes_wakeup_pipe(self, pipe_fds):
+        """Test stopping the monitor releases its wakeup pipe."""
+        monitor = SystemMonitor(poll_interval=0.05)
+        monitor.register_sensor_fd(pipe_fds[0], SubsystemType.THERMAL)
+        monitor.start()
+        wakeup_fds = monitor._wakeup_fds
+        
+        monitor.stop()
+        
+        assert monitor._wakeup_fds is None
+        for fd in wakeup_fds:
+            with pytest.raises(OSError):
+                os.fstat(fd)
+        assert pipe_fds[0] in monitor._sensor_fds
+
+
+class TestSensorReader:
+    """Tests for PreadSensorReader."""
+    
+    def test_read_batch_from_files(self, tmp_path):
+        """Test each fd is read from offset 0 on every poll."""
+        paths = [tmp_path / "temp1_input", tmp_path / "temp2_input"]
+        paths[0].write_bytes(b"42000\n")
+        paths[1].write_bytes(b"-5500\n")
+        fds = [os.open(path, os.O_RDONLY) for path in paths]
+        try:
+            reader = PreadSensorReader()
+            assert [parse_millidegrees(raw) for raw in reader.read_batch(fds)] == [42.0, -5.5]
+            
+            paths[0].write_bytes(b"43500\n")
+            assert reader.read_batch(fds) == [b"43500\n", b"-5500\n"]
+        finally:
+            for fd in fds:
+                os.close(fd)
+    
+    def test_unseekable_fd_reads_empty(self, pipe_fds):
+        """Test a failed read yields b"" instead of raising."""
+        assert PreadSensorReader().read_batch([pipe_fds[0]]) == [b""]
+
+
+class TestSubsystemMetrics:
+    """Tests for published subsystem metrics."""
+    
+    def test_metrics_are_snapshots(self):
+        """Test returned metrics do not change when new samples arrive."""
+        monitor = SystemMonitor()
+        monitor._collect_metrics()
+        metrics = monitor.get_subsystem_health(SubsystemType.COMPUTE).metrics
+        before = dict(metrics)
+        
+        monitor._collect_metrics()
+        
+        assert metrics == before
+        assert monitor.get_subsystem_health(SubsystemType.COMPUTE).metrics is not metrics
+    
+    def test_metrics_keep_types(self):
+        """Test integer metrics stay ints and static attributes are included."""
+        monitor = SystemMonitor()
+        monitor._collect_metrics()
+        
+        storage = monitor.get_subsystem_health(SubsystemType.STORAGE).metrics
+        assert type(storage['failed_drives']) is int
+        assert type(storage['read_iops']) is int
+        assert storage['raid_status'] == 'optimal'
+    
+    def test_live_metrics_follow_samples(self):
+        """Test the explicit live view tracks the newest sample."""
+        monitor = SystemMonitor()
+        live = monitor.get_live_metrics(SubsystemType.COMPUTE)
+        assert len(live) == 0
+        
+        monitor._collect_metrics()
+        assert live['cpu_utilization_pct'] == monitor.get_subsystem_health(
+            SubsystemType.COMPUTE).metrics['cpu_utilization_pct']
+        monitor._collect_metrics()
+        assert live['cpu_utilization_pct'] == monitor.get_subsystem_health(
+            SubsystemType.COMPUTE).metrics['cpu_utilization_pct']
+    
+    def test_health_reads_latest_sample(self):
+        """Test health evaluation follows the newest ring column."""
+        monitor = SystemMonitor()
+        assert monitor._evaluate_subsystem_health(SubsystemType.STORAGE) == HealthStatus.UNKNOWN
+        
+        monitor._collect_storage_metrics()
+        ring = monitor._rings[SubsystemType.STORAGE]
+        values = [ring.latest(name) for name in ring.names]
+        values[ring.index('failed_drives')] = 2
+        monitor._publish(SubsystemType.STORAGE, values)
+        
+        monitor._evaluate_health()
+        assert monitor.get_subsystem_health(SubsystemType.STORAGE).status == HealthStatus.CRITICAL
+
+
+class TestMetricRing:
+    """Tests for the metric ring buffer."""
+    
+    def test_series_before_and_after_wrap(self):
+        """Test series returns retained samples oldest first across the wrap."""
+        ring = MetricRing(('a', 'b'), capacity=3)
+        assert ring.series('a').tolist() == []
+        assert ring.latest_column() is None
+        
+        for i in range(2):
+            ring.append((i, 10 * i))
+        assert ring.series('a').tolist() == [0, 1]
+        
+        for i in range(2, 5):
+            ring.append((i, 10 * i))
+        assert ring.series('a').tolist() == [2, 3, 4]
+        assert ring.series('b').tolist() == [20, 30, 40]
+        assert ring.latest_column().tolist() == [4, 40]
+        assert ring.current() == {'a': 4, 'b': 40}
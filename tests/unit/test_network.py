@@ -2,15 +2,18 @@
 Unit tests for Network module.
 """
 
+import asyncio
+import gc
 import pytest
-import sys
-import os
+import time
+import types
+from datetime import datetime
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
-from network.ddil_controller import DDILController, NetworkMode, ConnectionState
-from network.handover_manager import HandoverManager, HandoverStrategy
-from network.cache_manager import CacheManager, CachePriority
+from network import ddil_controller
+from network.ddil_controller import DDILController, NetworkMode, ConnectionState, PathMetricsRing
+from network.handover_manager import HandoverManager, HandoverMetrics, HandoverStrategy
+from network.connectivity_manager import ConnectivityManager, ConnectivityType
+from network.cache_manager import CacheManager, CachePriority, compute_checksum
 
 
 class TestDDILController:
@@ -57,6 +60,120 @@ class TestDDILController:
         assert metrics is not None
         assert 'mode' in metrics
         assert 'latency_ms' in metrics
+    
+    def test_path_metrics_track_updates(self):
+        """Test cached path metrics are isolated per caller and track updates."""
+        controller = DDILController()
+        first = controller.get_path_metrics(NetworkMode.SATELLITE)
+        first['enabled'] = 'tampered'
+        assert controller.get_path_metrics(NetworkMode.SATELLITE)['enabled'] is True
+        
+        controller.disable_path(NetworkMode.SATELLITE)
+        updated = controller.get_path_metrics(NetworkMode.SATELLITE)
+        assert updated['enabled'] is False
+    
+    def test_published_paths_never_change(self):
+        """Test a path held by a reader is not modified by later updates."""
+        controller = DDILController()
+        held = controller.paths[NetworkMode.SATELLITE]
+        version = held.version
+        
+        controller._update_path_status()
+        controller._update_path_status()
+        controller.disable_path(NetworkMode.SATELLITE)
+        
+        assert held.version == version
+        assert held.enabled is True
+        assert controller.paths[NetworkMode.SATELLITE].enabled is False
+    
+    @pytest.fixture
+    def pinned(self, monkeypatch):
+        """
+        Controller on a fake monotonic clock whose paths all refresh every
+        second and report states from the returned dict, not simulation.
+        """
+        clock = [1000.0]
+        fake_time = types.SimpleNamespace(
+            monotonic=lambda: clock[0],
+            monotonic_ns=lambda: int(clock[0] * 1e9),
+        )
+        monkeypatch.setattr(ddil_controller, "time", fake_time)
+        monkeypatch.setattr(DDILController, "POLL_INTERVALS", {})
+        
+        controller = DDILController()
+        states = {mode: ConnectionState.CONNECTED for mode in controller.paths}
+        codes = list(ConnectionState)
+        
+        def simulate(idx):
+            for i in idx:
+                controller._state[i] = codes.index(states[ddil_controller._MODES[i]])
+        
+        monkeypatch.setattr(controller, "_simulate_paths_vectorized", simulate)
+        
+        def tick(seconds=1.0):
+            clock[0] += seconds
+            controller._tick()
+        
+        controller._tick()
+        return controller, states, tick
+    
+    def test_forced_path_is_kept(self, pinned):
+        """Test a forced path is kept while usable and left once lost."""
+        controller, states, tick = pinned
+        assert controller.active_mode == NetworkMode.WIRED
+        
+        controller.force_handover(NetworkMode.SATELLITE)
+        tick(controller.MIN_DWELL_S * 2)
+        assert controller.active_mode == NetworkMode.SATELLITE
+        
+        states[NetworkMode.SATELLITE] = ConnectionState.DEGRADED
+        tick(controller.MIN_DWELL_S * 2)
+        assert controller.active_mode == NetworkMode.SATELLITE
+        
+        states[NetworkMode.SATELLITE] = ConnectionState.FAILING
+        tick()
+        assert controller.active_mode == NetworkMode.WIRED
+    
+    def test_handover_churn_suppressed(self, pinned):
+        """Test healthy paths are kept and degraded ones wait out the dwell."""
+        controller, states, tick = pinned
+        handovers = []
+        controller.register_callback('handover', lambda old, new, ms: handovers.append(new))
+        
+        states[NetworkMode.WIRED] = ConnectionState.FAILING
+        tick()
+        assert handovers == [NetworkMode.CELLULAR_5G]
+        
+        # WIRED recovers: the healthy active path is not swapped for it
+        states[NetworkMode.WIRED] = ConnectionState.CONNECTED
+        tick()
+        assert controller.active_mode == NetworkMode.CELLULAR_5G
+        
+        # The active path degrades inside the dwell: held until it elapses
+        states[NetworkMode.CELLULAR_5G] = ConnectionState.DEGRADED
+        tick()
+        assert controller.active_mode == NetworkMode.CELLULAR_5G
+        tick(controller.MIN_DWELL_S)
+        assert handovers == [NetworkMode.CELLULAR_5G, NetworkMode.WIRED]
+        
+        for _ in range(5):
+            tick()
+        assert len(handovers) == 2
+    
+    def test_path_feed_backpressure(self):
+        """Test the metric feed returns the latest snapshot and signals lag."""
+        controller = DDILController()
+        lagging = []
+        controller.register_callback('backpressure', lambda mode, lag: lagging.append(mode))
+        
+        assert controller.read_path_feed(NetworkMode.SATELLITE) is None
+        controller._update_path_status()
+        snapshot = controller.read_path_feed(NetworkMode.SATELLITE)
+        assert snapshot['state'] == controller.paths[NetworkMode.SATELLITE].state.value
+        
+        for _ in range(PathMetricsRing.DEFAULT_DEPTH + 1):
+            controller._update_path_status()
+        assert NetworkMode.SATELLITE in lagging
 
 
 class TestHandoverManager:
@@ -77,6 +194,30 @@ class TestHandoverManager:
         assert metrics.success is True
         assert metrics.duration_ms < 200  # Should be under target
     
+    def test_metrics_datetime_constructor(self):
+        """Test HandoverMetrics is still built from start/end datetimes."""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        end = datetime(2024, 1, 1, 12, 0, 1)
+        metrics = HandoverMetrics(
+            source_path="a", target_path="b", strategy=HandoverStrategy.SEAMLESS,
+            start_time=start, end_time=end, duration_ms=80.0, packets_lost=0, success=True,
+        )
+        
+        assert metrics.start_time == start
+        assert metrics.end_time == end
+        
+        recorded = HandoverManager().execute_handover("a", "b")
+        assert recorded.start_time <= recorded.end_time
+    
+    def test_execute_handover_inside_event_loop(self):
+        """Test the sync API still works when called from a running loop."""
+        manager = HandoverManager()
+        
+        async def run():
+            return manager.execute_handover("satellite", "cellular_5g")
+        
+        assert asyncio.run(run()).success is True
+    
     def test_handover_statistics(self):
         """Test getting handover statistics."""
         manager = HandoverManager()
@@ -90,6 +231,84 @@ class TestHandoverManager:
         assert stats['total_handovers'] == 2
         assert stats['successful'] == 2
     
+    def test_concurrent_handovers(self):
+        """Test handovers driven together overlap instead of queueing."""
+        manager = HandoverManager()
+        transitions = [("wan0", "wan1"), ("wan1", "wan2"), ("wan2", "wan3"), ("wan3", "wan0")]
+        
+        start = time.perf_counter()
+        results = asyncio.run(manager.execute_handovers_async(transitions))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        
+        assert [m.success for m in results] == [True] * 4
+        assert elapsed_ms < 2 * manager.TARGET_HANDOVER_MS
+        assert manager.get_statistics()['total_handovers'] == 4
+    
+    def test_statistics_window(self):
+        """Test statistics cover only the retained handover window."""
+        manager = HandoverManager(history_size=2)
+        
+        manager.execute_handover("a", "b", HandoverStrategy.BREAK_BEFORE_MAKE)
+        manager.execute_handover("b", "c")
+        manager.execute_handover("c", "d")
+        
+        stats = manager.get_statistics()
+        durations = [h.duration_ms for h in manager.handover_history]
+        
+        assert stats['total_handovers'] == 2
+        assert stats['total_packets_lost'] == 0  # Lossy handover evicted
+        assert stats['min_duration_ms'] == min(durations)
+        assert stats['max_duration_ms'] == max(durations)
+        assert stats['lifetime_handovers'] == 3
+        assert stats['lifetime_packets_lost'] == 2
+    
+    def test_history_size_must_be_positive(self):
+        """Test an empty statistics window is rejected up front."""
+        with pytest.raises(ValueError):
+            HandoverManager(history_size=0)
+        
+        manager = HandoverManager(history_size=1)
+        manager.execute_handover("a", "b")
+        manager.execute_handover("b", "c")
+        assert manager.get_statistics()['total_handovers'] == 1
+    
+    def test_callbacks_dispatched(self):
+        """Test handover callbacks are delivered off the caller's thread."""
+        manager = HandoverManager()
+        received = []
+        manager.register_callback(received.append)
+        
+        metrics = manager.execute_handover("a", "b")
+        
+        assert manager.wait_for_callbacks(timeout=5)
+        assert received == [metrics]
+        manager.close(timeout=5)
+    
+    def test_close_stops_dispatcher(self):
+        """Test close() delivers pending callbacks and ends the thread."""
+        manager = HandoverManager()
+        received = []
+        manager.register_callback(received.append)
+        thread = manager._cb_thread
+        
+        manager.execute_handover("a", "b")
+        manager.close(timeout=5)
+        
+        assert not thread.is_alive()
+        assert len(received) == 1
+    
+    def test_unclosed_manager_is_collected(self):
+        """Test the dispatcher does not keep an unclosed manager alive."""
+        manager = HandoverManager()
+        manager.register_callback(lambda metrics: None)
+        thread = manager._cb_thread
+        
+        del manager
+        gc.collect()
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+    
     def test_meets_target_latency(self):
         """Test target latency check."""
         manager = HandoverManager()
@@ -98,6 +317,40 @@ class TestHandoverManager:
         assert manager.meets_target_latency() is True
 
 
+class TestConnectivityManager:
+    """Tests for Connectivity Manager."""
+    
+    def test_status_cached_within_ttl(self):
+        """Test polling helpers reuse status within the TTL."""
+        manager = ConnectivityManager(status_ttl_ms=60000)
+        
+        first = manager.get_all_status()
+        second = manager.get_all_status()
+        assert first[ConnectivityType.STARLINK] is second[ConnectivityType.STARLINK]
+        
+        # Direct calls without a TTL always fetch fresh status
+        status = manager.get_connection_status(ConnectivityType.STARLINK)
+        assert status is not first[ConnectivityType.STARLINK]
+    
+    def test_status_cache_invalidated_on_config_change(self):
+        """Test enabling/disabling a connection drops its cached status."""
+        manager = ConnectivityManager(status_ttl_ms=60000)
+        
+        before = manager.get_all_status()[ConnectivityType.STARLINK]
+        manager.disable_connection(ConnectivityType.STARLINK)
+        after = manager.get_all_status()[ConnectivityType.STARLINK]
+        
+        assert after is not before
+    
+    def test_get_best_connection(self):
+        """Test best connection prefers highest priority."""
+        manager = ConnectivityManager()
+        assert manager.get_best_connection() == ConnectivityType.ETHERNET
+        
+        manager.disable_connection(ConnectivityType.ETHERNET)
+        assert manager.get_best_connection() != ConnectivityType.ETHERNET
+
+
 class TestCacheManager:
     """Tests for Cache Manager."""
     
@@ -141,6 +394,58 @@ class TestCacheManager:
         assert stats.entry_count == 1
         assert stats.hit_rate_pct > 0
     
+    def test_bulk_put_and_get(self):
+        """Test batched puts and gets match the single-entry API."""
+        manager = CacheManager()
+        assert manager.put_many([("key1", 1024, "test"), ("key2", 2048, "test")]) == 2
+        
+        entries = manager.get_many(["key1", "missing", "key2"])
+        assert [e.key if e else None for e in entries] == ["key1", None, "key2"]
+        
+        stats = manager.get_statistics()
+        assert stats.entry_count == 2
+        assert stats.hit_rate_pct == pytest.approx(200 / 3)
+    
+    def test_eviction_order(self):
+        """Test lowest priority, least recently accessed entries evict first."""
+        manager = CacheManager(capacity_tb=3000 / (1024 ** 4))
+        manager.put("critical", 1000, "test", priority=CachePriority.CRITICAL)
+        manager.put("old", 1000, "test", priority=CachePriority.NORMAL)
+        manager.put("new", 1000, "test", priority=CachePriority.NORMAL)
+        manager.get("old")  # Refresh access time
+        
+        assert manager.put("high", 1000, "test", priority=CachePriority.HIGH) is True
+        assert manager.get("new") is None
+        assert manager.get("old") is not None
+        assert manager.get("critical") is not None
+        
+        # Critical entries are never evicted
+        assert manager.put("huge", 3000, "test") is False
+        assert manager.get("critical") is not None
+    
+    def test_checksum_verification(self):
+        """Test CRC32C checksums are stored and verified."""
+        assert compute_checksum(b"123456789") == bytes.fromhex("e3069283")
+        
+        manager = CacheManager()
+        data = b"mission data"
+        manager.put("key1", len(data), "test", checksum=compute_checksum(data))
+        
+        assert manager.verify("key1", data) is True
+        assert manager.verify("key1", b"corrupted") is False
+        assert manager.verify("missing", data) is False
+    
+    def test_legacy_string_checksums(self):
+        """Test hex CRC32C strings are converted and other strings kept opaque."""
+        manager = CacheManager()
+        data = b"mission data"
+        manager.put("hex", len(data), "test", checksum=compute_checksum(data).hex())
+        manager.put("sha", len(data), "test", checksum="sha256:deadbeef")
+        
+        assert manager.verify("hex", data) is True
+        assert manager.get("sha").checksum == "sha256:deadbeef"
+        assert manager.verify("sha", data) is False
+    
     def test_ddil_readiness(self):
         """Test DDIL readiness check."""
         manager = CacheManager()
@@ -0,0 +1,142 @@
+"""
+Unit tests for Reliability module.
+"""
+
+import gc
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from reliability.hot_swap_manager import HotSwapManager, ModuleState
+from reliability.predictive_maintenance import PredictiveMaintenance
+from reliability.software_resilience import ResilienceLayer
+
+
+@pytest.fixture
+def hsm():
+    manager = HotSwapManager()
+    manager.register_module("GPU-1", "gpu")
+    manager.register_module("GPU-2", "gpu")
+    manager.assign_workload("GPU-1", {"id": "nav", "priority": "critical"})
+    manager.assign_workload("GPU-1", {"id": "video", "priority": "low"})
+    manager.assign_workload("GPU-1", {"id": "logs"})
+    return manager
+
+
+class TestHotSwap:
+    """Tests for HotSwapManager."""
+    
+    def test_degraded_module_sheds_non_critical_load(self, hsm):
+        """Test entering DEGRADED sheds non-critical work without a flush."""
+        hsm.update_health("GPU-1", 40)
+        
+        assert hsm.modules["GPU-1"].state == ModuleState.DEGRADED
+        assert [w["id"] for w in hsm.workloads["GPU-1"]] == ["nav"]
+        assert [w["id"] for w in hsm.workloads["GPU-2"]] == ["video", "logs"]
+    
+    def test_repeated_degraded_readings_are_debounced(self, hsm):
+        """Test later readings while degraded only re-shed on flush."""
+        hsm.update_health("GPU-1", 40)
+        hsm.assign_workload("GPU-1", {"id": "telemetry"})
+        hsm.update_health("GPU-1", 35)
+        hsm.update_health("GPU-1", 30)
+        
+        assert [w["id"] for w in hsm.workloads["GPU-1"]] == ["nav", "telemetry"]
+        hsm.flush()
+        assert [w["id"] for w in hsm.workloads["GPU-1"]] == ["nav"]
+    
+    def test_failed_module_is_evacuated(self, hsm):
+        """Test a failed module hands all of its work to a healthy module."""
+        hsm.update_health("GPU-1", 0)
+        
+        assert hsm.modules["GPU-1"].state == ModuleState.FAILED
+        assert hsm.workloads["GPU-1"] == []
+        assert len(hsm.workloads["GPU-2"]) == 3
+
+
+class TestWatchdog:
+    """Tests for the ResilienceLayer watchdog thread."""
+    
+    def test_no_thread_until_armed(self):
+        """Test the watchdog starts on the first feed and stops cleanly."""
+        layer = ResilienceLayer()
+        assert layer._watchdog_thread is None
+        
+        layer.feed_watchdog()
+        thread = layer._watchdog_thread
+        assert thread.is_alive()
+        
+        layer.stop_watchdog()
+        assert not thread.is_alive()
+        assert layer._watchdog_thread is None
+    
+    def test_timeout_is_flagged(self):
+        """Test a missed feed trips the watchdog."""
+        layer = ResilienceLayer()
+        layer.watchdog_timeout_seconds = 0.01
+        with layer:
+            time.sleep(0.2)
+            
+            assert layer.check_watchdog() is False
+            layer.feed_watchdog()
+            assert layer.check_watchdog() is True
+    
+    def test_abandoned_layer_is_collected(self):
+        """Test the thread does not keep an unstopped layer alive."""
+        layer = ResilienceLayer()
+        layer.start_watchdog()
+        thread = layer._watchdog_thread
+        
+        del layer
+        gc.collect()
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+
+
+class TestPredictiveMaintenance:
+    """Tests for PredictiveMaintenance."""
+    
+    def test_ingest_batch_scores_and_schedules(self):
+        """Test batch ingest scores every sample and schedules anomalies."""
+        pm = PredictiveMaintenance()
+        scores = pm.ingest_batch("fan-1", [20.0, 90.0, 90.0], [1.0, 1.0, 9.0])
+        
+        np.testing.assert_allclose(scores, [0.0, 0.5, 0.9])
+        assert [t["component_id"] for t in pm.get_maintenance_schedule()] == ["fan-1"]
+        assert len(pm.telemetry["fan-1"]) == 3
+    
+    def test_pop_due(self):
+        """Test pop_due returns only tasks at or before the cutoff."""
+        pm = PredictiveMaintenance()
+        pm.ingest_telemetry("psu-1", {"temperature": 85.0, "vibration": 6.0})
+        
+        assert pm.pop_due() == []
+        due = pm.pop_due(datetime.now() + timedelta(hours=25))
+        assert [t["component_id"] for t in due] == ["psu-1"]
+        assert pm.get_maintenance_schedule() == []
+    
+    def test_legacy_views(self):
+        """Test telemetry_history and maintenance_schedule keep their old shapes."""
+        pm = PredictiveMaintenance()
+        pm.ingest_telemetry("psu-1", {"temperature": 85.0, "vibration": 6.0})
+        pm.ingest_telemetry("psu-1", {"temperature": 40.0})
+        
+        history = pm.telemetry_history
+        assert [p["metrics"] for p in history] == [
+            {"temperature": 85.0, "vibration": 6.0},
+            {"temperature": 40.0},
+        ]
+        assert {p["component_id"] for p in history} == {"psu-1"}
+        assert isinstance(history[0]["timestamp"], datetime)
+        assert pm.maintenance_schedule == pm.get_maintenance_schedule()
+    
+    def test_non_numeric_metric_rejected(self):
+        """Test non-numeric readings fail with a clear error and are not stored."""
+        pm = PredictiveMaintenance()
+        with pytest.raises(TypeError, match="'status'"):
+            pm.ingest_telemetry("psu-1", {"temperature": 40.0, "status": "ok"})
+        
+        assert pm.telemetry_history == []
@@ -0,0 +1,85 @@
+"""
+Unit tests for Storage module.
+"""
+
+import dataclasses
+
+import pytest
+
+from storage.raid_controller import RAIDController
+from storage.storage_manager import StorageManager, DriveStatus
+
+
+@pytest.fixture
+def manager():
+    return StorageManager(seed=0)
+
+
+class TestDriveState:
+    """Tests for drive state held by StorageManager."""
+    
+    def test_drive_snapshots_are_read_only(self, manager):
+        drive = manager.get_drive_status("NVMe-00")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            drive.status = DriveStatus.FAILED
+        assert manager.get_health_report()['drives']['failed'] == 0
+    
+    def test_status_writes_reach_report(self, manager):
+        assert manager.set_drive_status("NVMe-03", DriveStatus.DEGRADED)
+        assert not manager.set_drive_status("NVMe-99", DriveStatus.FAILED)
+        
+        assert manager.get_drive_status("NVMe-03").status == DriveStatus.DEGRADED
+        report = manager.get_health_report()
+        assert report['drives']['degraded'] == 1
+        assert report['raid']['degraded_drives'] == 1
+        assert manager.get_stats().drives_healthy == manager.DRIVE_COUNT - 1
+    
+    def test_telemetry_writes_reach_report(self, manager):
+        for drive in manager.get_all_drives():
+            assert manager.update_drive_telemetry(drive.id, temperature_c=40.0, health_pct=90.0)
+        assert not manager.update_drive_telemetry("NVMe-99", temperature_c=40.0)
+        
+        health = manager.get_health_report()['health']
+        assert health['average_temperature_c'] == pytest.approx(40.0)
+        assert health['average_health_pct'] == pytest.approx(90.0)
+        assert manager.get_drive_status("NVMe-00").temperature_c == 40.0
+    
+    def test_drive_failure_rebuilds_on_spare(self, manager):
+        spares = [d.id for d in manager.get_all_drives() if d.status == DriveStatus.SPARE]
+        
+        assert manager.simulate_drive_failure("NVMe-00")
+        assert not manager.simulate_drive_failure("NVMe-99")
+        
+        assert manager.get_drive_status("NVMe-00").status == DriveStatus.FAILED
+        assert manager.get_drive_status(spares[0]).status == DriveStatus.REBUILDING
+        raid = manager.check_raid_health()
+        assert raid['failed_drives'] == 1
+        assert raid['rebuilding_drives'] == 1
+    
+    def test_seeded_drives_are_reproducible(self):
+        assert StorageManager(seed=7).get_all_drives() == StorageManager(seed=7).get_all_drives()
+
+
+class TestRAIDController:
+    """Tests for RAIDController."""
+    
+    def test_rebuild_status_is_isolated_per_caller(self):
+        raid = RAIDController()
+        assert raid.start_rebuild('primary', "NVMe-00", "NVMe-22")
+        
+        status = raid.get_rebuild_status()
+        status['progress_pct'] = 99.0
+        assert raid.get_rebuild_status()['progress_pct'] == 0.0
+        assert raid.get_rebuild_status('missing') is None
+    
+    def test_drive_lists_follow_rebuild(self):
+        raid = RAIDController()
+        array = raid.get_array_status()
+        assert isinstance(array.drives, list)
+        assert array.spare_drives == ["NVMe-22", "NVMe-23"]
+        
+        assert raid.start_rebuild('primary', "NVMe-00", "NVMe-22")
+        assert "NVMe-00" not in array.drives
+        assert array.drives[-1] == "NVMe-22"
+        assert array.spare_drives == ["NVMe-23"]
+        assert raid.check_redundancy()['spare_drives_available'] == 1
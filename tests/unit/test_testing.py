@@ -0,0 +1,52 @@
+"""
+Unit tests for Testing module.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from testing.mil_std_testing import MilStd810H
+
+
+AMBIENTS = np.array([-40.0, 0.0, 25.0, 60.0])
+
+
+@pytest.fixture(scope="module")
+def tester():
+    return MilStd810H()
+
+
+def scan_steady_state(ctx, ambient, max_temp_c=150.0, step_c=0.001):
+    """First temperature on a fine grid where dissipation covers the load."""
+    grid = np.arange(ambient, max_temp_c, step_c)
+    fan_rpm = ctx.controller.calculate_cooling_demand_batch(grid)
+    dissipated = ctx.radiator.calculate_heat_dissipation_batch(
+        grid - ctx.power_w * ctx.r_pipes, np.full_like(grid, ambient), fan_rpm
+    )
+    hits = np.flatnonzero(dissipated >= ctx.power_w)
+    return grid[hits[0]] if len(hits) else np.nan
+
+
+class TestMilStd810H:
+    """Tests for MIL-STD-810H qualification."""
+    
+    @pytest.mark.parametrize("power_w", [500.0, 2000.0])
+    def test_steady_state_matches_scan(self, tester, power_w):
+        ctx = SimpleNamespace(**{**vars(tester._qualification_context()), 'power_w': power_w})
+        
+        solved = tester._solve_steady_state(ctx, AMBIENTS)
+        expected = np.array([scan_steady_state(ctx, a) for a in AMBIENTS])
+        
+        np.testing.assert_array_equal(np.isnan(solved), np.isnan(expected))
+        np.testing.assert_allclose(solved, expected, atol=0.01)
+    
+    def test_no_steady_state_fails_501_7(self, tester):
+        ctx = SimpleNamespace(**{**vars(tester._qualification_context()), 'power_w': 2000.0})
+        
+        tester.run_method_501_7_temperature(ctx)
+        
+        result = tester.results["501.7"]
+        assert result["passed"] is False
+        assert "FAILURE: No steady state below 150C at ambient 60C" in result["log"]